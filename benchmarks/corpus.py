@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Passage corpus benchmark.
+Writes a synthetic corpus of multi-paragraph passages and compares loading
+it whole (read and split into a list) with PassageCorpus: building the
+index, reopening with the index on disk, and picking random passages.
+
+Usage:
+    python benchmarks/corpus.py [megabytes]
+"""
+
+import sys
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.corpus import PassageCorpus
+
+
+WORDS = ("the class library teacher student bell lunch quiet window garden river "
+         "museum science history music paper pencil lesson morning afternoon").split()
+
+
+def write_synthetic(path, megabytes, seed=0):
+    """Write passages of 2-4 paragraphs until the file reaches the given size."""
+    rng = random.Random(seed)
+    target = megabytes * 1_000_000
+    with open(path, 'w') as f:
+        while f.tell() < target:
+            paragraphs = (' '.join(rng.choices(WORDS, k=rng.randint(30, 60))).capitalize() + '.'
+                          for _ in range(rng.randint(2, 4)))
+            f.write('\n\n'.join(paragraphs) + '\n%\n')
+
+
+def legacy_load(path):
+    """Read the whole corpus into a list of passages."""
+    with open(path, 'r') as f:
+        return [passage.strip() for passage in f.read().split('\n%\n') if passage.strip()]
+
+
+def measure(func, *args, before=None):
+    """Run func untraced for time, then traced for peak memory."""
+    if before:
+        before()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    del result
+
+    if before:
+        before()
+    tracemalloc.start()
+    result = func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    """Run the benchmark."""
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'passages.txt')
+        index = os.path.join(tmp, 'passages.txt.index')
+        write_synthetic(path, megabytes)
+        print(f"Synthetic corpus: {os.path.getsize(path) / 1e6:.1f} MB\n")
+        print(f"{'loader':<28}{'time (s)':>10}{'peak (MB)':>12}{'passages':>12}")
+
+        passages, elapsed, peak = measure(legacy_load, path)
+        print(f"{'whole file in a list':<28}{elapsed:>10.3f}{peak / 1e6:>12.1f}{len(passages):>12,}")
+        del passages
+
+        def remove_index():
+            if os.path.exists(index):
+                os.remove(index)
+
+        corpus, elapsed, peak = measure(PassageCorpus.open, path, index, before=remove_index)
+        print(f"{'mmap, build index':<28}{elapsed:>10.3f}{peak / 1e6:>12.1f}{len(corpus):>12,}")
+        corpus, elapsed, peak = measure(PassageCorpus.open, path, index)
+        print(f"{'mmap, index on disk':<28}{elapsed:>10.3f}{peak / 1e6:>12.1f}{len(corpus):>12,}")
+
+        rng = random.Random(1)
+        picks = 10000
+        start = time.perf_counter()
+        for _ in range(picks):
+            corpus.random_passage(rng)
+        elapsed = (time.perf_counter() - start) / picks
+        print(f"\nRandom passage: {elapsed * 1e6:.1f} µs")
+        corpus.close()
+
+
+if __name__ == "__main__":
+    main()
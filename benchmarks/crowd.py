@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Hallway crowd benchmark.
+Fills a generated multi-floor school with students, then times the fixed
+60 Hz tick while they walk to class, through a period change (everyone
+leaves one room for the next), and proximity queries through the spatial
+hash against scanning every student.
+
+Usage:
+    python benchmarks/crowd.py [students] [size] [floors]
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.crowd import TICK, TICK_RATE
+from utils.hallway import Hallway
+from utils.time_system import TimeSystem
+
+
+def run_ticks(crowd, seconds):
+    """Run seconds worth of ticks; return (mean, worst) seconds per tick."""
+    times = []
+    for _ in range(int(seconds * TICK_RATE)):
+        start = time.perf_counter()
+        crowd.tick()
+        times.append(time.perf_counter() - start)
+    return sum(times) / len(times), max(times)
+
+
+def report(label, crowd, seconds):
+    """Run ticks and print their cost against the tick budget."""
+    mean, worst = run_ticks(crowd, seconds)
+    print(f"{label:<30}{mean * 1e3:>9.3f} ms{worst * 1e3:>9.3f} ms{mean / TICK:>9.1%}"
+          f"{crowd.inside():>10,}")
+
+
+def main():
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    floors = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+
+    hallway = Hallway.generate(seed=0, width=size, height=size // 2, floors=floors)
+    time_system = TimeSystem()
+    start = time.perf_counter()
+    crowd = hallway.add_crowd(count, seed=0, time_system=time_system)
+    print(f"Map: {size}x{size // 2}, {floors} floors; {len(crowd.students):,} students "
+          f"(placed in {time.perf_counter() - start:.2f} s)\n")
+
+    # Neighbours within 3 cells of every student on the map
+    walking = [student for student in crowd.students if student.index is not None]
+    stride = crowd.grid.stride
+    start = time.perf_counter()
+    for student in walking:
+        crowd.hash.near(student.index, 3)
+    hashed = (time.perf_counter() - start) / len(walking)
+
+    def linear_near(index, radius):
+        row, column = divmod(index, stride)
+        return [other for other in crowd.students if other.index is not None and other.index != index
+                and abs(other.index // stride - row) <= radius and abs(other.index % stride - column) <= radius]
+
+    start = time.perf_counter()
+    for student in walking:
+        linear_near(student.index, 3)
+    scanned = (time.perf_counter() - start) / len(walking)
+    print(f"Proximity query ({len(walking):,} walking): spatial hash {hashed * 1e6:.1f} µs, "
+          f"scan of every student {scanned * 1e6:.1f} µs\n")
+
+    print(f"{'phase':<30}{'mean tick':>12}{'worst':>12}{'budget':>9}{'inside':>10}")
+    report("walking to class (20 s)", crowd, 20)
+    report("in class (20 s)", crowd, 20)
+    time_system.advance_period()
+    report("period change (20 s)", crowd, 20)
+    report("settling (40 s)", crowd, 40)
+
+
+if __name__ == "__main__":
+    main()
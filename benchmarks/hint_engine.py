@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Hint engine benchmark.
+Builds the full guess-by-answer feedback matrix for the word list with
+get_word_hints, with the scalar feedback_code, and with the batched
+HintEngine, and checks that all three agree.
+
+Usage:
+    python benchmarks/hint_engine.py [words]
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.wordlist import get_word_index, get_word_hints
+from utils.hint_engine import feedback_code, feedback_matrix, encode_hints
+
+
+def main():
+    """Run the benchmark."""
+    words = list(get_word_index().by_length(5))
+    if len(sys.argv) > 1:
+        words = words[:int(sys.argv[1])]
+    pairs = len(words) ** 2
+    
+    start = time.perf_counter()
+    reference = [encode_hints(get_word_hints(answer, guess)) for guess in words for answer in words]
+    hints_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    scalar = [feedback_code(guess, answer) for guess in words for answer in words]
+    scalar_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    matrix = feedback_matrix(words)
+    batched_time = time.perf_counter() - start
+    
+    assert reference == scalar == list(matrix.codes), "Scoring methods disagree"
+    
+    print(f"Feedback matrix: {len(words)} x {len(words)} = {pairs:,} pairs\n")
+    for name, elapsed in (("get_word_hints", hints_time), ("feedback_code", scalar_time),
+                          ("HintEngine", batched_time)):
+        print(f"{name:<16}{elapsed * 1000:>10.1f} ms{pairs / elapsed:>14,.0f} pairs/s"
+              f"{hints_time / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
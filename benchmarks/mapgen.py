@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Map generator benchmark.
+Generates a multi-floor school map from a seed, then times the
+reachability check on its own and building the pathfinding grid.
+
+Usage:
+    python benchmarks/mapgen.py [size] [floors] [seed]
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.mapgen import generate_school
+
+
+def main():
+    """Run the benchmark."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    floors = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    start = time.perf_counter()
+    school = generate_school(size, size, floors, seed)
+    generated = time.perf_counter() - start
+    cells = size * size * floors
+    print(f"Map: {size}x{size}, {floors} floors, {cells:,} cells, "
+          f"{sum(map(len, school.floors)):,} bytes, {len(school.stairs)} stairwells\n")
+
+    start = time.perf_counter()
+    unreachable = school.unreachable_rooms()
+    validated = time.perf_counter() - start
+
+    start = time.perf_counter()
+    school.grid()
+    gridded = time.perf_counter() - start
+
+    print(f"{'generate (validation included)':<34}{generated:>8.3f} s")
+    print(f"{'reachability check alone':<34}{validated:>8.3f} s  ({len(unreachable)} unreachable)")
+    print(f"{'pathfinding grid':<34}{gridded:>8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Pathfinding benchmark.
+Builds a large random map (scattered walls plus rooms), precomputes the
+room distance table, then times room-to-room distance and path queries
+against point-to-point BFS and A* searches.
+
+Usage:
+    python benchmarks/pathfinding.py [size] [rooms]
+"""
+
+import sys
+import os
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pathfinding import Grid, RoomDistances, bfs_path, astar_path
+
+
+def random_map(size, rooms, seed=0, walls=0.2):
+    """Build a size x size grid with scattered walls and single-cell rooms."""
+    rng = random.Random(seed)
+    walkable = bytearray(1 if rng.random() >= walls else 0 for _ in range(size * size))
+    cells = {}
+    for number in range(rooms):
+        x, y = rng.randrange(size), rng.randrange(size)
+        walkable[y * size + x] = 1
+        cells[f"Room {number + 1}"] = [(x, y)]
+    return Grid(size, size, walkable), cells
+
+
+def per_call(func, *args, runs=1):
+    """Average seconds per call."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        func(*args)
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    """Run the benchmark."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rooms = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+
+    start = time.perf_counter()
+    grid, cells = random_map(size, rooms)
+    print(f"Map: {size}x{size}, {rooms} rooms (built in {time.perf_counter() - start:.2f} s)")
+
+    start = time.perf_counter()
+    table = RoomDistances(grid, cells)
+    print(f"Precompute (one BFS per room): {time.perf_counter() - start:.2f} s\n")
+
+    names = list(cells)
+    pairs = [(a, b) for a in names for b in names if a != b]
+    first, last = names[0], names[-1]
+    start_cell, goal_cell = cells[first][0], cells[last][0]
+
+    distance = per_call(lambda: [table.distance(a, b) for a, b in pairs], runs=1000) / len(pairs)
+    print(f"{'room distance (table)':<32}{distance * 1e6:>10.2f} µs")
+    uncached = per_call(table.room_path, first, last)
+    print(f"{'room path, first query':<32}{uncached * 1e3:>10.2f} ms  ({table.distance(first, last)} steps)")
+    cached = per_call(table.room_path, first, last, runs=10000)
+    print(f"{'room path, cached':<32}{cached * 1e6:>10.2f} µs")
+    print(f"{'BFS point to point':<32}{per_call(bfs_path, grid, start_cell, goal_cell) * 1e3:>10.2f} ms")
+    print(f"{'A* point to point':<32}{per_call(astar_path, grid, start_cell, goal_cell) * 1e3:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for Player state.
+Compares 100k players in the original dict/list/set layout against the
+slotted Player, each with a typical mid-game amount of state.
+
+Usage:
+    python benchmarks/player_memory.py [count]
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.player import Player
+
+
+class LegacyPlayer:
+    """The original Player layout (instance __dict__ plus mutable containers)."""
+    
+    def __init__(self, name):
+        self.name = name
+        self.grades = {'english': 75, 'math': 75, 'science': 75, 'history': 75, 'pe': 75}
+        self.popularity = 50
+        self.relationships = {}
+        self.inventory = []
+        self.visited_locations = set()
+        self.completed_minigames = set()
+        self.achievements = []
+        self.current_period = 1
+        self.energy = 100
+        self.stress = 0
+        self.story_flags = {}
+        self.choices_made = []
+    
+    def play_some(self):
+        self.grades['math'] += 10
+        self.relationships['Jordan'] = 60
+        self.completed_minigames.add('math_quiz')
+        self.achievements.append("Made a new friend")
+        for choice in CHOICES:
+            self.choices_made.append(choice)
+
+
+def play_some(player):
+    """Give a slotted player the same mid-game state as LegacyPlayer.play_some."""
+    player.add_grade_points('math', 10)
+    player.set_relationship("Jordan", 60)
+    player.complete_minigame('math_quiz')
+    player.add_achievement("Made a new friend")
+    for choice in CHOICES:
+        player.add_choice(choice)
+
+
+CHOICES = [f"Choice {i}" for i in range(8)]
+
+
+def measure(factory, count):
+    """Return (bytes allocated, seconds) for building count players."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    players = [factory(f"Student {i}") for i in range(count)]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del players
+    return current, elapsed
+
+
+def legacy_factory(name):
+    player = LegacyPlayer(name)
+    player.play_some()
+    return player
+
+
+def slotted_factory(name):
+    player = Player(name)
+    play_some(player)
+    return player
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    
+    legacy_bytes, legacy_time = measure(legacy_factory, count)
+    slotted_bytes, slotted_time = measure(slotted_factory, count)
+    
+    print(f"{count:,} players with mid-game state")
+    print(f"  Legacy layout:  {legacy_bytes / 1e6:8.1f} MB  ({legacy_bytes / count:6.0f} B/player, {legacy_time:.2f}s)")
+    print(f"  Slotted layout: {slotted_bytes / 1e6:8.1f} MB  ({slotted_bytes / count:6.0f} B/player, {slotted_time:.2f}s)")
+    print(f"  Saved: {(1 - slotted_bytes / legacy_bytes) * 100:.0f}%")
+    
+    player = slotted_factory("Snapshot")
+    start = time.perf_counter()
+    for _ in range(count):
+        player.restore(player.snapshot())
+    elapsed = time.perf_counter() - start
+    print(f"  Snapshot + restore: {elapsed / count * 1e6:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
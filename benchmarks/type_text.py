@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Typing effect benchmark.
+Types every story node once (a full story pass) with the original
+per-character loop and with game.ui.type_text, and reports system calls
+and wall time for each.
+
+Usage:
+    python benchmarks/type_text.py [delay]
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.story import get_story_graph
+from game.ui import type_text, output_backend, TerminalBackend, set_typing_delay
+
+
+class CountingStream:
+    """A /dev/null stream that counts writes and flushes."""
+    
+    def __init__(self):
+        self.devnull = open(os.devnull, 'w')
+        self.writes = 0
+        self.flushes = 0
+    
+    def write(self, text):
+        self.writes += 1
+        return self.devnull.write(text)
+    
+    def flush(self):
+        self.flushes += 1
+        self.devnull.flush()
+
+
+def legacy_type_text(text, delay, stream, counters):
+    """The original type_text: one write, flush and sleep per character."""
+    for char in text:
+        stream.write(char)
+        stream.flush()
+        time.sleep(delay)
+        counters['sleeps'] += 1
+    stream.write('\n')
+
+
+def main():
+    delay = float(sys.argv[1]) if len(sys.argv) > 1 else 0.0002
+    texts = [node.text for node in get_story_graph().values() if node.text.strip()]
+    chars = sum(len(text) for text in texts)
+    print(f"Full story pass: {len(texts)} nodes, {chars:,} characters, {delay * 1000:.2f} ms/char\n")
+    
+    stream = CountingStream()
+    counters = {'sleeps': 0}
+    start = time.perf_counter()
+    for text in texts:
+        legacy_type_text(text, delay, stream, counters)
+    elapsed = time.perf_counter() - start
+    syscalls = stream.flushes + counters['sleeps']
+    print(f"  {'legacy per-character':<22} {syscalls:>8,} syscalls  {elapsed:7.2f}s")
+    
+    stream = CountingStream()
+    syscalls = 0
+    start = time.perf_counter()
+    with output_backend(TerminalBackend(stream)):
+        for text in texts:
+            syscalls += type_text(text, delay).syscalls()
+    elapsed = time.perf_counter() - start
+    print(f"  {'word-batched':<22} {syscalls:>8,} syscalls  {elapsed:7.2f}s")
+    
+    stream = CountingStream()
+    syscalls = 0
+    set_typing_delay(0)
+    start = time.perf_counter()
+    with output_backend(TerminalBackend(stream)):
+        for text in texts:
+            syscalls += type_text(text, delay).syscalls()
+    elapsed = time.perf_counter() - start
+    set_typing_delay(None)
+    print(f"  {'zero-delay mode':<22} {syscalls:>8,} syscalls  {elapsed:7.4f}s")
+
+
+if __name__ == "__main__":
+    main()
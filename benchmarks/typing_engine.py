@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Keystroke typing engine benchmark.
+Replays a simulated typist (with mistakes and backspaces) through
+TypingSession and TypingView into a buffer, and reports the processing
+cost and output size per keystroke against the budget at a given WPM.
+
+Usage:
+    python benchmarks/typing_engine.py [wpm] [sentences]
+"""
+
+import sys
+import os
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.ui import BufferBackend
+from minigames.typing_engine import TypingSession, TypingView, feed_keys, CHARS_PER_WORD
+from minigames.typing_test import SENTENCES
+
+
+def keystrokes(sentence, rng, error_rate=0.05):
+    """Simulate the keys a typist presses for a sentence."""
+    keys = []
+    for char in sentence:
+        if rng.random() < error_rate:
+            keys.append(rng.choice('asdfjkl'))
+            keys.append('\x7f')
+        keys.append(char)
+    return keys
+
+
+def main():
+    """Run the benchmark."""
+    wpm = float(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    interval = 60 / (wpm * CHARS_PER_WORD)
+    rng = random.Random(0)
+    
+    total_keys = 0
+    total_bytes = 0
+    busy = 0.0
+    worst = 0.0
+    for round_index in range(rounds):
+        sentence = SENTENCES[round_index % len(SENTENCES)]
+        backend = BufferBackend()
+        session = TypingSession(sentence)
+        view = TypingView(sentence, "Benchmark", backend)
+        view.draw(session)
+        now = 0.0
+        for key in keystrokes(sentence, rng):
+            now += interval
+            start = time.perf_counter()
+            feed_keys(session, view, key, now)
+            elapsed = time.perf_counter() - start
+            busy += elapsed
+            worst = max(worst, elapsed)
+            total_keys += 1
+        total_bytes += view.bytes_written
+    
+    per_key = busy / total_keys
+    print(f"Simulated typist: {wpm:.0f} WPM ({1 / interval:.1f} keys/s, {interval * 1000:.1f} ms budget per key)")
+    print(f"Keystrokes:       {total_keys:,} over {rounds:,} sentences")
+    print(f"Per keystroke:    {per_key * 1e6:.1f} µs average, {worst * 1e6:.1f} µs worst "
+          f"({per_key / interval * 100:.3f}% of the budget)")
+    print(f"Output:           {total_bytes / total_keys:.0f} bytes per keystroke")
+    print(f"Capacity:         ~{60 / (per_key * CHARS_PER_WORD):,.0f} WPM before input would queue up")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Story node render throughput benchmark.
+Compares the original UI path (os.system('clear') and print) with the
+output backends in game.ui.
+
+Usage:
+    python benchmarks/ui_render.py [nodes]
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.player import Player
+from game.story import get_story_graph
+from game.ui import (
+    Colors, clear_screen, print_colored, print_separator, print_choices,
+    output_backend, TerminalBackend, BufferBackend, NullBackend
+)
+from utils.time_system import TimeSystem
+
+
+def legacy_render(node, player, time_system, devnull):
+    """Render a node the way game.ui originally did."""
+    # The old clear_screen forked a shell; send its output to /dev/null here
+    os.system('cls >NUL' if os.name == 'nt' else 'clear >/dev/null 2>&1')
+    print(f"{Colors.WHITE}{node.render(player, time_system)}{Colors.RESET}", file=devnull)
+    if len(node.choices) > 1:
+        print('-' * 60, file=devnull)
+        print(file=devnull)
+        for i, (choice, _) in enumerate(node.choices, 1):
+            print(f"{Colors.BRIGHT_YELLOW}  {i}. {choice}{Colors.RESET}", file=devnull)
+        print(file=devnull)
+
+
+def render(node, player, time_system):
+    """Render a node through the current output backend."""
+    clear_screen()
+    print_colored(node.render(player, time_system), Colors.WHITE)
+    if len(node.choices) > 1:
+        print_separator()
+        print_choices([choice for choice, _ in node.choices])
+
+
+def measure(label, count, render_one):
+    """Time count node renders and print the throughput."""
+    nodes = [node for node in get_story_graph().values() if node.text.strip()]
+    player = Player("Benchmark")
+    time_system = TimeSystem()
+    start = time.perf_counter()
+    for i in range(count):
+        render_one(nodes[i % len(nodes)], player, time_system)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {count / elapsed:>12,.0f} nodes/s")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    legacy_count = max(1, count // 50)  # Forking is slow; sample fewer nodes
+    
+    print("Story node render throughput")
+    with open(os.devnull, 'w') as devnull:
+        measure("legacy (os.system + print)", legacy_count,
+                lambda node, p, ts: legacy_render(node, p, ts, devnull))
+        
+        with output_backend(TerminalBackend(devnull)):
+            measure("TerminalBackend", count, render)
+    
+    buffer = BufferBackend()
+    with output_backend(buffer):
+        measure("BufferBackend", count, render)
+    
+    with output_backend(NullBackend()):
+        measure("NullBackend", count, render)
+
+
+if __name__ == "__main__":
+    main()
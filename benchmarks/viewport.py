@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Hallway render benchmark.
+Walks the player randomly around a large generated map and compares
+frames per second for the original full-map render (string concatenation,
+whole screen rewritten) with the viewport: full window frames, and cell
+patches that fall back to a frame only when the window scrolls.
+
+Usage:
+    python benchmarks/viewport.py [size] [moves]
+"""
+
+import sys
+import os
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.ui import FrameBuffer, NullBackend
+from utils.hallway import Hallway
+from utils.mapgen import generate_school
+
+
+def legacy_render(hallway):
+    """Render the whole map the way Hallway.render originally did."""
+    lines = []
+    for y, row in enumerate(hallway.map_data):
+        line = ""
+        for x, cell in enumerate(row):
+            if x == hallway.player_x and y == hallway.player_y:
+                line += "*"
+            else:
+                line += cell
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def walk(hallway, moves, draw, seed=0):
+    """Make random moves, drawing after each; return (frames per second, bytes per frame)."""
+    rng = random.Random(seed)
+    directions = [rng.choice('wasd') for _ in range(moves)]
+    written = 0
+    start = time.perf_counter()
+    for direction in directions:
+        hallway.move(direction)
+        written += draw()
+    elapsed = time.perf_counter() - start
+    return moves / elapsed, written / moves
+
+
+def main():
+    """Run the benchmark."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    moves = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    start = time.perf_counter()
+    school = generate_school(size, size, seed=0)
+    print(f"Map: {size}x{size} (generated in {time.perf_counter() - start:.2f} s), {moves:,} random moves\n")
+    print(f"{'renderer':<30}{'frames/s':>12}{'bytes/frame':>14}")
+
+    hallway = Hallway(school)
+    legacy_moves = max(1, moves // 2000)  # A full-map frame is slow; sample fewer
+    fps, frame_bytes = walk(hallway, legacy_moves, lambda: len(legacy_render(hallway)))
+    print(f"{'full map, line += cell':<30}{fps:>12,.1f}{frame_bytes:>14,.0f}")
+
+    frame = FrameBuffer(NullBackend())
+
+    def full_frame():
+        frame.invalidate()
+        frame.add(hallway.render())
+        return frame.flush()
+
+    hallway = Hallway(school)
+    fps, frame_bytes = walk(hallway, moves, full_frame)
+    print(f"{'viewport, full frame':<30}{fps:>12,.0f}{frame_bytes:>14,.0f}")
+
+    def patched_frame():
+        patch = hallway.view.patch(hallway.map_data, hallway.player_x, hallway.player_y)
+        if patch is None:
+            frame.add(hallway.render())
+            return frame.flush()
+        return len(patch)
+
+    hallway = Hallway(school)
+    frame.invalidate()
+    fps, frame_bytes = walk(hallway, moves, patched_frame)
+    print(f"{'viewport, cell patches':<30}{fps:>12,.0f}{frame_bytes:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Word list benchmark.
+Compares the original load-per-game list with the shared WordIndex for
+loading the list, validating guesses and picking a random target.
+
+Usage:
+    python benchmarks/wordlist.py [iterations]
+"""
+
+import sys
+import os
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.wordlist import get_word_index, DEFAULT_WORD_FILE, _resolve_path
+
+
+def legacy_load_words(filename=DEFAULT_WORD_FILE):
+    """The original loader: read and uppercase the file on every call."""
+    with open(_resolve_path(filename), 'r') as f:
+        return [line.strip().upper() for line in f if line.strip()]
+
+
+def timed(func, iterations):
+    """Time func() over some iterations, returning microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    """Run the benchmark."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(0)
+    
+    words = legacy_load_words()
+    index = get_word_index()
+    # Half valid guesses, half misses (worst case for a list scan)
+    guesses = [rng.choice(words) for _ in range(50)] + ["QQQQ" + chr(65 + i % 26) for i in range(50)]
+    
+    def list_validate():
+        for guess in guesses:
+            guess in words
+    
+    def index_validate():
+        for guess in guesses:
+            guess in index
+    
+    rows = [
+        ("load (per game)", timed(legacy_load_words, iterations), timed(get_word_index, iterations)),
+        ("validate 100 guesses", timed(list_validate, iterations), timed(index_validate, iterations)),
+        ("random pick", timed(lambda: rng.choice(words), iterations * 50),
+         timed(lambda: index.random_word(rng), iterations * 50)),
+    ]
+    
+    print(f"Word list: {len(index)} words\n")
+    print(f"{'operation':<22}{'list (µs)':>12}{'index (µs)':>12}{'speedup':>10}")
+    for name, before, after in rows:
+        print(f"{name:<22}{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Streaming word loader benchmark.
+Writes a synthetic word file (mixed lengths, duplicates and junk entries),
+plain and gzip-compressed, and compares reading it the original way (whole
+file into an uppercase list) with load_packed_words, reporting time, peak
+traced memory and the size of the result.
+
+Usage:
+    python benchmarks/wordlist_stream.py [words]
+"""
+
+import sys
+import os
+import gzip
+import random
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.wordlist import load_packed_words
+
+
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+
+def write_synthetic(path, count, seed=0):
+    """Write count lines: words of 3-10 letters, ~10% repeats, ~5% junk."""
+    rng = random.Random(seed)
+    recent = []
+    with open(path, 'w') as f:
+        for _ in range(count):
+            roll = rng.random()
+            if roll < 0.10 and recent:
+                word = rng.choice(recent)
+            elif roll < 0.15:
+                word = ''.join(rng.choices(LETTERS + "'-0123", k=rng.randint(3, 10)))
+            else:
+                word = ''.join(rng.choices(LETTERS, k=rng.randint(3, 10)))
+                if len(recent) < 10000:
+                    recent.append(word)
+            f.write(word + '\n')
+
+
+def legacy_load(path):
+    """The original approach: read every line into an uppercase list."""
+    with open(path, 'r') as f:
+        return [line.strip().upper() for line in f if line.strip()]
+
+
+def measure(func, *args, **kwargs):
+    """Run func untraced for time, then traced for peak memory."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    del result
+    
+    tracemalloc.start()
+    result = func(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, 'words.txt')
+        packed = os.path.join(tmp, 'words.txt.gz')
+        write_synthetic(plain, count)
+        with open(plain, 'rb') as src, gzip.open(packed, 'wb', compresslevel=1) as dst:
+            dst.write(src.read())
+        
+        print(f"Synthetic file: {count:,} lines, {os.path.getsize(plain) / 1e6:.1f} MB "
+              f"({os.path.getsize(packed) / 1e6:.1f} MB gzip)\n")
+        print(f"{'loader':<32}{'time (s)':>10}{'peak (MB)':>12}{'words':>12}")
+        
+        words, elapsed, peak = measure(legacy_load, plain)
+        print(f"{'list (original)':<32}{elapsed:>10.2f}{peak / 1e6:>12.1f}{len(words):>12,}")
+        del words
+        
+        for label, path, lengths in (
+            ("packed, all lengths", plain, None),
+            ("packed, all lengths (.gz)", packed, None),
+            ("packed, 5 letters only", plain, (5,)),
+        ):
+            index, elapsed, peak = measure(load_packed_words, path, lengths)
+            print(f"{label:<32}{elapsed:>10.2f}{peak / 1e6:>12.1f}{len(index):>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Multiprocess batch runner for headless story simulations.
+Shards the playthrough space across a process pool and merges the
+per-shard stat histograms into a single report.
+"""
+
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from game.simulation import StorySimulator, ScriptedPolicy, RandomPolicy, MINIGAME_STUBS
+
+
+# Stats collected into histograms for every playthrough
+HISTOGRAM_STATS = ('gpa', 'popularity', 'energy', 'stress')
+
+# Default performance bands used by the exhaustive sweep
+DEFAULT_BANDS = (0.0, 0.5, 1.0)
+
+# Each worker process builds its simulator once and reuses it
+_worker_simulator = None
+
+
+def _get_simulator():
+    """Get the simulator for the current process."""
+    global _worker_simulator
+    if _worker_simulator is None:
+        _worker_simulator = StorySimulator()
+    return _worker_simulator
+
+
+def shard_seed(seed, shard_index):
+    """Derive a deterministic RNG seed for a shard."""
+    return (seed * 1_000_003 + shard_index) & 0xFFFFFFFFFFFF
+
+
+def empty_report():
+    """Create an empty histogram report."""
+    return {
+        'runs': 0,
+        'histograms': {stat: {} for stat in HISTOGRAM_STATS},
+        'endings': {},
+    }
+
+
+def _record(report, result):
+    """Add one simulation outcome to a report."""
+    report['runs'] += 1
+    stats = result['stats']
+    for stat in HISTOGRAM_STATS:
+        histogram = report['histograms'][stat]
+        value = stats[stat]
+        histogram[value] = histogram.get(value, 0) + 1
+    endings = report['endings']
+    endings[result['ending']] = endings.get(result['ending'], 0) + 1
+
+
+def merge_reports(reports):
+    """Merge per-shard reports into one, independent of shard order."""
+    merged = empty_report()
+    for report in reports:
+        merged['runs'] += report['runs']
+        for stat in HISTOGRAM_STATS:
+            target = merged['histograms'][stat]
+            for value, count in report['histograms'][stat].items():
+                target[value] = target.get(value, 0) + count
+        for ending, count in report['endings'].items():
+            merged['endings'][ending] = merged['endings'].get(ending, 0) + count
+
+    # Sort keys so the merged report is identical however it was produced
+    merged['histograms'] = {
+        stat: dict(sorted(histogram.items()))
+        for stat, histogram in merged['histograms'].items()
+    }
+    merged['endings'] = dict(sorted(merged['endings'].items()))
+    return merged
+
+
+def _run_random_shard(shard):
+    """Run a shard of random playthroughs (executed in a worker)."""
+    seed, shard_index, count = shard
+    simulator = _get_simulator()
+    simulator.minigame_scores = None
+    rng = random.Random(shard_seed(seed, shard_index))
+    policy = RandomPolicy(rng)
+    report = empty_report()
+    for _ in range(count):
+        _record(report, simulator.run(policy, rng))
+    return report
+
+
+def _run_band_shard(shard):
+    """Run every choice path for a slice of score-band combinations."""
+    bands, start, stop = shard
+    simulator = _get_simulator()
+    scripts = list(simulator.iter_scripts())
+    combos = itertools.islice(itertools.product(bands, repeat=len(MINIGAME_STUBS)), start, stop)
+    rng = random.Random(0)  # Unused: every choice and score is fixed
+    report = empty_report()
+    for combo in combos:
+        simulator.minigame_scores = dict(zip(sorted(MINIGAME_STUBS), combo))
+        for script in scripts:
+            _record(report, simulator.run(ScriptedPolicy(script), rng))
+    return report
+
+
+def _run_shards(func, shards, workers):
+    """Run shards in-process or on a process pool and merge the results."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(shards) <= 1:
+        return merge_reports(func(shard) for shard in shards)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return merge_reports(pool.map(func, shards))
+
+
+def run_random_sweep(runs, seed=0, workers=None, shard_size=5000):
+    """Run random playthroughs across all cores and merge their histograms.
+
+    The work is cut into fixed-size shards with their own seeds, so the merged
+    report depends only on runs, seed and shard_size, never on worker count.
+    """
+    shards = []
+    for shard_index, start in enumerate(range(0, runs, shard_size)):
+        shards.append((seed, shard_index, min(shard_size, runs - start)))
+    return _run_shards(_run_random_shard, shards, workers)
+
+
+def run_band_sweep(bands=DEFAULT_BANDS, workers=None, combos_per_shard=8):
+    """Run every choice path against every mini-game score band combination."""
+    bands = tuple(bands)
+    total = len(bands) ** len(MINIGAME_STUBS)
+    shards = [
+        (bands, start, min(start + combos_per_shard, total))
+        for start in range(0, total, combos_per_shard)
+    ]
+    return _run_shards(_run_band_shard, shards, workers)
+
+
+def format_report(report):
+    """Format a merged report for display."""
+    lines = [f"Playthroughs: {report['runs']:,}"]
+    for stat, histogram in report['histograms'].items():
+        lines.append(f"\n{stat.upper()}:")
+        for value, count in histogram.items():
+            share = count / report['runs'] * 100 if report['runs'] else 0
+            lines.append(f"  {value:>6}: {count:>9,} ({share:5.1f}%)")
+    lines.append("\nENDINGS:")
+    for ending, count in report['endings'].items():
+        lines.append(f"  {ending}: {count:,}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # Nightly-style sweep: python -m game.batch [runs] [workers]
+    import sys
+
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    start = time.perf_counter()
+    report = run_random_sweep(runs, workers=workers)
+    elapsed = time.perf_counter() - start
+
+    print(format_report(report))
+    print(f"\n{runs:,} playthroughs in {elapsed:.2f}s on {workers or os.cpu_count()} worker(s)")
@@ -3,32 +3,99 @@ Player state management for the School Days game.
 Tracks player stats, inventory, relationships, and progress.
 """
 
+import sys
+from operator import attrgetter
+from types import MappingProxyType
+
+
+# Subjects are stored positionally in a bytes object, in this order
+SUBJECTS = ('english', 'math', 'science', 'history', 'pe')
+SUBJECT_INDEX = {subject: i for i, subject in enumerate(SUBJECTS)}
+
+# Only the most recent choices are kept; choice_count tracks the total
+CHOICE_HISTORY_LIMIT = 32
+
+# Relationship byte meaning "never met" (levels themselves are 0-100)
+_NO_RELATIONSHIP = 0xFF
+
+_NO_ENTRIES = MappingProxyType({})
+
+
+def _intern(value):
+    """Intern a string so repeated names share one object; other values are kept as they are."""
+    return sys.intern(value) if type(value) is str else value
+
+
+class KeyRegistry:
+    """Process-wide interning of names to small integer slots.
+    
+    Every player shares one registry per kind of key, so per-player state
+    only stores slot numbers (as byte offsets or bitmask bits).
+    """
+    
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.keys = []
+        self.slots = {}
+    
+    def slot(self, key):
+        """Get the slot for a key, registering it if needed."""
+        slot = self.slots.get(key)
+        if slot is None:
+            key = _intern(key)
+            slot = len(self.keys)
+            self.keys.append(key)
+            self.slots[key] = slot
+        return slot
+    
+    def find(self, key):
+        """Get the slot for a key, or None if it was never registered."""
+        return self.slots.get(key)
+    
+    def keys_in_mask(self, mask):
+        """Get the keys whose bits are set in a bitmask."""
+        return frozenset(key for slot, key in enumerate(self.keys) if mask >> slot & 1)
+
+
+NPCS = KeyRegistry()
+LOCATIONS = KeyRegistry()
+MINIGAMES = KeyRegistry()
+
 
 class Player:
-    """Represents the player character."""
+    """Represents the player character.
+    
+    State is held in compact immutable values (grades and relationship levels
+    as bytes, visited locations and mini-games as bitmasks over the shared
+    registries, tuples for ordered lists) that are replaced rather than
+    mutated, so a snapshot is just a tuple of references and both snapshot()
+    and restore() are O(1). The collection attributes (grades, relationships,
+    inventory, ...) are read-only views; use the methods below to change them.
+    """
+    
+    __slots__ = (
+        'name', '_grades', 'popularity', '_relationships',
+        '_inventory', '_visited_locations', '_completed_minigames', '_achievements',
+        'current_period', 'energy', 'stress',
+        '_story_flags', '_choices', 'choice_count',
+    )
     
     def __init__(self, name):
         """Initialize a new player."""
         self.name = name
         
-        # Academic stats
-        self.grades = {
-            'english': 75,
-            'math': 75,
-            'science': 75,
-            'history': 75,
-            'pe': 75
-        }
+        # Academic stats (one entry per SUBJECTS)
+        self._grades = bytes((75,) * len(SUBJECTS))
         
         # Social stats
         self.popularity = 50
-        self.relationships = {}  # NPC name -> relationship level (0-100)
+        self._relationships = b''  # Level per NPCS slot (0-100)
         
         # Game state
-        self.inventory = []
-        self.visited_locations = set()
-        self.completed_minigames = set()
-        self.achievements = []
+        self._inventory = ()
+        self._visited_locations = 0  # Bitmask over LOCATIONS
+        self._completed_minigames = 0  # Bitmask over MINIGAMES
+        self._achievements = ()
         
         # Time and schedule
         self.current_period = 1
@@ -36,107 +103,183 @@ class Player:
         self.stress = 0
         
         # Story flags
-        self.story_flags = {}
-        self.choices_made = []
-        
+        self._story_flags = _NO_ENTRIES
+        self._choices = ()
+        self.choice_count = 0
+    
+    @property
+    def grades(self):
+        """Subject -> grade mapping (read-only view)."""
+        return MappingProxyType(dict(zip(SUBJECTS, self._grades)))
+    
+    @property
+    def relationships(self):
+        """NPC name -> relationship level (read-only view)."""
+        return MappingProxyType({
+            NPCS.keys[slot]: level
+            for slot, level in enumerate(self._relationships)
+            if level != _NO_RELATIONSHIP
+        })
+    
+    @property
+    def inventory(self):
+        """Items carried, in the order they were added."""
+        return self._inventory
+    
+    @property
+    def visited_locations(self):
+        """Locations the player has visited."""
+        return LOCATIONS.keys_in_mask(self._visited_locations)
+    
+    @property
+    def completed_minigames(self):
+        """Mini-games the player has completed."""
+        return MINIGAMES.keys_in_mask(self._completed_minigames)
+    
+    @property
+    def achievements(self):
+        """Achievements earned, in the order they were earned."""
+        return self._achievements
+    
+    @property
+    def story_flags(self):
+        """Story flag name -> value (read-only view)."""
+        return MappingProxyType(self._story_flags)
+    
+    @property
+    def choices_made(self):
+        """The most recent choices (up to CHOICE_HISTORY_LIMIT)."""
+        return self._choices
+    
+    def set_grade(self, subject, value):
+        """Set a subject grade directly (clamped to 0-100)."""
+        if subject in SUBJECT_INDEX:
+            index = SUBJECT_INDEX[subject]
+            grades = self._grades
+            self._grades = grades[:index] + bytes((max(0, min(100, value)),)) + grades[index + 1:]
+    
     def add_grade_points(self, subject, points):
         """Add points to a subject grade."""
-        if subject in self.grades:
-            self.grades[subject] = min(100, self.grades[subject] + points)
-            
+        if subject in SUBJECT_INDEX:
+            self.set_grade(subject, min(100, self._grades[SUBJECT_INDEX[subject]] + points))
+    
     def subtract_grade_points(self, subject, points):
         """Subtract points from a subject grade."""
-        if subject in self.grades:
-            self.grades[subject] = max(0, self.grades[subject] - points)
+        if subject in SUBJECT_INDEX:
+            self.set_grade(subject, max(0, self._grades[SUBJECT_INDEX[subject]] - points))
     
     def get_gpa(self):
         """Calculate the player's GPA."""
-        total = sum(self.grades.values())
-        average = total / len(self.grades)
+        total = sum(self._grades)
+        average = total / len(self._grades)
         # Convert to 4.0 scale
         return round((average / 100) * 4.0, 2)
     
     def add_item(self, item):
         """Add an item to inventory."""
-        self.inventory.append(item)
-        
+        self._inventory += (_intern(item),)
+    
     def remove_item(self, item):
         """Remove an item from inventory."""
-        if item in self.inventory:
-            self.inventory.remove(item)
+        if item in self._inventory:
+            index = self._inventory.index(item)
+            self._inventory = self._inventory[:index] + self._inventory[index + 1:]
             return True
         return False
     
     def has_item(self, item):
         """Check if player has an item."""
-        return item in self.inventory
+        return item in self._inventory
     
     def change_popularity(self, amount):
         """Change popularity by the given amount."""
         self.popularity = max(0, min(100, self.popularity + amount))
-        
+    
     def set_relationship(self, npc_name, level):
         """Set relationship level with an NPC."""
-        self.relationships[npc_name] = max(0, min(100, level))
-        
+        slot = NPCS.slot(npc_name)
+        levels = self._relationships
+        if slot >= len(levels):
+            levels += bytes((_NO_RELATIONSHIP,)) * (slot + 1 - len(levels))
+        self._relationships = levels[:slot] + bytes((max(0, min(100, level)),)) + levels[slot + 1:]
+    
     def change_relationship(self, npc_name, amount):
         """Change relationship level with an NPC."""
-        current = self.relationships.get(npc_name, 50)
-        self.relationships[npc_name] = max(0, min(100, current + amount))
-        
+        current = self.get_relationship(npc_name)
+        self.set_relationship(npc_name, current + amount)
+    
     def get_relationship(self, npc_name):
         """Get relationship level with an NPC."""
-        return self.relationships.get(npc_name, 50)
+        slot = NPCS.find(npc_name)
+        if slot is None or slot >= len(self._relationships):
+            return 50
+        level = self._relationships[slot]
+        return 50 if level == _NO_RELATIONSHIP else level
     
     def visit_location(self, location):
         """Mark a location as visited."""
-        self.visited_locations.add(location)
-        
+        self._visited_locations |= 1 << LOCATIONS.slot(location)
+    
     def has_visited(self, location):
         """Check if player has visited a location."""
-        return location in self.visited_locations
+        slot = LOCATIONS.find(location)
+        return slot is not None and bool(self._visited_locations >> slot & 1)
     
     def complete_minigame(self, game_name):
         """Mark a minigame as completed."""
-        self.completed_minigames.add(game_name)
-        
+        self._completed_minigames |= 1 << MINIGAMES.slot(game_name)
+    
     def has_completed_minigame(self, game_name):
         """Check if player has completed a minigame."""
-        return game_name in self.completed_minigames
+        slot = MINIGAMES.find(game_name)
+        return slot is not None and bool(self._completed_minigames >> slot & 1)
     
     def add_achievement(self, achievement):
         """Add an achievement."""
-        if achievement not in self.achievements:
-            self.achievements.append(achievement)
-            
+        if achievement not in self._achievements:
+            self._achievements += (_intern(achievement),)
+    
     def set_flag(self, flag_name, value=True):
         """Set a story flag."""
-        self.story_flags[flag_name] = value
-        
+        self._story_flags = {**self._story_flags, _intern(flag_name): value}
+    
     def get_flag(self, flag_name, default=False):
         """Get a story flag value."""
-        return self.story_flags.get(flag_name, default)
+        return self._story_flags.get(flag_name, default)
     
     def has_flag(self, flag_name):
         """Check if a story flag is set."""
-        return flag_name in self.story_flags and self.story_flags[flag_name]
+        return flag_name in self._story_flags and self._story_flags[flag_name]
     
     def add_choice(self, choice_description):
         """Record a choice made by the player."""
-        self.choices_made.append(choice_description)
-        
+        choices = self._choices + (_intern(choice_description),)
+        if len(choices) > CHOICE_HISTORY_LIMIT:
+            choices = choices[-CHOICE_HISTORY_LIMIT:]
+        self._choices = choices
+        self.choice_count += 1
+    
     def change_energy(self, amount):
         """Change energy level."""
         self.energy = max(0, min(100, self.energy + amount))
-        
+    
     def change_stress(self, amount):
         """Change stress level."""
         self.stress = max(0, min(100, self.stress + amount))
-        
+    
     def advance_period(self):
         """Advance to the next class period."""
         self.current_period += 1
-        
+    
+    def snapshot(self):
+        """Capture the player state in O(1) (a tuple of immutable references)."""
+        return _capture_state(self)
+    
+    def restore(self, snapshot):
+        """Restore a state captured by snapshot() in O(1)."""
+        for slot, value in zip(self.__slots__, snapshot):
+            setattr(self, slot, value)
+    
     def get_stats_summary(self):
         """Get a summary of player stats."""
         return {
@@ -145,10 +288,13 @@ class Player:
             'popularity': self.popularity,
             'energy': self.energy,
             'stress': self.stress,
-            'achievements': len(self.achievements),
-            'inventory_items': len(self.inventory)
+            'achievements': len(self._achievements),
+            'inventory_items': len(self._inventory)
         }
     
     def __repr__(self):
         """String representation of the player."""
         return f"Player({self.name}, GPA: {self.get_gpa()}, Popularity: {self.popularity})"
+
+
+_capture_state = attrgetter(*Player.__slots__)
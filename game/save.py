@@ -0,0 +1,336 @@
+"""
+Save and load support for the School Days game.
+Serializes Player, TimeSystem and the current story node into a compact,
+versioned binary format, one session at a time or many sessions per file.
+
+A session is a small header followed by tagged fields (tag, length, payload).
+Readers skip tags they do not know and fill in defaults for tags that are
+missing, so saves written by older or newer releases still load. Saves
+from older format versions are decoded with that version's layout; a
+save from a newer format version is rejected.
+"""
+
+import struct
+
+from game.player import Player, SUBJECTS
+from utils.time_system import TimeSystem
+
+
+SESSION_MAGIC = b'SDS1'
+BULK_MAGIC = b'SDSB'
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct('<4sB')        # magic, format version
+_BULK_COUNT = struct.Struct('<I')      # number of sessions in a bulk file
+_RECORD_LENGTH = struct.Struct('<I')   # byte length of each session in a bulk file
+# Field header (tag, payload length) per format version: version 2 widened
+# the length so one field can hold more than 64 KiB
+_FIELDS = {1: struct.Struct('<BH'), 2: struct.Struct('<BI')}
+_FIELD = _FIELDS[FORMAT_VERSION]
+_U16 = struct.Struct('<H')
+_STATS = struct.Struct('<BBBH')        # popularity, energy, stress, current_period
+_TIME = struct.Struct('<BIB')          # current_period, minutes_elapsed, is_late
+_CHOICE_COUNT = struct.Struct('<I')
+
+# Field tags (never reuse a number once it has shipped)
+TAG_NAME = 1
+TAG_GRADES = 2
+TAG_STATS = 3
+TAG_RELATIONSHIPS = 4
+TAG_INVENTORY = 5
+TAG_ACHIEVEMENTS = 6
+TAG_VISITED = 7
+TAG_MINIGAMES = 8
+TAG_FLAGS = 9
+TAG_CHOICES = 10
+TAG_TIME = 20
+TAG_NODE = 30
+
+# Flag value types
+_FLAG_BOOL = 0
+_FLAG_INT = 1
+_FLAG_STR = 2
+_FLAG_NONE = 3
+_FLAG_INT_VALUE = struct.Struct('<q')
+
+
+class SaveError(ValueError):
+    """Raised when save data is corrupt or not a School Days save, or a session cannot be saved."""
+
+
+def _pack_str(text):
+    """Encode a length-prefixed UTF-8 string."""
+    data = text.encode('utf-8')
+    return _U16.pack(len(data)) + data
+
+
+def _pack_strs(items):
+    """Encode a counted list of strings."""
+    return _U16.pack(len(items)) + b''.join(_pack_str(item) for item in items)
+
+
+def _unpack_str(data, offset):
+    """Decode a length-prefixed string, returning (text, new_offset)."""
+    (length,) = _U16.unpack_from(data, offset)
+    offset += 2
+    return str(data[offset:offset + length], 'utf-8'), offset + length
+
+
+def _unpack_strs(data):
+    """Decode a counted list of strings."""
+    (count,) = _U16.unpack_from(data, 0)
+    offset = 2
+    items = []
+    for _ in range(count):
+        item, offset = _unpack_str(data, offset)
+        items.append(item)
+    return items
+
+
+def _pack_flag(name, value):
+    """Encode one story flag and its value."""
+    if isinstance(value, bool):
+        encoded = bytes((_FLAG_BOOL, value))
+    elif isinstance(value, int):
+        encoded = bytes((_FLAG_INT,)) + _FLAG_INT_VALUE.pack(value)
+    elif value is None:
+        encoded = bytes((_FLAG_NONE,))
+    elif isinstance(value, str):
+        encoded = bytes((_FLAG_STR,)) + _pack_str(value)
+    else:
+        raise SaveError(f"Story flag {name!r} has a {type(value).__name__} value; "
+                        "flags must be bool, int, str or None")
+    return _pack_str(name) + encoded
+
+
+def _unpack_flags(data):
+    """Decode the story flags field."""
+    (count,) = _U16.unpack_from(data, 0)
+    offset = 2
+    flags = {}
+    for _ in range(count):
+        name, offset = _unpack_str(data, offset)
+        kind = data[offset]
+        offset += 1
+        if kind == _FLAG_BOOL:
+            flags[name] = bool(data[offset])
+            offset += 1
+        elif kind == _FLAG_INT:
+            (flags[name],) = _FLAG_INT_VALUE.unpack_from(data, offset)
+            offset += 8
+        elif kind == _FLAG_NONE:
+            flags[name] = None
+        elif kind == _FLAG_STR:
+            flags[name], offset = _unpack_str(data, offset)
+        else:
+            raise SaveError(f"Unknown story flag kind {kind}")
+    return flags
+
+
+_PACKED_SUBJECTS = _pack_strs(SUBJECTS)
+
+
+def _check_version(version):
+    """Reject a format version this release cannot read (newer ones, or 0)."""
+    if not 1 <= version <= FORMAT_VERSION:
+        raise SaveError(f"Unsupported save format version {version}")
+
+
+def dump_session(player, time_system, node_id="start"):
+    """Serialize one game session to bytes.
+    
+    Raises SaveError for a value the format cannot hold (an int flag wider
+    than 64 bits, a string over 65535 bytes, an unsupported flag type).
+    """
+    try:
+        return _dump_fields(player, time_system, node_id)
+    except SaveError:
+        raise
+    except (struct.error, ValueError) as e:
+        raise SaveError(f"Session cannot be saved: {e}") from None
+
+
+def _dump_fields(player, time_system, node_id):
+    """Encode the tagged fields of a session."""
+    grades = player.grades
+    relationships = player.relationships
+    flags = player.story_flags
+    fields = [
+        (TAG_NAME, _pack_str(player.name)),
+        (TAG_GRADES, _PACKED_SUBJECTS + bytes(grades[subject] for subject in SUBJECTS)),
+        (TAG_STATS, _STATS.pack(player.popularity, player.energy, player.stress, player.current_period)),
+        (TAG_RELATIONSHIPS, _pack_strs(list(relationships)) + bytes(relationships.values())),
+        (TAG_INVENTORY, _pack_strs(player.inventory)),
+        (TAG_ACHIEVEMENTS, _pack_strs(player.achievements)),
+        (TAG_VISITED, _pack_strs(sorted(player.visited_locations))),
+        (TAG_MINIGAMES, _pack_strs(sorted(player.completed_minigames))),
+        (TAG_FLAGS, _U16.pack(len(flags)) + b''.join(_pack_flag(k, v) for k, v in flags.items())),
+        (TAG_CHOICES, _CHOICE_COUNT.pack(player.choice_count) + _pack_strs(player.choices_made)),
+        (TAG_TIME, _TIME.pack(time_system.current_period, time_system.minutes_elapsed, time_system.is_late)),
+    ]
+    if node_id is not None:
+        fields.append((TAG_NODE, _pack_str(node_id)))
+
+    parts = [_HEADER.pack(SESSION_MAGIC, FORMAT_VERSION)]
+    for tag, payload in fields:
+        parts.append(_FIELD.pack(tag, len(payload)))
+        parts.append(payload)
+    return b''.join(parts)
+
+
+def load_session(data):
+    """Deserialize bytes from dump_session into (player, time_system, node_id)."""
+    data = memoryview(data)
+    try:
+        magic, version = _HEADER.unpack_from(data, 0)
+    except struct.error:
+        raise SaveError("Save data is truncated") from None
+    if magic != SESSION_MAGIC:
+        raise SaveError("Not a School Days save")
+    _check_version(version)
+
+    field = _FIELDS[version]
+    fields = {}
+    offset = _HEADER.size
+    end = len(data)
+    try:
+        while offset < end:
+            tag, length = field.unpack_from(data, offset)
+            offset += field.size
+            if offset + length > end:
+                raise SaveError("Save data is truncated")
+            fields[tag] = data[offset:offset + length]
+            offset += length
+        return _build_session(fields)
+    except (struct.error, IndexError, UnicodeDecodeError):
+        raise SaveError("Save data is corrupt") from None
+
+
+def _build_session(fields):
+    """Rebuild the session objects from decoded fields."""
+    name = _unpack_str(fields[TAG_NAME], 0)[0] if TAG_NAME in fields else "Student"
+    player = Player(name)
+
+    if TAG_GRADES in fields:
+        payload = fields[TAG_GRADES]
+        subjects = _unpack_strs(payload)
+        values = payload[len(payload) - len(subjects):]
+        for subject, value in zip(subjects, values):
+            player.set_grade(subject, value)
+
+    if TAG_STATS in fields:
+        player.popularity, player.energy, player.stress, player.current_period = \
+            _STATS.unpack_from(fields[TAG_STATS], 0)
+
+    if TAG_RELATIONSHIPS in fields:
+        payload = fields[TAG_RELATIONSHIPS]
+        npcs = _unpack_strs(payload)
+        levels = payload[len(payload) - len(npcs):]
+        for npc_name, level in zip(npcs, levels):
+            player.set_relationship(npc_name, level)
+
+    for item in _unpack_strs(fields[TAG_INVENTORY]) if TAG_INVENTORY in fields else ():
+        player.add_item(item)
+    for achievement in _unpack_strs(fields[TAG_ACHIEVEMENTS]) if TAG_ACHIEVEMENTS in fields else ():
+        player.add_achievement(achievement)
+    for location in _unpack_strs(fields[TAG_VISITED]) if TAG_VISITED in fields else ():
+        player.visit_location(location)
+    for game_name in _unpack_strs(fields[TAG_MINIGAMES]) if TAG_MINIGAMES in fields else ():
+        player.complete_minigame(game_name)
+
+    if TAG_FLAGS in fields:
+        for flag_name, value in _unpack_flags(fields[TAG_FLAGS]).items():
+            player.set_flag(flag_name, value)
+
+    if TAG_CHOICES in fields:
+        payload = fields[TAG_CHOICES]
+        (choice_count,) = _CHOICE_COUNT.unpack_from(payload, 0)
+        for choice in _unpack_strs(payload[_CHOICE_COUNT.size:]):
+            player.add_choice(choice)
+        player.choice_count = choice_count
+
+    time_system = TimeSystem()
+    if TAG_TIME in fields:
+        current_period, minutes_elapsed, is_late = _TIME.unpack_from(fields[TAG_TIME], 0)
+        time_system.current_period = current_period
+        time_system.minutes_elapsed = minutes_elapsed
+        time_system.is_late = bool(is_late)
+
+    node_id = _unpack_str(fields[TAG_NODE], 0)[0] if TAG_NODE in fields else None
+    return player, time_system, node_id
+
+
+def dump_story(story):
+    """Serialize a Story in progress (its player, time and current node)."""
+    return dump_session(story.player, story.time_system, story.current_node)
+
+
+def save_sessions(path, sessions):
+    """Write many (player, time_system, node_id) sessions into one file.
+
+    Returns the number of sessions written.
+    """
+    records = [dump_session(*session) for session in sessions]
+    parts = [_HEADER.pack(BULK_MAGIC, FORMAT_VERSION), _BULK_COUNT.pack(len(records))]
+    for record in records:
+        parts.append(_RECORD_LENGTH.pack(len(record)))
+        parts.append(record)
+    with open(path, 'wb') as f:
+        f.write(b''.join(parts))
+    return len(records)
+
+
+def load_sessions(path):
+    """Read every session from a file written by save_sessions."""
+    with open(path, 'rb') as f:
+        data = memoryview(f.read())
+
+    try:
+        magic, version = _HEADER.unpack_from(data, 0)
+        (count,) = _BULK_COUNT.unpack_from(data, _HEADER.size)
+    except struct.error:
+        raise SaveError("Bulk save file is truncated") from None
+    if magic != BULK_MAGIC:
+        raise SaveError("Not a School Days bulk save file")
+    _check_version(version)
+
+    sessions = []
+    offset = _HEADER.size + _BULK_COUNT.size
+    for _ in range(count):
+        try:
+            (length,) = _RECORD_LENGTH.unpack_from(data, offset)
+        except struct.error:
+            raise SaveError("Bulk save file is truncated") from None
+        offset += _RECORD_LENGTH.size
+        sessions.append(load_session(data[offset:offset + length]))
+        offset += length
+    return sessions
+
+
+if __name__ == "__main__":
+    # Round-trip benchmark
+    import time
+
+    player = Player("Benchmark Student")
+    player.add_grade_points('math', 15)
+    player.set_relationship("Jordan", 60)
+    player.add_achievement("Made a new friend")
+    player.complete_minigame('math_quiz')
+    player.add_choice("Sit with your friends")
+    time_system = TimeSystem()
+    time_system.advance_period()
+
+    runs = 20000
+    start = time.perf_counter()
+    for _ in range(runs):
+        data = dump_session(player, time_system, "lunch_time")
+    dump_time = (time.perf_counter() - start) / runs
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        load_session(data)
+    load_time = (time.perf_counter() - start) / runs
+
+    print(f"Session size: {len(data)} bytes")
+    print(f"Serialize:    {dump_time * 1e6:.1f} µs")
+    print(f"Deserialize:  {load_time * 1e6:.1f} µs")
@@ -0,0 +1,323 @@
+"""
+Asyncio multi-session server for the School Days game.
+Drives story nodes as coroutines over a simple line protocol, so one
+process can host a whole classroom (or thousands of simulated students).
+
+Protocol (one UTF-8 line per message):
+    client -> server   first line: the student's name
+                       then one line per ASK: a choice number, or empty
+    server -> client   TEXT <line>          story text
+                       CHOICE <n> <text>    an option for the next ASK
+                       ASK <n>              waiting for 1..n (0 = press Enter)
+                       ERROR <message>      invalid answer, ASK follows again
+                       END <json stats>     final stats, then the server closes
+
+Usage:
+    python -m game.server serve [port]
+    python -m game.server loadtest [sessions] [concurrency]
+"""
+
+import asyncio
+import itertools
+import json
+import random
+import time
+
+from game.player import Player
+from game.simulation import MINIGAME_STUBS
+from game.story import get_story_graph, node_steps
+from utils.metrics import LatencyHistogram
+from utils.time_system import TimeSystem
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+
+class SessionIO:
+    """Input/output for one session, used instead of print() and input()."""
+
+    async def send_text(self, text):
+        """Show story text to the student."""
+        raise NotImplementedError
+
+    async def choose(self, options):
+        """Offer options and return the 0-based index picked."""
+        raise NotImplementedError
+
+    async def pause(self):
+        """Wait for the student to continue."""
+        raise NotImplementedError
+
+
+class LineProtocolIO(SessionIO):
+    """SessionIO over an asyncio stream using the line protocol above.
+
+    Latency is measured from receiving an answer to having flushed the next
+    prompt, i.e. the time the server spends on the student's turn.
+    """
+
+    def __init__(self, reader, writer, histogram=None):
+        """Initialize with the connection streams."""
+        self.reader = reader
+        self.writer = writer
+        self.histogram = histogram if histogram is not None else LatencyHistogram()
+        self._answered_at = None
+
+    def _send(self, kind, text=''):
+        """Queue one protocol line."""
+        self.writer.write(f"{kind} {text}\n".encode('utf-8'))
+
+    async def read_line(self):
+        """Read one stripped line from the client.
+        
+        Raises ConnectionResetError when the client has gone, or has sent a
+        line over the stream limit (after telling it so).
+        """
+        try:
+            line = await self.reader.readline()
+        except (asyncio.LimitOverrunError, ValueError):
+            self._send('ERROR', "Line too long, closing the connection.")
+            await self.writer.drain()
+            raise ConnectionResetError("Client sent an over-long line")
+        if not line:
+            raise ConnectionResetError("Client disconnected")
+        return line.decode('utf-8', 'replace').strip()
+
+    async def _ask(self, num_choices):
+        """Send an ASK, flush, and wait for the answer line."""
+        self._send('ASK', num_choices)
+        await self.writer.drain()
+        if self._answered_at is not None:
+            self.histogram.record(time.perf_counter() - self._answered_at)
+
+        line = await self.read_line()
+        self._answered_at = time.perf_counter()
+        return line
+
+    async def send_text(self, text):
+        """Send each line of story text."""
+        for line in text.strip('\n').split('\n'):
+            self._send('TEXT', line.rstrip())
+
+    async def choose(self, options):
+        """Send the options and read a valid choice number."""
+        for i, option in enumerate(options, 1):
+            self._send('CHOICE', f"{i} {option}")
+        while True:
+            answer = await self._ask(len(options))
+            if answer.isdecimal() and 1 <= int(answer) <= len(options):
+                return int(answer) - 1
+            self._send('ERROR', f"Please enter a number between 1 and {len(options)}.")
+
+    async def pause(self):
+        """Ask the client to press Enter."""
+        await self._ask(0)
+
+    async def finish(self, stats):
+        """Send the final stats."""
+        self._send('END', json.dumps(stats))
+        await self.writer.drain()
+
+
+async def auto_score_minigame(game_name, player, time_system, io, rng=random):
+    """Default server mini-game handler: score the game automatically.
+
+    The interactive mini-games read from the terminal, so in server mode they
+    are replaced by the same stubs the headless simulator uses.
+    """
+    await io.send_text(f"(The {game_name.replace('_', ' ')} is scored automatically in server mode.)")
+    MINIGAME_STUBS[game_name](player, rng.random())
+
+
+async def play_session(io, player, time_system, minigame_handler=auto_score_minigame, start_node="start",
+                       story_nodes=None):
+    """Play the story (default: the shared graph) for one session as a coroutine and return the final stats."""
+    if story_nodes is None:
+        story_nodes = get_story_graph()
+    node_id = start_node
+    while node_id:
+        steps = node_steps(story_nodes, node_id, player, time_system)
+        answer = None
+        while True:
+            try:
+                kind, node, value = steps.send(answer)
+            except StopIteration as stop:
+                node_id = stop.value
+                break
+            answer = None
+            
+            if kind == 'missing':
+                await io.send_text(f"Error: Story node '{value}' not found!")
+            elif kind == 'text':
+                await io.send_text(value)
+            elif kind == 'action':
+                if node.minigame is not None:
+                    await minigame_handler(node.minigame, player, time_system, io)
+                else:
+                    node.action(player, time_system)
+            elif kind == 'pause':
+                await io.pause()
+            else:
+                answer = await io.choose(value)
+    
+    return player.get_stats_summary()
+
+
+class GameServer:
+    """Hosts many concurrent story sessions in one process."""
+
+    def __init__(self, minigame_handler=auto_score_minigame):
+        """Initialize the server."""
+        self.minigame_handler = minigame_handler
+        self.sessions = {}  # session id -> LineProtocolIO
+        self.completed = 0
+        self.disconnected = 0
+        self.latency = LatencyHistogram()
+        self._ids = itertools.count(1)
+        self._server = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Start listening and return the bound (host, port)."""
+        self._server = await asyncio.start_server(self.handle_client, host, port, backlog=4096)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        """Serve until cancelled."""
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        """Stop accepting connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def handle_client(self, reader, writer):
+        """Run one student's session."""
+        session_id = next(self._ids)
+        io = LineProtocolIO(reader, writer)
+        self.sessions[session_id] = io
+        try:
+            name = await io.read_line() or "Student"
+            stats = await play_session(io, Player(name), TimeSystem(), self.minigame_handler)
+            await io.finish(stats)
+            self.completed += 1
+        except (ConnectionError, asyncio.IncompleteReadError):
+            self.disconnected += 1
+        finally:
+            del self.sessions[session_id]
+            self.latency.merge(io.histogram)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def metrics(self, per_session=False):
+        """Get server-wide (and optionally per-session) latency metrics."""
+        report = {
+            'active_sessions': len(self.sessions),
+            'completed_sessions': self.completed,
+            'disconnected_sessions': self.disconnected,
+            'turn_latency': self.latency.summary(),
+        }
+        if per_session:
+            report['sessions'] = {
+                session_id: io.histogram.summary() for session_id, io in self.sessions.items()
+            }
+        return report
+
+
+async def run_client(host, port, name, rng, histogram):
+    """Loopback client that plays a session with random choices.
+
+    Records round-trip latency from sending an answer to receiving the next
+    ASK and returns the final stats.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"{name}\n".encode('utf-8'))
+    sent_at = None
+    stats = None
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            kind, _, rest = line.decode('utf-8').rstrip('\n').partition(' ')
+            if kind == 'ASK':
+                if sent_at is not None:
+                    histogram.record(time.perf_counter() - sent_at)
+                num_choices = int(rest)
+                answer = str(rng.randint(1, num_choices)) if num_choices else ''
+                writer.write(f"{answer}\n".encode('utf-8'))
+                sent_at = time.perf_counter()
+            elif kind == 'END':
+                stats = json.loads(rest)
+                break
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+    return stats
+
+
+async def run_load_test(sessions=1000, concurrency=500, seed=0, host=None, port=None):
+    """Run many loopback clients against a server and report throughput and latency.
+
+    When no host is given, an in-process server is started on an ephemeral port.
+    """
+    server = None
+    if host is None:
+        server = GameServer()
+        host, port = await server.start(DEFAULT_HOST, 0)
+
+    rng = random.Random(seed)
+    histogram = LatencyHistogram()
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one_client(index):
+        async with limit:
+            return await run_client(host, port, f"Student {index}", random.Random(rng.random()), histogram)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one_client(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+
+    report = {
+        'sessions': sessions,
+        'completed': sum(1 for stats in results if stats is not None),
+        'elapsed_s': round(elapsed, 3),
+        'sessions_per_s': round(sessions / elapsed, 1) if elapsed else 0.0,
+        'round_trip': histogram.summary(),
+    }
+    if server is not None:
+        report['server'] = server.metrics()
+        await server.stop()
+    return report
+
+
+if __name__ == "__main__":
+    import sys
+
+    command = sys.argv[1] if len(sys.argv) > 1 else 'loadtest'
+
+    if command == 'serve':
+        port = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PORT
+
+        async def serve():
+            server = GameServer()
+            bound = await server.start(DEFAULT_HOST, port)
+            print(f"School Days server listening on {bound[0]}:{bound[1]}")
+            await server.serve_forever()
+
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+    else:
+        sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+        concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 500
+        print(json.dumps(asyncio.run(run_load_test(sessions, concurrency)), indent=2))
@@ -3,6 +3,9 @@ Story content and branching logic for the School Days game.
 Contains all story nodes, choices, and narrative branches.
 """
 
+import sys
+from types import MappingProxyType
+
 from game.ui import (
     clear_screen, print_title, print_colored, Colors, type_text,
     print_choices, get_choice, pause, print_box, print_separator
@@ -14,13 +17,96 @@ from utils.hallway import SimpleHallway
 class StoryNode:
     """Represents a node in the story tree."""
     
-    def __init__(self, node_id, text, choices=None, action=None, end_game=False):
+    __slots__ = ('node_id', 'text', 'choices', 'action', 'end_game', 'minigame', 'dynamic')
+    
+    def __init__(self, node_id, text, choices=None, action=None, end_game=False,
+                 minigame=None, dynamic=False):
         """Initialize a story node."""
-        self.node_id = node_id
+        self.node_id = sys.intern(node_id)
         self.text = text
-        self.choices = choices or []
+        # Choice table: ((text, target_node_id), ...)
+        self.choices = tuple((choice_text, sys.intern(target)) for choice_text, target in choices or ())
         self.action = action  # Function to execute (e.g., mini-game)
         self.end_game = end_game
+        self.minigame = minigame  # Name of the mini-game the action plays, if any
+        self.dynamic = dynamic  # Text is a template filled in from player stats
+    
+    def render(self, player, time_system):
+        """Get the node text for the given player and time."""
+        if not self.dynamic:
+            return self.text
+        return self.text.format_map(_text_context(player, time_system))
+
+
+def _text_context(player, time_system):
+    """Build the template values used by dynamic story text."""
+    grades = player.grades
+    achievements = player.achievements
+    return {
+        'current_time': time_system.get_current_time(),
+        'name': player.name,
+        'gpa': player.get_gpa(),
+        'english': grades['english'],
+        'math': grades['math'],
+        'science': grades['science'],
+        'history': grades['history'],
+        'pe': grades['pe'],
+        'popularity': player.popularity,
+        'energy': player.energy,
+        'stress': player.stress,
+        'achievement_count': len(achievements),
+        'achievement_list': ', '.join(achievements) if achievements else 'None',
+        'minigames_completed': len(player.completed_minigames),
+    }
+
+
+# The story graph is compiled once per process and shared by every Story
+_story_graph = None
+
+
+def get_story_graph():
+    """Get the shared, read-only story graph (node id -> StoryNode)."""
+    global _story_graph
+    if _story_graph is None:
+        _story_graph = MappingProxyType(Story._create_story_nodes())
+    return _story_graph
+
+
+def node_steps(story_nodes, node_id, player, time_system):
+    """Play one node of a story graph, yielding what the front end must do; return the next node id.
+    
+    Every front end (terminal, server) drives this generator, so the story
+    rules live in one place. It yields (kind, node, value) tuples:
+        ('missing', None, node_id)  the node does not exist
+        ('text', node, text)        show the rendered story text
+        ('action', node, None)      run the node's action (or its mini-game)
+        ('pause', node, None)       wait for the player to continue
+        ('choose', node, options)   send() back the 0-based index picked
+    and returns None when the story ends.
+    """
+    node = story_nodes.get(node_id)
+    if node is None:
+        yield 'missing', None, node_id
+        return None
+    
+    text = node.render(player, time_system)
+    if text.strip():
+        yield 'text', node, text
+    
+    if node.action:
+        yield 'action', node, None
+    
+    if node.end_game or not node.choices:
+        return None
+    
+    if len(node.choices) == 1:
+        # Only one choice, auto-continue
+        yield 'pause', node, None
+        return node.choices[0][1]
+    
+    index = yield 'choose', node, [choice_text for choice_text, _ in node.choices]
+    player.add_choice(node.choices[index][0])
+    return node.choices[index][1]
 
 
 class Story:
@@ -31,7 +117,7 @@ class Story:
         self.player = player
         self.time_system = time_system
         self.current_node = "start"
-        self.story_nodes = self._create_story_nodes()
+        self.story_nodes = get_story_graph()
     
     # Helper functions for node actions
     @staticmethod
@@ -60,14 +146,15 @@ class Story:
         p.add_grade_points('pe', 10)
         p.change_energy(-20)
         
-    def _create_story_nodes(self):
+    @staticmethod
+    def _create_story_nodes():
         """Create all story nodes and choices."""
         nodes = {}
         
         # START: Game opening
         nodes["start"] = StoryNode(
             "start",
-            f"""
+            """
 🌅 *BEEP BEEP BEEP* 
 
 Your alarm clock screams at you. It's 7:00 AM on a Monday morning.
@@ -194,7 +281,7 @@ The tension in the room eases a bit. Good save!
         # First period - English class
         nodes["first_period"] = StoryNode(
             "first_period",
-            f"""
+            """
 📚 FIRST PERIOD - ENGLISH CLASS with Ms. Rodriguez
 
 Ms. Rodriguez stands at the front of the classroom, her presence commanding attention.
@@ -210,13 +297,14 @@ The room fills with nervous energy. You take a deep breath.
 "First up," Ms. Rodriguez announces, "our Word Master challenge! Think of it as...
 well, a game you might have played before. You have 6 chances to guess a 5-letter word."
 
-Current Time: {self.time_system.get_current_time()}
-Current Grade: {self.player.grades['english']}%
+Current Time: {current_time}
+Current Grade: {english}%
             """,
             [
                 ("Take the Word Master challenge!", "word_game"),
                 ("Ask for a different test", "alternate_english")
-            ]
+            ],
+            dynamic=True
         )
         
         # Word game mini-game
@@ -226,7 +314,8 @@ Current Grade: {self.player.grades['english']}%
             [
                 ("Continue to Grammar Challenge", "grammar_challenge")
             ],
-            action=lambda p, ts: word_puzzle.play_word_puzzle(p)
+            action=lambda p, ts: word_puzzle.play_word_puzzle(p),
+            minigame='word_puzzle'
         )
         
         # Grammar challenge
@@ -250,7 +339,8 @@ She projects several sentences on the board, each with grammatical errors.
             [
                 ("Continue to Typing Test", "typing_challenge")
             ],
-            action=lambda p, ts: sentence_fix.play_sentence_fix(p)
+            action=lambda p, ts: sentence_fix.play_sentence_fix(p),
+            minigame='sentence_fix'
         )
         
         # Typing challenge
@@ -276,7 +366,8 @@ She displays a sentence on the board.
             [
                 ("English class complete! Time for break", "morning_break")
             ],
-            action=lambda p, ts: typing_test.play_typing_test(p)
+            action=lambda p, ts: typing_test.play_typing_test(p),
+            minigame='typing_test'
         )
         
         # Alternate English (skip mini-games)
@@ -300,7 +391,7 @@ You finish with an average performance.
         # Morning break
         nodes["morning_break"] = StoryNode(
             "morning_break",
-            f"""
+            """
 🕐 BREAK TIME - 9:00 AM
 
 You have a 10-minute break before your next class. Students pour into the hallway.
@@ -313,13 +404,14 @@ You compare notes and discuss how you did.
 
 You have some time. What do you want to do?
 
-Current English Grade: {self.player.grades['english']}%
+Current English Grade: {english}%
             """,
             [
                 ("Review math notes", "math_prep"),
                 ("Get a snack from the vending machine", "snack_break"),
                 ("Navigate the hallway to the math classroom", "hallway_nav")
-            ]
+            ],
+            dynamic=True
         )
         
         # Math prep
@@ -386,7 +478,7 @@ You successfully navigate through the hallways, arriving at the Math classroom!
         # Second period - Math class
         nodes["second_period"] = StoryNode(
             "second_period",
-            f"""
+            """
 🔢 SECOND PERIOD - MATH CLASS with Mr. Thompson
 
 Mr. Thompson is already writing problems on the board when you enter.
@@ -399,13 +491,14 @@ He turns around with a big grin. "Who's ready to exercise their brain?"
 
 Despite his enthusiasm, you can see several students looking nervous.
 
-Current Time: {self.time_system.get_current_time()}
-Current Math Grade: {self.player.grades['math']}%
+Current Time: {current_time}
+Current Math Grade: {math}%
             """,
             [
                 ("Take the Math Quiz!", "math_game"),
                 ("Request extra time to prepare", "math_delay")
-            ]
+            ],
+            dynamic=True
         )
         
         # Math game mini-game
@@ -415,7 +508,8 @@ Current Math Grade: {self.player.grades['math']}%
             [
                 ("Continue to next class", "third_period")
             ],
-            action=lambda p, ts: math_quiz.play_math_quiz(p)
+            action=lambda p, ts: math_quiz.play_math_quiz(p),
+            minigame='math_quiz'
         )
         
         # Math delay
@@ -435,7 +529,7 @@ You use the time to calm your nerves and review the basics mentally.
         # Third period - Science class
         nodes["third_period"] = StoryNode(
             "third_period",
-            f"""
+            """
 🔬 THIRD PERIOD - SCIENCE CLASS with Dr. Chen
 
 You enter the science lab, where Dr. Chen is setting up some equipment.
@@ -448,13 +542,14 @@ She pulls out a stack of question cards.
 "This will be a quiz-style assessment. Answer the questions to the best of your ability.
 Remember, science is all around us!"
 
-Current Time: {self.time_system.get_current_time()}
-Current Science Grade: {self.player.grades['science']}%
+Current Time: {current_time}
+Current Science Grade: {science}%
             """,
             [
                 ("Take the Science Quiz!", "science_game"),
                 ("Ask about extra credit", "science_extra")
-            ]
+            ],
+            dynamic=True
         )
         
         # Science game mini-game
@@ -464,7 +559,8 @@ Current Science Grade: {self.player.grades['science']}%
             [
                 ("Head to lunch!", "lunch_time")
             ],
-            action=lambda p, ts: science_quiz.play_science_quiz(p)
+            action=lambda p, ts: science_quiz.play_science_quiz(p),
+            minigame='science_quiz'
         )
         
         # Science extra credit
@@ -484,7 +580,7 @@ You nod, feeling motivated.
         # Lunch time
         nodes["lunch_time"] = StoryNode(
             "lunch_time",
-            f"""
+            """
 🍕 LUNCH TIME - 10:45 AM
 
 Finally, lunch! You're exhausted from all the tests but relieved to have a break.
@@ -497,14 +593,15 @@ At another table, you see the new transfer student eating alone. They look a bit
 
 There's also an empty quiet corner where you could eat and relax by yourself.
 
-Current Energy: {self.player.energy}%
-Current Stress: {self.player.stress}%
+Current Energy: {energy}%
+Current Stress: {stress}%
             """,
             [
                 ("Sit with your friends", "lunch_friends"),
                 ("Invite the transfer student to join you", "lunch_transfer"),
                 ("Eat alone and decompress", "lunch_alone")
-            ]
+            ],
+            dynamic=True
         )
         
         # Lunch with friends
@@ -611,7 +708,7 @@ Before you know it, the final bell rings.
         # End of day
         nodes["end_of_day"] = StoryNode(
             "end_of_day",
-            f"""
+            """
 🌆 END OF SCHOOL DAY - 2:00 PM
 
 You made it through the day! 
@@ -629,84 +726,66 @@ comes your way.
               FINAL STATS
 ════════════════════════════════════════
 
-Student Name: {self.player.name}
-GPA: {self.player.get_gpa()}/4.0
+Student Name: {name}
+GPA: {gpa}/4.0
 
 GRADES:
-  English:  {self.player.grades['english']}%
-  Math:     {self.player.grades['math']}%
-  Science:  {self.player.grades['science']}%
-  History:  {self.player.grades['history']}%
-  PE:       {self.player.grades['pe']}%
+  English:  {english}%
+  Math:     {math}%
+  Science:  {science}%
+  History:  {history}%
+  PE:       {pe}%
 
 STATS:
-  Popularity: {self.player.popularity}/100
-  Energy:     {self.player.energy}/100
-  Stress:     {self.player.stress}/100
+  Popularity: {popularity}/100
+  Energy:     {energy}/100
+  Stress:     {stress}/100
 
-ACHIEVEMENTS: {len(self.player.achievements)}
-  {', '.join(self.player.achievements) if self.player.achievements else 'None'}
+ACHIEVEMENTS: {achievement_count}
+  {achievement_list}
 
-Mini-games completed: {len(self.player.completed_minigames)}
+Mini-games completed: {minigames_completed}
 
 ════════════════════════════════════════
             """,
             [],
-            end_game=True
+            end_game=True,
+            dynamic=True
         )
         
         return nodes
     
     def play_node(self, node_id):
-        """Play a story node."""
-        if node_id not in self.story_nodes:
-            print_colored(f"Error: Story node '{node_id}' not found!", Colors.RED)
-            return None
-        
-        node = self.story_nodes[node_id]
-        
-        # Display story text
-        if node.text.strip():
-            clear_screen()
-            print_colored(node.text, Colors.WHITE)
-        
-        # Execute action if present
-        if node.action:
-            pause()
-            result = node.action(self.player, self.time_system)
-            pause()
-        
-        # Check if game ends
-        if node.end_game:
-            return None
-        
-        # Show choices and get next node
-        if not node.choices:
-            return None
-        
-        if len(node.choices) == 1:
-            # Only one choice, auto-continue
-            pause()
-            return node.choices[0][1]
-        
-        # Multiple choices
-        print_separator()
-        choice_texts = [choice[0] for choice in node.choices]
-        print_choices(choice_texts)
-        
-        choice_num = get_choice("What do you do? ", len(node.choices))
-        
-        # Record choice
-        self.player.add_choice(node.choices[choice_num - 1][0])
-        
-        return node.choices[choice_num - 1][1]
+        """Play a story node and return the next node id (None when the story ends)."""
+        steps = node_steps(self.story_nodes, node_id, self.player, self.time_system)
+        answer = None
+        while True:
+            try:
+                kind, node, value = steps.send(answer)
+            except StopIteration as stop:
+                return stop.value
+            answer = None
+            
+            if kind == 'missing':
+                print_colored(f"Error: Story node '{value}' not found!", Colors.RED)
+            elif kind == 'text':
+                clear_screen()
+                print_colored(value, Colors.WHITE)
+            elif kind == 'action':
+                pause()
+                node.action(self.player, self.time_system)
+                pause()
+            elif kind == 'pause':
+                pause()
+            else:
+                print_separator()
+                print_choices(value)
+                answer = get_choice("What do you do? ", len(value)) - 1
     
     def play(self):
         """Play through the story."""
-        current_node_id = self.current_node
-        
-        while current_node_id:
-            current_node_id = self.play_node(current_node_id)
+        while self.current_node:
+            self.current_node = self.play_node(self.current_node)
         
         # Game ended
         print_title("GAME OVER")
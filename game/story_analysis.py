@@ -0,0 +1,263 @@
+"""
+Static analysis of the story graph for the School Days game.
+Finds unreachable nodes, dangling choice targets, cycles and dead ends,
+and measures paths to the endings, all in linear time over the graph.
+
+Run it on every content change:
+    python -m game.story_analysis
+"""
+
+from collections import deque
+
+
+def _successors(story_nodes):
+    """Build the adjacency lists and collect dangling choice targets.
+
+    Endings are sinks, as in the story engine: play stops there, so their
+    choices are checked for dangling targets but never followed.
+    """
+    edges = {}
+    dangling = []
+    for node_id, node in story_nodes.items():
+        targets = []
+        for _, target in node.choices:
+            if target in story_nodes:
+                targets.append(target)
+            else:
+                dangling.append((node_id, target))
+        edges[node_id] = [] if node.end_game else targets
+    return edges, dangling
+
+
+def _bfs(edges, start):
+    """Breadth-first search returning distances and parent links."""
+    distance = {start: 0}
+    parent = {start: None}
+    queue = deque([start])
+    while queue:
+        node_id = queue.popleft()
+        for target in edges[node_id]:
+            if target not in distance:
+                distance[target] = distance[node_id] + 1
+                parent[target] = node_id
+                queue.append(target)
+    return distance, parent
+
+
+def _find_cycles(edges):
+    """Find strongly connected components that contain a cycle (iterative Tarjan)."""
+    index = {}
+    low = {}
+    on_stack = set()
+    stack = []
+    cycles = []
+    counter = 0
+
+    for root in edges:
+        if root in index:
+            continue
+        work = [(root, iter(edges[root]))]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node_id, children = work[-1]
+            advanced = False
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(edges[child])))
+                    advanced = True
+                    break
+                elif child in on_stack:
+                    low[node_id] = min(low[node_id], index[child])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent_id = work[-1][0]
+                low[parent_id] = min(low[parent_id], low[node_id])
+
+            if low[node_id] == index[node_id]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node_id:
+                        break
+                if len(component) > 1 or node_id in edges[node_id]:
+                    cycles.append(sorted(component))
+
+    return cycles
+
+
+def _longest_paths(edges, reachable, start):
+    """Longest distance and path count from start over an acyclic reachable graph.
+
+    Returns (longest, parent, path_counts), or None if the reachable graph has
+    a cycle and path lengths are unbounded.
+    """
+    in_degree = dict.fromkeys(reachable, 0)
+    for node_id in reachable:
+        for target in edges[node_id]:
+            in_degree[target] += 1
+
+    longest = {start: 0}
+    parent = {start: None}
+    path_counts = {start: 1}
+    queue = deque([start])
+    visited = 0
+
+    while queue:
+        node_id = queue.popleft()
+        visited += 1
+        for target in edges[node_id]:
+            path_counts[target] = path_counts.get(target, 0) + path_counts[node_id]
+            if longest[node_id] + 1 > longest.get(target, -1):
+                longest[target] = longest[node_id] + 1
+                parent[target] = node_id
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                queue.append(target)
+
+    if visited != len(reachable):
+        return None
+    return longest, parent, path_counts
+
+
+def _build_path(parent, node_id):
+    """Follow parent links back to the start node."""
+    path = []
+    while node_id is not None:
+        path.append(node_id)
+        node_id = parent[node_id]
+    path.reverse()
+    return path
+
+
+def analyze_story(story_nodes, start="start"):
+    """Analyze a story graph (node id -> StoryNode) and return a report dict."""
+    edges, dangling = _successors(story_nodes)
+
+    if start not in story_nodes:
+        return {
+            'nodes': len(story_nodes),
+            'reachable': 0,
+            'unreachable': sorted(story_nodes),
+            'dangling': dangling,
+            'cycles': _find_cycles(edges),
+            'dead_ends': [],
+            'trapped': [],
+            'endings': [],
+            'shortest_path': None,
+            'longest_path': None,
+            'distinct_paths': 0,
+        }
+
+    distance, bfs_parent = _bfs(edges, start)
+    reachable = distance.keys()
+
+    endings = sorted(node_id for node_id in reachable if story_nodes[node_id].end_game)
+    dead_ends = sorted(
+        node_id for node_id in reachable
+        if not story_nodes[node_id].end_game and not story_nodes[node_id].choices
+    )
+
+    # Reachable nodes that can never get to an ending
+    reverse = {node_id: [] for node_id in reachable}
+    for node_id in reachable:
+        for target in edges[node_id]:
+            reverse[target].append(node_id)
+    can_finish = set(endings)
+    queue = deque(endings)
+    while queue:
+        node_id = queue.popleft()
+        for source in reverse[node_id]:
+            if source not in can_finish:
+                can_finish.add(source)
+                queue.append(source)
+    trapped = sorted(node_id for node_id in reachable if node_id not in can_finish)
+
+    shortest_path = None
+    if endings:
+        nearest = min(endings, key=lambda node_id: (distance[node_id], node_id))
+        shortest_path = _build_path(bfs_parent, nearest)
+
+    longest_path = None
+    distinct_paths = None
+    dag = _longest_paths(edges, reachable, start)
+    if dag is not None:
+        longest, dag_parent, path_counts = dag
+        if endings:
+            farthest = max(endings, key=lambda node_id: (longest[node_id], node_id))
+            longest_path = _build_path(dag_parent, farthest)
+        distinct_paths = sum(path_counts[node_id] for node_id in endings)
+
+    return {
+        'nodes': len(story_nodes),
+        'reachable': len(distance),
+        'unreachable': sorted(node_id for node_id in story_nodes if node_id not in distance),
+        'dangling': dangling,
+        'cycles': _find_cycles(edges),
+        'dead_ends': dead_ends,
+        'trapped': trapped,
+        'endings': endings,
+        'shortest_path': shortest_path,
+        'longest_path': longest_path,
+        'distinct_paths': distinct_paths,
+    }
+
+
+def has_errors(report):
+    """Check whether a report contains problems that break a playthrough."""
+    return bool(report['dangling'] or report['dead_ends'] or report['trapped'] or not report['endings'])
+
+
+def format_report(report):
+    """Format an analysis report for display."""
+    lines = [
+        f"Nodes: {report['nodes']} ({report['reachable']} reachable from start)",
+        f"Distinct endings: {len(report['endings'])} ({', '.join(report['endings']) or 'none'})",
+    ]
+
+    if report['distinct_paths'] is None:
+        lines.append("Distinct paths: unbounded (graph has cycles)")
+    else:
+        lines.append(f"Distinct paths: {report['distinct_paths']}")
+
+    if report['shortest_path']:
+        lines.append(f"Shortest path ({len(report['shortest_path']) - 1} steps): "
+                     + " -> ".join(report['shortest_path']))
+    if report['longest_path']:
+        lines.append(f"Longest path ({len(report['longest_path']) - 1} steps): "
+                     + " -> ".join(report['longest_path']))
+
+    problems = [
+        ("Unreachable nodes", report['unreachable']),
+        ("Dangling choice targets", [f"{source} -> {target}" for source, target in report['dangling']]),
+        ("Cycles", [" <-> ".join(cycle) for cycle in report['cycles']]),
+        ("Dead ends (no choices, not an ending)", report['dead_ends']),
+        ("Nodes that cannot reach an ending", report['trapped']),
+    ]
+    for title, items in problems:
+        if items:
+            lines.append(f"\n{title}:")
+            lines.extend(f"  - {item}" for item in items)
+
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+    from game.story import get_story_graph
+
+    report = analyze_story(get_story_graph())
+    print(format_report(report))
+    sys.exit(1 if has_errors(report) else 0)
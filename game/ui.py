@@ -1,11 +1,16 @@
 """
 UI utilities for the School Days game.
 Provides formatting, colors, and display functions using only standard library.
+
+All output goes through a pluggable backend (terminal, string buffer, null
+sink or recorded transcript); see set_output_backend().
 """
 
 import os
+import re
 import sys
 import time
+from contextlib import contextmanager
 
 
 class Colors:
@@ -38,53 +43,411 @@ class Colors:
     RESET = '\033[0m'
 
 
+# Escape sequence that clears the screen and homes the cursor
+CLEAR_SCREEN = '\033[2J\033[H'
+
+
+class OutputBackend:
+    """Destination for everything the UI writes."""
+    
+    def write(self, text):
+        """Write text (which may contain ANSI codes)."""
+        raise NotImplementedError
+    
+    def flush(self):
+        """Make written text visible."""
+    
+    def clear(self):
+        """Clear the screen."""
+        self.write(CLEAR_SCREEN)
+
+
+class TerminalBackend(OutputBackend):
+    """Writes ANSI output to a terminal stream (sys.stdout by default)."""
+    
+    _vt_enabled = False
+    
+    def __init__(self, stream=None):
+        """Initialize with an optional stream; None follows sys.stdout."""
+        self.stream = stream
+        if os.name == 'nt' and not TerminalBackend._vt_enabled:
+            # Makes the Windows console interpret ANSI escape codes
+            os.system('')
+            TerminalBackend._vt_enabled = True
+    
+    def write(self, text):
+        """Write text to the stream."""
+        (self.stream or sys.stdout).write(text)
+    
+    def flush(self):
+        """Flush the stream."""
+        (self.stream or sys.stdout).flush()
+
+
+class BufferBackend(OutputBackend):
+    """Collects output in memory."""
+    
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self.parts = []
+    
+    def write(self, text):
+        """Append text to the buffer."""
+        self.parts.append(text)
+    
+    def getvalue(self):
+        """Get everything written so far."""
+        return ''.join(self.parts)
+    
+    def reset(self):
+        """Empty the buffer."""
+        self.parts.clear()
+
+
+class NullBackend(OutputBackend):
+    """Discards all output (for simulations and benchmarks)."""
+    
+    def write(self, text):
+        """Ignore text."""
+    
+    def clear(self):
+        """Ignore screen clears."""
+
+
+class TranscriptBackend(OutputBackend):
+    """Records output as a list of screens, split at every clear."""
+    
+    def __init__(self):
+        """Initialize an empty transcript."""
+        self.screens = [[]]
+    
+    def write(self, text):
+        """Record text on the current screen."""
+        self.screens[-1].append(text)
+    
+    def clear(self):
+        """Start a new screen."""
+        self.screens.append([])
+    
+    def get_screens(self):
+        """Get the text of each recorded screen."""
+        return [''.join(screen) for screen in self.screens]
+
+
+_output = TerminalBackend()
+
+
+def get_output_backend():
+    """Get the current output backend."""
+    return _output
+
+
+def set_output_backend(backend):
+    """Route all UI output to a backend and return the previous one."""
+    global _output
+    previous = _output
+    _output = backend
+    return previous
+
+
+@contextmanager
+def output_backend(backend):
+    """Temporarily route all UI output to a backend."""
+    previous = set_output_backend(backend)
+    try:
+        yield backend
+    finally:
+        set_output_backend(previous)
+
+
+class FrameBuffer:
+    """Composes a whole screen and flushes it in a single write.
+    
+    Each flush compares the new frame with the previous one and only
+    re-emits the lines that changed, using cursor addressing. Consecutive
+    text in the same color is coalesced so color codes and resets are only
+    written when the color actually changes.
+    """
+    
+    def __init__(self, backend=None):
+        """Initialize the frame buffer (None uses the current output backend)."""
+        self.backend = backend
+        self.previous = None  # Lines of the last flushed frame
+        self._lines = []
+        self._segments = []  # (code, text) pieces of the line being built
+        self.frames = 0
+        self.last_frame_bytes = 0
+        self.total_bytes = 0
+    
+    def add(self, text, color='', style=''):
+        """Add text (which may span lines) in the given color and style."""
+        code = f"{style}{color}"
+        pieces = text.split('\n')
+        for i, piece in enumerate(pieces):
+            if i:
+                self._end_line()
+            if piece:
+                if self._segments and self._segments[-1][0] == code:
+                    self._segments[-1] = (code, self._segments[-1][1] + piece)
+                else:
+                    self._segments.append((code, piece))
+    
+    def add_line(self, text='', color='', style=''):
+        """Add text followed by a line break."""
+        self.add(text, color, style)
+        self._end_line()
+    
+    def _end_line(self):
+        """Finish the current line, emitting color codes only on changes."""
+        parts = []
+        active = ''
+        for code, text in self._segments:
+            if code != active:
+                parts.append(Colors.RESET + code if active else code)
+                active = code
+            parts.append(text)
+        if active:
+            parts.append(Colors.RESET)
+        self._lines.append(''.join(parts))
+        self._segments = []
+    
+    def invalidate(self, rows=None):
+        """Force the next flush to redraw the whole screen, or just the given lines (0-based)."""
+        if rows is None or self.previous is None:
+            self.previous = None
+            return
+        for row in rows:
+            if row < len(self.previous):
+                self.previous[row] = None
+    
+    def flush(self):
+        """Write the composed frame, redrawing only changed lines."""
+        if self._segments:
+            self._end_line()
+        lines = self._lines
+        previous = self.previous
+        
+        if previous is None:
+            parts = [CLEAR_SCREEN, '\r\n'.join(lines), f"\033[{len(lines) + 1};1H"]
+        else:
+            parts = []
+            for row, line in enumerate(lines):
+                if row >= len(previous) or previous[row] != line:
+                    parts.append(f"\033[{row + 1};1H{line}\033[K")
+            # Clear everything below the frame (old lines and typed input)
+            parts.append(f"\033[{len(lines) + 1};1H\033[J")
+        
+        payload = ''.join(parts)
+        backend = self.backend or _output
+        backend.write(payload)
+        backend.flush()
+        
+        self.previous = lines
+        self._lines = []
+        self.frames += 1
+        self.last_frame_bytes = len(payload.encode('utf-8'))
+        self.total_bytes += self.last_frame_bytes
+        return self.last_frame_bytes
+
+
+def write_line(text=''):
+    """Write a plain line of text."""
+    _output.write(f"{text}\n")
+
+
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    _output.clear()
 
 
 def print_colored(text, color=Colors.WHITE, style='', end='\n'):
     """Print colored text to the terminal."""
-    print(f"{style}{color}{text}{Colors.RESET}", end=end)
+    _output.write(f"{style}{color}{text}{Colors.RESET}{end}")
 
 
 def print_title(text):
     """Print a title with formatting."""
-    print("\n" + "=" * 60)
+    write_line("\n" + "=" * 60)
     print_colored(text.center(60), Colors.BRIGHT_CYAN, Colors.BOLD)
-    print("=" * 60 + "\n")
+    write_line("=" * 60 + "\n")
 
 
 def print_box(text, width=60, color=Colors.WHITE):
     """Print text inside a box."""
     lines = text.split('\n')
-    print("\n┌" + "─" * (width - 2) + "┐")
+    write_line("\n┌" + "─" * (width - 2) + "┐")
     for line in lines:
         padding = width - len(line) - 4
         print_colored(f"│ {line}{' ' * padding} │", color)
-    print("└" + "─" * (width - 2) + "┘\n")
+    write_line("└" + "─" * (width - 2) + "┘\n")
 
 
 def print_separator(char='-', length=60):
     """Print a separator line."""
-    print(char * length)
+    write_line(char * length)
+
+
+# A word plus the whitespace after it (or a run of leading whitespace)
+_TYPING_CHUNK = re.compile(r'\S+\s*|\s+')
+
+# When set, overrides the delay passed to every type_text() call
+_typing_delay = None
+
+# Stats from the most recent type_text() call
+last_typing_stats = None
+
+
+class TypingStats:
+    """Counters for one type_text() call."""
+    
+    __slots__ = ('chars', 'writes', 'flushes', 'waits', 'elapsed', 'skipped')
+    
+    def __init__(self, chars):
+        """Initialize empty counters."""
+        self.chars = chars
+        self.writes = 0
+        self.flushes = 0
+        self.waits = 0
+        self.elapsed = 0.0
+        self.skipped = False
+    
+    def syscalls(self):
+        """Estimate system calls made (each flush writes, each wait sleeps)."""
+        return self.flushes + self.waits
+    
+    def __repr__(self):
+        """String representation of the stats."""
+        return (f"TypingStats(chars={self.chars}, writes={self.writes}, "
+                f"waits={self.waits}, elapsed={self.elapsed:.3f}s, skipped={self.skipped})")
+
+
+def set_typing_delay(delay):
+    """Override the typing delay everywhere (0 for instant text, None to reset)."""
+    global _typing_delay
+    _typing_delay = delay
+
+
+class _KeyWatcher:
+    """Detects a keypress while text is being typed out.
+    
+    On a Unix terminal stdin is switched to cbreak mode for the duration so
+    keys arrive without Enter; pressed keys are consumed.
+    """
+    
+    def __init__(self):
+        """Initialize the watcher."""
+        self.fd = None
+        self.old_settings = None
+        self.windows = False
+    
+    def __enter__(self):
+        """Start watching stdin if it is a terminal."""
+        try:
+            if not sys.stdin.isatty():
+                return self
+        except (AttributeError, ValueError):
+            return self
+        if os.name == 'nt':
+            self.windows = True
+        else:
+            import termios
+            import tty
+            self.fd = sys.stdin.fileno()
+            self.old_settings = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)
+        return self
+    
+    def __exit__(self, *exc_info):
+        """Restore the terminal."""
+        if self.old_settings is not None:
+            import termios
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
+    
+    def wait(self, timeout):
+        """Wait up to timeout seconds; return True if a key was pressed."""
+        if self.fd is not None:
+            import select
+            ready, _, _ = select.select([self.fd], [], [], timeout)
+            if ready:
+                os.read(self.fd, 1024)
+                return True
+            return False
+        if self.windows:
+            import msvcrt
+            end = time.perf_counter() + timeout
+            while True:
+                if msvcrt.kbhit():
+                    while msvcrt.kbhit():
+                        msvcrt.getch()
+                    return True
+                remaining = end - time.perf_counter()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(remaining, 0.01))
+        time.sleep(timeout)
+        return False
 
 
 def type_text(text, delay=0.03):
-    """Print text with a typing effect."""
-    for char in text:
-        sys.stdout.write(char)
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
+    """Print text with a typing effect.
+    
+    Text is written a word at a time on a timer that keeps the pace of
+    delay seconds per character. If the terminal falls behind, every word
+    that is already due goes out in the same write. Pressing any key skips
+    to the end. With a zero delay (see set_typing_delay) or a non-terminal
+    backend the text is written at once. Returns a TypingStats.
+    """
+    global last_typing_stats
+    if _typing_delay is not None:
+        delay = _typing_delay
+    
+    stats = TypingStats(len(text))
+    start = time.perf_counter()
+    
+    if delay <= 0 or not isinstance(_output, TerminalBackend):
+        _output.write(f"{text}\n")
+        _output.flush()
+        stats.writes = stats.flushes = 1
+    else:
+        chunks = _TYPING_CHUNK.findall(text)
+        chunks.append('\n')
+        due = 0.0  # Seconds after start when the text written so far is due
+        i = 0
+        with _KeyWatcher() as keys:
+            while i < len(chunks):
+                elapsed = time.perf_counter() - start
+                batch = []
+                while i < len(chunks) and (not batch or due <= elapsed):
+                    batch.append(chunks[i])
+                    due += len(chunks[i]) * delay
+                    i += 1
+                _output.write(''.join(batch))
+                _output.flush()
+                stats.writes += 1
+                stats.flushes += 1
+                
+                wait = due - (time.perf_counter() - start)
+                if i < len(chunks) and wait > 0:
+                    stats.waits += 1
+                    if keys.wait(wait):
+                        _output.write(''.join(chunks[i:]))
+                        _output.flush()
+                        stats.writes += 1
+                        stats.flushes += 1
+                        stats.skipped = True
+                        break
+    
+    stats.elapsed = time.perf_counter() - start
+    last_typing_stats = stats
+    return stats
 
 
 def print_choices(choices):
     """Print a list of choices with numbers."""
-    print()
+    write_line()
     for i, choice in enumerate(choices, 1):
         print_colored(f"  {i}. {choice}", Colors.BRIGHT_YELLOW)
-    print()
+    write_line()
 
 
 def get_choice(prompt, num_choices):
@@ -92,6 +455,7 @@ def get_choice(prompt, num_choices):
     while True:
         try:
             print_colored(prompt, Colors.BRIGHT_GREEN, end='')
+            _output.flush()
             choice = input().strip()
             choice_num = int(choice)
             if 1 <= choice_num <= num_choices:
@@ -108,6 +472,7 @@ def get_choice(prompt, num_choices):
 def get_input(prompt, color=Colors.BRIGHT_GREEN):
     """Get input from the user with a colored prompt."""
     print_colored(prompt, color, end='')
+    _output.flush()
     try:
         return input().strip()
     except KeyboardInterrupt:
@@ -126,6 +491,7 @@ def print_status_bar(player_name, time, location):
 def pause(message="Press Enter to continue..."):
     """Pause and wait for user input."""
     print_colored(f"\n{message}", Colors.DIM)
+    _output.flush()
     try:
         input()
     except KeyboardInterrupt:
@@ -144,8 +510,8 @@ def animate_dots(message="Loading", duration=2, color=Colors.YELLOW):
     for _ in range(duration * 2):
         time.sleep(0.5)
         print_colored(".", color, end='')
-        sys.stdout.flush()
-    print()
+        _output.flush()
+    write_line()
 
 
 def print_success(message):
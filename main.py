@@ -9,8 +9,10 @@ Usage:
     python main.py
     or
     python3 main.py
+    SCHOOL_DAYS_METRICS=metrics.json python main.py   (record mini-game timings)
 """
 
+import atexit
 import sys
 import os
 
@@ -18,10 +20,16 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from game.engine import start_game
+from utils.instrumentation import enable_instrumentation
 
 
 def main():
     """Main entry point for the game."""
+    # Optional mini-game timing metrics, written when the game exits
+    metrics_path = os.environ.get('SCHOOL_DAYS_METRICS')
+    if metrics_path:
+        atexit.register(enable_instrumentation().save, metrics_path)
+
     print("Starting School Days...")
     start_game()
 
@@ -6,8 +6,9 @@ Tests arithmetic, algebra, and basic math concepts.
 import random
 from game.ui import (
     clear_screen, print_title, print_colored, Colors,
-    get_input, print_success, print_error, print_info
+    print_success, print_error, print_info, get_input, pause, write_line
 )
+from utils.instrumentation import instrumented, timed_question, timed_wait
 
 
 def generate_arithmetic_problem():
@@ -85,6 +86,29 @@ def generate_word_problem():
     return problem["question"], problem["answer"]
 
 
+def quiz_points(percentage):
+    """Get the math grade points for a quiz score (percentage correct)."""
+    if percentage == 100:
+        return 20
+    elif percentage >= 80:
+        return 15
+    elif percentage >= 60:
+        return 10
+    elif percentage >= 40:
+        return 5
+    return 3
+
+
+def read_answer():
+    """Ask for a whole-number answer until one is entered."""
+    while True:
+        try:
+            return int(get_input("\nYour answer: "))
+        except ValueError:
+            print_error("Please enter a valid number!")
+
+
+@instrumented('math_quiz')
 def play_math_quiz(player):
     """Play the math quiz mini-game."""
     clear_screen()
@@ -113,14 +137,8 @@ def play_math_quiz(player):
         question, correct_answer = problem_generators[i]()
         print_colored(question, Colors.WHITE)
         
-        # Get user answer
-        while True:
-            try:
-                user_input = get_input("\nYour answer: ")
-                user_answer = int(user_input)
-                break
-            except ValueError:
-                print_error("Please enter a valid number!")
+        # Get user answer (one latency sample, retries included)
+        user_answer = timed_question(read_answer)
         
         # Check answer
         if user_answer == correct_answer:
@@ -130,33 +148,29 @@ def play_math_quiz(player):
             print_error(f"✗ Incorrect! The correct answer is {correct_answer}.")
         
         if i < num_questions - 1:
-            input("\nPress Enter for the next question...")
+            timed_wait(pause, "Press Enter for the next question...")
     
     # Calculate results
-    print("\n" + "=" * 60)
+    write_line("\n" + "=" * 60)
     print_colored("📊 Results:", Colors.BRIGHT_CYAN, Colors.BOLD)
     print_colored(f"   Correct: {correct_count}/{num_questions}", Colors.WHITE)
     
     percentage = (correct_count / num_questions) * 100
     print_colored(f"   Score: {percentage:.0f}%", Colors.BRIGHT_YELLOW)
-    print("=" * 60)
+    write_line("=" * 60)
     
     # Award points based on performance
-    if percentage == 100:
+    points = quiz_points(percentage)
+    if points == 20:
         print_success("\n🌟 Perfect score! You're a math wizard!")
-        points = 20
-    elif percentage >= 80:
+    elif points == 15:
         print_success("\n✨ Excellent work! Great math skills!")
-        points = 15
-    elif percentage >= 60:
+    elif points == 10:
         print_info("\n👍 Good job! Keep practicing!")
-        points = 10
-    elif percentage >= 40:
+    elif points == 5:
         print_info("\n📝 Not bad! Math takes practice.")
-        points = 5
     else:
         print_info("\n🤔 Keep studying! You'll improve!")
-        points = 3
     
     player.add_grade_points('math', points)
     print_colored(f"\nMath grade +{points}!", Colors.BRIGHT_GREEN)
@@ -6,8 +6,9 @@ Multiple choice questions with educational explanations.
 import random
 from game.ui import (
     clear_screen, print_title, print_colored, Colors,
-    get_choice, print_choices, print_success, print_error, print_info
+    print_choices, print_success, print_error, print_info, pause, write_line
 )
+from utils.instrumentation import instrumented, timed_choice, timed_wait
 
 
 # Science questions with multiple choice answers
@@ -105,6 +106,20 @@ SCIENCE_QUESTIONS = [
 ]
 
 
+def quiz_points(percentage):
+    """Get the science grade points for a quiz score (percentage correct)."""
+    if percentage == 100:
+        return 20
+    elif percentage >= 80:
+        return 15
+    elif percentage >= 60:
+        return 10
+    elif percentage >= 40:
+        return 5
+    return 3
+
+
+@instrumented('science_quiz')
 def play_science_quiz(player):
     """Play the science quiz mini-game."""
     clear_screen()
@@ -125,7 +140,7 @@ def play_science_quiz(player):
         
         print_choices(q['options'])
         
-        choice = get_choice("Your answer (1-4): ", 4)
+        choice = timed_choice("Your answer (1-4): ", 4)
         
         if choice - 1 == q['correct']:
             print_success("✓ Correct!")
@@ -137,33 +152,29 @@ def play_science_quiz(player):
             print_colored(f"💡 {q['explanation']}", Colors.CYAN)
         
         if i < total_questions:
-            input("\nPress Enter to continue...")
+            timed_wait(pause, "Press Enter to continue...")
     
     # Calculate results
-    print("\n" + "=" * 60)
+    write_line("\n" + "=" * 60)
     print_colored("📊 Results:", Colors.BRIGHT_CYAN, Colors.BOLD)
     print_colored(f"   Correct: {correct_count}/{total_questions}", Colors.WHITE)
     
     percentage = (correct_count / total_questions) * 100
     print_colored(f"   Score: {percentage:.0f}%", Colors.BRIGHT_YELLOW)
-    print("=" * 60)
+    write_line("=" * 60)
     
     # Award points based on performance
-    if percentage == 100:
+    points = quiz_points(percentage)
+    if points == 20:
         print_success("\n🌟 Perfect score! You're a science genius!")
-        points = 20
-    elif percentage >= 80:
+    elif points == 15:
         print_success("\n✨ Excellent! You really know your science!")
-        points = 15
-    elif percentage >= 60:
+    elif points == 10:
         print_info("\n👍 Good job! Keep learning!")
-        points = 10
-    elif percentage >= 40:
+    elif points == 5:
         print_info("\n📝 Not bad! Science is fascinating!")
-        points = 5
     else:
         print_info("\n🤔 Keep studying! Science is everywhere!")
-        points = 3
     
     player.add_grade_points('science', points)
     print_colored(f"\nScience grade +{points}!", Colors.BRIGHT_GREEN)
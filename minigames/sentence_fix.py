@@ -6,8 +6,9 @@ Find and fix grammatical errors in sentences.
 import random
 from game.ui import (
     clear_screen, print_title, print_colored, Colors,
-    get_choice, print_choices, print_success, print_error, print_info
+    print_choices, print_success, print_error, print_info, pause, write_line
 )
+from utils.instrumentation import instrumented, timed_choice, timed_wait
 
 
 # Sentences with errors and their corrections
@@ -87,6 +88,18 @@ SENTENCE_PROBLEMS = [
 ]
 
 
+def challenge_points(percentage):
+    """Get the English grade points for a grammar challenge score (percentage correct)."""
+    if percentage == 100:
+        return 20
+    elif percentage >= 66:
+        return 15
+    elif percentage >= 33:
+        return 10
+    return 5
+
+
+@instrumented('sentence_fix')
 def play_sentence_fix(player):
     """Play the sentence correction mini-game."""
     clear_screen()
@@ -108,7 +121,7 @@ def play_sentence_fix(player):
         
         print_choices(problem['options'])
         
-        choice = get_choice("Select the correct sentence (1-4): ", 4)
+        choice = timed_choice("Select the correct sentence (1-4): ", 4)
         
         if choice - 1 == problem['correct']:
             print_success("✓ Correct!")
@@ -120,30 +133,27 @@ def play_sentence_fix(player):
             print_colored(f"Explanation: {problem['explanation']}", Colors.CYAN)
         
         if i < total_questions:
-            input("\nPress Enter to continue...")
+            timed_wait(pause, "Press Enter to continue...")
     
     # Calculate results
-    print("\n" + "=" * 60)
+    write_line("\n" + "=" * 60)
     print_colored("📊 Results:", Colors.BRIGHT_CYAN, Colors.BOLD)
     print_colored(f"   Correct: {correct_count}/{total_questions}", Colors.WHITE)
     
     percentage = (correct_count / total_questions) * 100
     print_colored(f"   Score: {percentage:.0f}%", Colors.BRIGHT_YELLOW)
-    print("=" * 60)
+    write_line("=" * 60)
     
     # Award points based on performance
-    if percentage == 100:
+    points = challenge_points(percentage)
+    if points == 20:
         print_success("\n🌟 Perfect score! You're a grammar expert!")
-        points = 20
-    elif percentage >= 66:
+    elif points == 15:
         print_success("\n✨ Great job! You know your grammar!")
-        points = 15
-    elif percentage >= 33:
+    elif points == 10:
         print_info("\n👍 Good effort! Keep studying!")
-        points = 10
     else:
         print_info("\n📝 Keep practicing! Grammar takes time to master.")
-        points = 5
     
     player.add_grade_points('english', points)
     print_colored(f"\nEnglish grade +{points}!", Colors.BRIGHT_GREEN)
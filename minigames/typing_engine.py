@@ -0,0 +1,345 @@
+"""
+Keystroke-level engine for the typing test.
+Timestamps every key, keeps live WPM and accuracy up to date in O(1) per
+keystroke, and redraws only the characters that changed.
+"""
+
+from bisect import bisect_right
+from collections import deque
+
+from game.ui import Colors, CLEAR_SCREEN, get_output_backend
+from utils.alignment import align
+from utils.keyboard import RawKeyboard, ENTER_KEYS, BACKSPACE_KEYS, decode_keys
+from utils.metrics import LatencyHistogram
+
+
+# Rolling WPM covers the most recent keystrokes
+ROLLING_KEYS = 20
+CHARS_PER_WORD = 5
+
+# Minimum time between redraws of the stats line
+STATS_INTERVAL = 0.1
+
+# Character states
+PENDING = 0
+CORRECT = 1
+WRONG = 2
+
+STATE_STYLES = {
+    PENDING: Colors.DIM,
+    CORRECT: Colors.BRIGHT_GREEN,
+    WRONG: Colors.BRIGHT_RED + Colors.UNDERLINE,
+}
+
+
+class TypingSession:
+    """Keystroke-by-keystroke state of typing one target text.
+
+    Every counter is updated incrementally, so each key costs O(1) whatever
+    the length of the text.
+    """
+
+    def __init__(self, target):
+        """Initialize for a target text."""
+        self.target = target
+        self.typed = []
+        self.states = bytearray(len(target))
+        self.keystrokes = 0  # Characters typed (not counting backspaces)
+        self.correct_keystrokes = 0
+        self.correct_chars = 0  # Positions currently typed correctly
+        self.backspaces = 0
+        self.errors = 0
+        self.burst = 0  # Current run of consecutive wrong keys
+        self.longest_burst = 0
+        self.bursts = {}  # Burst length -> count
+        self.intervals = LatencyHistogram()  # Time between keystrokes
+        self.start = None
+        self.last = None
+        self.end = None
+        self._recent = deque(maxlen=ROLLING_KEYS)
+
+    @property
+    def finished(self):
+        """Whether the test is over."""
+        return self.end is not None
+
+    @property
+    def typed_text(self):
+        """The text typed so far."""
+        return ''.join(self.typed)
+
+    def press(self, key, timestamp):
+        """Apply one key; return the index of the character that changed, or None.
+        
+        Named keys from decode_keys ('up', unknown escape sequences) are ignored.
+        """
+        if self.end is not None or len(key) != 1:
+            return None
+        if self.start is None:
+            self.start = timestamp
+        else:
+            self.intervals.record(timestamp - self.last)
+        self.last = timestamp
+
+        if key in ENTER_KEYS:
+            self.finish(timestamp)
+            return None
+
+        if key in BACKSPACE_KEYS:
+            if not self.typed:
+                return None
+            self.typed.pop()
+            index = len(self.typed)
+            if self.states[index] == CORRECT:
+                self.correct_chars -= 1
+            self.states[index] = PENDING
+            self.backspaces += 1
+            return index
+
+        index = len(self.typed)
+        if not key.isprintable() or index >= len(self.target):
+            return None
+
+        self.typed.append(key)
+        self.keystrokes += 1
+        self._recent.append(timestamp)
+        if key == self.target[index]:
+            self.states[index] = CORRECT
+            self.correct_chars += 1
+            self.correct_keystrokes += 1
+            self._end_burst()
+        else:
+            self.states[index] = WRONG
+            self.errors += 1
+            self.burst += 1
+            self.longest_burst = max(self.longest_burst, self.burst)
+
+        if self.correct_chars == len(self.target):
+            # Done once the whole text is right; mistakes at the end still need fixing
+            self.finish(timestamp)
+        return index
+
+    def _end_burst(self):
+        """Record the current error burst, if any."""
+        if self.burst:
+            self.bursts[self.burst] = self.bursts.get(self.burst, 0) + 1
+            self.burst = 0
+
+    def finish(self, timestamp):
+        """End the test."""
+        if self.end is None:
+            self._end_burst()
+            self.end = timestamp
+
+    def elapsed(self, now=None):
+        """Seconds from the first key to the end (or to now)."""
+        if self.start is None:
+            return 0.0
+        end = self.end if self.end is not None else (now if now is not None else self.last)
+        return end - self.start
+
+    def wpm(self, now=None):
+        """Net words per minute over the whole test (correct characters only)."""
+        elapsed = self.elapsed(now)
+        return self.correct_chars / CHARS_PER_WORD / elapsed * 60 if elapsed > 0 else 0.0
+
+    def rolling_wpm(self):
+        """Words per minute over the most recent ROLLING_KEYS keystrokes."""
+        recent = self._recent
+        if len(recent) < 2 or recent[-1] <= recent[0]:
+            return 0.0
+        return (len(recent) - 1) / CHARS_PER_WORD / (recent[-1] - recent[0]) * 60
+
+    def accuracy(self):
+        """Percentage of keystrokes that were correct."""
+        return self.correct_keystrokes / self.keystrokes * 100 if self.keystrokes else 100.0
+
+
+def typed_session(target, typed, start, end):
+    """Build a finished session from a line of text typed between two times.
+    
+    Keys are scored position by position, but the whole line (characters
+    past the end of the target included) is kept as typed_text, so
+    alignment sees exactly what was typed.
+    """
+    session = TypingSession(target)
+    for index, key in enumerate(typed[:len(target)]):
+        session.press(key, end if index else start)
+    extra = max(0, len(typed) - len(target))
+    session.typed = list(typed)
+    session.keystrokes += extra
+    session.errors += extra
+    session.finish(end)
+    session.intervals = LatencyHistogram()  # Line input has no per-key timing
+    return session
+
+
+class SessionTotals:
+    """Running totals over many sessions (the pages of a long passage).
+
+    Speed counts correctly aligned characters, so totals stay meaningful
+    however many pages are typed; nothing but counters is kept.
+    """
+
+    def __init__(self):
+        """Initialize empty totals."""
+        self.sessions = 0
+        self.matches = 0  # Aligned characters typed correctly
+        self.columns = 0  # Aligned characters in total (matches + edits)
+        self.keystrokes = 0
+        self.errors = 0
+        self.backspaces = 0
+        self.elapsed = 0.0
+        self.intervals = LatencyHistogram()
+
+    def add(self, session):
+        """Add a finished session."""
+        alignment = align(session.target, session.typed_text)
+        self.sessions += 1
+        self.matches += alignment.matches
+        self.columns += alignment.length
+        self.keystrokes += session.keystrokes
+        self.errors += session.errors
+        self.backspaces += session.backspaces
+        self.elapsed += session.elapsed()
+        self.intervals.merge(session.intervals)
+
+    def wpm(self):
+        """Net words per minute over every session."""
+        return self.matches / CHARS_PER_WORD / self.elapsed * 60 if self.elapsed > 0 else 0.0
+
+    def accuracy(self):
+        """Percentage of aligned characters typed correctly."""
+        return self.matches / self.columns * 100 if self.columns else 100.0
+
+
+def wrap_offsets(text, width):
+    """Get the index where each line starts when text is word-wrapped at width columns."""
+    starts = [0]
+    start = 0
+    while len(text) - start > width:
+        space = text.rfind(' ', start, start + width)
+        start = space + 1 if space > start else start + width
+        starts.append(start)
+    return starts
+
+
+class TypingView:
+    """Draws a typing session and redraws only what changes.
+
+    The target text is word-wrapped at width columns starting at a fixed
+    screen position, so each character has a known cell that can be
+    rewritten with one cursor-addressed write.
+    """
+
+    def __init__(self, target, title="", backend=None, width=60):
+        """Lay out the target text."""
+        self.target = target
+        self.title = title
+        self.backend = backend
+        self.width = width
+        self.text_row = 4  # First screen row of the target text
+        self.line_starts = wrap_offsets(target, width)
+        self.stats_row = self.text_row + len(self.line_starts) + 1
+        self._last_stats = None
+        self.bytes_written = 0
+
+    def _cell(self, index):
+        """Get the 1-based (row, column) of a character."""
+        line = bisect_right(self.line_starts, index) - 1
+        return self.text_row + line, 3 + index - self.line_starts[line]
+
+    def _char(self, session, index):
+        """Get a character styled for its state."""
+        char = self.target[index]
+        state = session.states[index]
+        if state == WRONG and char == ' ':
+            char = '_'
+        return f"{STATE_STYLES[state]}{char}{Colors.RESET}"
+
+    def _cursor(self, session):
+        """Move the cursor to the next character to type."""
+        row, column = self._cell(min(len(session.typed), len(self.target) - 1))
+        return f"\033[{row};{column}H"
+
+    def _stats(self, session, now):
+        """Get the stats line."""
+        return (f"\033[{self.stats_row};3H\033[K{Colors.BRIGHT_YELLOW}"
+                f"WPM {session.rolling_wpm():5.0f}   Accuracy {session.accuracy():5.1f}%   "
+                f"Errors {session.errors}{Colors.RESET}")
+
+    def _write(self, payload):
+        """Write a payload in one call."""
+        backend = self.backend or get_output_backend()
+        backend.write(payload)
+        backend.flush()
+        self.bytes_written += len(payload.encode('utf-8'))
+
+    def draw(self, session, now=0.0):
+        """Draw the whole screen."""
+        parts = [CLEAR_SCREEN, f"{Colors.BRIGHT_CYAN}{Colors.BOLD}{self.title}{Colors.RESET}\r\n",
+                 f"{Colors.CYAN}Type the text below. Backspace fixes mistakes, Enter finishes early.{Colors.RESET}"]
+        for line, row_start in enumerate(self.line_starts):
+            row, column = self._cell(row_start)
+            row_end = self.line_starts[line + 1] if line + 1 < len(self.line_starts) else len(self.target)
+            parts.append(f"\033[{row};{column}H")
+            parts.extend(self._char(session, index) for index in range(row_start, row_end))
+        parts.append(self._stats(session, now))
+        parts.append(self._cursor(session))
+        self._last_stats = now
+        self._write(''.join(parts))
+
+    def update(self, session, changed, now):
+        """Redraw the changed characters (and the stats line, at most every STATS_INTERVAL)."""
+        parts = []
+        for index in changed:
+            row, column = self._cell(index)
+            parts.append(f"\033[{row};{column}H{self._char(session, index)}")
+        if session.finished or self._last_stats is None or now - self._last_stats >= STATS_INTERVAL:
+            parts.append(self._stats(session, now))
+            self._last_stats = now
+        if parts:
+            parts.append(self._cursor(session))
+            self._write(''.join(parts))
+
+
+def feed_keys(session, view, keys, timestamp):
+    """Apply a batch of keys read together and redraw once; return the changed indexes.
+    
+    The keys share the batch's timestamp (when the read returned), so keys
+    typed faster than the loop reads them record zero intervals.
+    """
+    changed = []
+    for key in keys:
+        index = session.press(key, timestamp)
+        if index is not None:
+            changed.append(index)
+        if session.finished:
+            break
+    view.update(session, changed, timestamp)
+    return changed
+
+
+def run_typing_session(target, title="", keyboard=None, backend=None, timeout=None):
+    """Run a live typing test in the terminal and return the finished TypingSession.
+
+    timeout (seconds of no typing) ends the test early when given.
+    """
+    session = TypingSession(target)
+    view = TypingView(target, title, backend)
+    view.draw(session)
+    pending = ''  # Start of an escape sequence split across reads
+    with keyboard or RawKeyboard() as keys:
+        while not session.finished:
+            now, text = keys.read(timeout)
+            if not text:
+                session.finish(now)
+                break
+            # Arrow and function keys arrive as escape sequences, not typed characters
+            decoded, pending = decode_keys(pending + text)
+            feed_keys(session, view, decoded, now)
+    view.update(session, (), session.end)
+    backend = backend or get_output_backend()
+    backend.write(f"\033[{view.stats_row + 1};1H\n")
+    backend.flush()
+    return session
@@ -3,12 +3,18 @@ Typing test mini-game for English class.
 Measures typing speed and accuracy.
 """
 
+import re
 import time
 import random
 from game.ui import (
     clear_screen, print_title, print_colored, Colors,
-    get_input, print_success, print_error, print_info
+    print_success, print_error, print_info, get_input, write_line
 )
+from utils.instrumentation import instrumented, timed_input, timed_question, timed_wait
+from utils.keyboard import is_interactive
+from utils.alignment import align
+from utils.corpus import DEFAULT_CORPUS_FILE, get_passage_corpus
+from minigames.typing_engine import SessionTotals, run_typing_session, typed_session, wrap_offsets
 
 
 # Sample sentences for typing test
@@ -25,6 +31,10 @@ SENTENCES = [
     "Knowledge is power, and learning never stops.",
 ]
 
+# Endurance mode pages passages from the corpus onto the screen
+PAGE_WIDTH = 60
+PAGE_LINES = 5
+
 
 def calculate_wpm(text, time_taken):
     """Calculate words per minute."""
@@ -34,15 +44,64 @@ def calculate_wpm(text, time_taken):
 
 
 def calculate_accuracy(original, typed):
-    """Calculate typing accuracy percentage."""
+    """Calculate typing accuracy percentage.
+    
+    The typed text is aligned with the original, so a skipped or extra
+    character only costs itself rather than shifting everything after it.
+    """
     if len(original) == 0:
         return 0
     
-    correct_chars = sum(1 for i, char in enumerate(typed) if i < len(original) and char == original[i])
-    accuracy = (correct_chars / len(original)) * 100
-    return round(accuracy, 1)
+    return round(align(original, typed).accuracy(), 1)
+
+
+def passage_pages(passage, width=PAGE_WIDTH, lines=PAGE_LINES):
+    """Yield a passage as pages of word-wrapped lines (a page never spans paragraphs)."""
+    for paragraph in re.split(r'\n\s*\n', passage):
+        text = ' '.join(paragraph.split())
+        if not text:
+            continue
+        starts = wrap_offsets(text, width)
+        for first in range(0, len(starts), lines):
+            end = starts[first + lines] if first + lines < len(starts) else len(text)
+            yield text[starts[first]:end].rstrip()
+
+
+def typing_points(wpm, accuracy):
+    """Get the English grade points for a typing speed and accuracy."""
+    if accuracy >= 95 and wpm >= 40:
+        return 20
+    elif accuracy >= 90 and wpm >= 30:
+        return 15
+    elif accuracy >= 80 and wpm >= 20:
+        return 10
+    elif accuracy >= 70:
+        return 5
+    return 3
+
+
+def award_points(player, wpm, accuracy, game_name='typing_test'):
+    """Show the performance level, award English grade points and mark game_name completed."""
+    points = typing_points(wpm, accuracy)
+    if points == 20:
+        print_success("\n🌟 Outstanding! You're a typing master!")
+    elif points == 15:
+        print_success("\n✨ Excellent work! Very impressive!")
+    elif points == 10:
+        print_info("\n👍 Good job! Keep practicing!")
+    elif points == 5:
+        print_info("\n📝 Not bad! You'll improve with practice.")
+    else:
+        print_error("\n🤔 Keep practicing! Accuracy is important.")
+    
+    player.add_grade_points('english', points)
+    print_colored(f"\nEnglish grade +{points}!", Colors.BRIGHT_GREEN)
+    
+    player.complete_minigame(game_name)
+    return points
 
 
+@instrumented('typing_test')
 def play_typing_test(player):
     """Play the typing test mini-game."""
     clear_screen()
@@ -50,73 +109,123 @@ def play_typing_test(player):
     
     print_colored("Type the following sentence as quickly and accurately as you can!", Colors.CYAN)
     print_colored("Press Enter when you're ready to start...\n", Colors.YELLOW)
-    input()
+    timed_wait(get_input, "")
     
     # Select a random sentence
     sentence = random.choice(SENTENCES)
     
-    print_colored("Type this sentence:", Colors.BRIGHT_BLUE)
-    print_colored(f"\n  \"{sentence}\"\n", Colors.BRIGHT_WHITE, Colors.BOLD)
-    
-    # Start timer
-    start_time = time.time()
-    
-    # Get user input
-    typed = get_input("Start typing: ")
-    
-    # End timer
-    end_time = time.time()
-    time_taken = end_time - start_time
+    if is_interactive():
+        # Live keystroke mode: the clock starts at the first key
+        session = timed_question(run_typing_session, sentence, "⌨️  English Class: Typing Speed Test")
+        typed = session.typed_text
+        time_taken = session.elapsed()
+    else:
+        print_colored("Type this sentence:", Colors.BRIGHT_BLUE)
+        print_colored(f"\n  \"{sentence}\"\n", Colors.BRIGHT_WHITE, Colors.BOLD)
+        
+        # Start timer
+        start_time = time.perf_counter()
+        
+        # Get user input
+        typed = timed_input("Start typing: ")
+        
+        # End timer
+        end_time = time.perf_counter()
+        time_taken = end_time - start_time
     
     # Calculate results
     wpm = calculate_wpm(sentence, time_taken)
     accuracy = calculate_accuracy(sentence, typed)
+    mistakes = align(sentence, typed)
     
     # Display results
-    print("\n" + "=" * 50)
+    write_line("\n" + "=" * 50)
     print_colored("📊 Results:", Colors.BRIGHT_CYAN, Colors.BOLD)
     print_colored(f"   Time: {time_taken:.1f} seconds", Colors.WHITE)
     print_colored(f"   Speed: {wpm} WPM", Colors.BRIGHT_YELLOW)
     print_colored(f"   Accuracy: {accuracy}%", Colors.BRIGHT_GREEN)
-    print("=" * 50)
+    if mistakes.distance:
+        print_colored(f"   Mistakes: {mistakes.substitutions} wrong, {mistakes.deletions} missed, "
+                      f"{mistakes.insertions} extra", Colors.WHITE)
+    write_line("=" * 50)
     
     # Determine performance level and award points
-    points = 0
+    points = award_points(player, wpm, accuracy)
     
-    if accuracy >= 95 and wpm >= 40:
-        print_success("\n🌟 Outstanding! You're a typing master!")
-        points = 20
-    elif accuracy >= 90 and wpm >= 30:
-        print_success("\n✨ Excellent work! Very impressive!")
-        points = 15
-    elif accuracy >= 80 and wpm >= 20:
-        print_info("\n👍 Good job! Keep practicing!")
-        points = 10
-    elif accuracy >= 70:
-        print_info("\n📝 Not bad! You'll improve with practice.")
-        points = 5
-    else:
-        print_error("\n🤔 Keep practicing! Accuracy is important.")
-        points = 3
+    return {
+        'wpm': wpm,
+        'accuracy': accuracy,
+        'mistakes': mistakes.distance,
+        'time': time_taken,
+        'points': points
+    }
+
+
+@instrumented('typing_endurance')
+def play_endurance_typing(player, corpus_file=DEFAULT_CORPUS_FILE, max_pages=None, rng=random):
+    """Play endurance mode: type a whole multi-paragraph passage, page by page."""
+    clear_screen()
+    title = "⌨️  English Class: Endurance Typing"
+    print_title(title)
     
-    player.add_grade_points('english', points)
-    print_colored(f"\nEnglish grade +{points}!", Colors.BRIGHT_GREEN)
+    print_colored("Type a long passage, one page at a time. Speed and accuracy are", Colors.CYAN)
+    print_colored("totalled across every page. The clock only runs while you type.", Colors.CYAN)
+    print_colored("Press Enter when you're ready to start...\n", Colors.YELLOW)
+    timed_wait(get_input, "")
+    
+    # Only the chosen passage is read from the memory-mapped corpus
+    passage = get_passage_corpus(corpus_file).random_passage(rng)
+    totals = SessionTotals()
+    live = is_interactive()
     
-    player.complete_minigame('typing_test')
+    for number, page in enumerate(passage_pages(passage), 1):
+        if max_pages is not None and number > max_pages:
+            break
+        heading = f"{title}   Page {number}"
+        if totals.sessions:
+            heading += f"   {totals.wpm():.0f} WPM   {totals.accuracy():.1f}%"
+        
+        if live:
+            session = timed_question(run_typing_session, page, heading)
+        else:
+            print_colored(f"\n{heading}", Colors.BRIGHT_BLUE)
+            print_colored(f"\n  \"{page}\"\n", Colors.BRIGHT_WHITE, Colors.BOLD)
+            start_time = time.perf_counter()
+            typed = timed_input("Type this page: ")
+            session = typed_session(page, typed, start_time, time.perf_counter())
+        totals.add(session)
+    
+    wpm = round(totals.wpm())
+    accuracy = round(totals.accuracy(), 1)
+    
+    write_line("\n" + "=" * 50)
+    print_colored("📊 Endurance Results:", Colors.BRIGHT_CYAN, Colors.BOLD)
+    print_colored(f"   Pages: {totals.sessions}", Colors.WHITE)
+    print_colored(f"   Time: {totals.elapsed:.1f} seconds", Colors.WHITE)
+    print_colored(f"   Speed: {wpm} WPM", Colors.BRIGHT_YELLOW)
+    print_colored(f"   Accuracy: {accuracy}%", Colors.BRIGHT_GREEN)
+    write_line("=" * 50)
+    
+    points = award_points(player, wpm, accuracy, 'typing_endurance')
     
     return {
+        'pages': totals.sessions,
         'wpm': wpm,
         'accuracy': accuracy,
-        'time': time_taken,
+        'time': totals.elapsed,
         'points': points
     }
 
 
 if __name__ == "__main__":
-    # Test the game
+    # Test the game (pass "endurance" for the long-passage mode)
+    import sys
     from game.player import Player
     
     test_player = Player("Test Student")
-    result = play_typing_test(test_player)
+    if len(sys.argv) > 1 and sys.argv[1] == "endurance":
+        result = play_endurance_typing(test_player)
+    else:
+        result = play_typing_test(test_player)
     print(f"\nTest results: {result}")
     print(f"Player stats: {test_player.get_stats_summary()}")
@@ -1,91 +1,236 @@
 """
 Wordle-style word puzzle mini-game.
-Player has 6 attempts to guess a 5-letter word.
+Player has 6 attempts to guess a 5-letter word. Longer or shorter words
+(4-8 letters) and several boards at once (Quordle/Octordle style, one
+guess played on every board) are supported too.
 """
 
-from utils.wordlist import load_words, get_random_word, get_word_hints, format_guess_with_hints
+import random
+
+from utils.feedback_cache import get_feedback_cache, MAX_CACHED_LENGTH
+from utils.hint_engine import HintEngine, decode_feedback
+from utils.wordlist import DEFAULT_WORD_FILE, get_word_index
 from game.ui import (
-    clear_screen, print_title, print_colored, Colors,
-    get_input, print_success, print_error, print_info
+    print_colored, Colors, FrameBuffer,
+    print_success, print_error, print_info
 )
+from utils.instrumentation import instrumented, timed_input
 
 
-def play_word_puzzle(player):
-    """Play the Wordle-style word puzzle game."""
-    clear_screen()
-    print_title("📚 English Class: Word Puzzle Challenge")
+MIN_LENGTH = 4
+MAX_LENGTH = 8
+DEFAULT_LENGTH = 5
+DEFAULT_ATTEMPTS = 6
+BOARDS_PER_ROW = 4
+
+HINT_COLORS = {
+    'correct': Colors.BRIGHT_GREEN,
+    'present': Colors.BRIGHT_YELLOW,
+    'absent': Colors.BRIGHT_BLACK,
+}
+
+
+def word_file(length):
+    """Get the word list file for a word length."""
+    return DEFAULT_WORD_FILE if length == DEFAULT_LENGTH else f'data/words_{length}.txt'
+
+
+def default_attempts(boards):
+    """Get the number of attempts for a number of boards (6, 9 for 4 boards, 13 for 8)."""
+    return DEFAULT_ATTEMPTS + boards - 1
+
+
+def puzzle_points(solved, boards=1, guesses=DEFAULT_ATTEMPTS):
+    """Get the English grade points for solving some of the boards in a number of guesses."""
+    if solved == boards:
+        return max(10, 25 - (guesses - (boards - 1)) * 3)
+    return 5 + 10 * solved // boards
+
+
+class WordPuzzle:
+    """State of one word puzzle over one or more boards.
     
-    print_colored("Welcome to Word Master! Guess the 5-letter word in 6 tries.", Colors.CYAN)
-    print_colored("Green = correct position, Yellow = wrong position, Gray = not in word\n", Colors.WHITE)
+    Guesses are scored from the memory-mapped feedback cache when the word
+    length fits it; otherwise (or for words the cache does not hold) every
+    board is scored in a single HintEngine pass.
+    """
     
-    # Load words and select target
-    words = load_words()
-    target_word = get_random_word(words)
+    def __init__(self, length=DEFAULT_LENGTH, boards=1, attempts=None, rng=random, targets=None):
+        """Pick the target words and set up the boards."""
+        if not MIN_LENGTH <= length <= MAX_LENGTH:
+            raise ValueError(f"Word length must be between {MIN_LENGTH} and {MAX_LENGTH}")
+        self.length = length
+        self.words = get_word_index(word_file(length))
+        if targets is None:
+            targets = rng.sample(self.words.by_length(length), boards)
+        self.targets = tuple(target.upper() for target in targets)
+        self.attempts = attempts or default_attempts(len(self.targets))
+        self.guesses = []
+        self.codes = [[] for _ in self.targets]  # Feedback per board until it is solved
+        self.solved_at = [None] * len(self.targets)  # Attempt that solved each board
+        self._engine = HintEngine(self.targets)
+        self._cache = get_feedback_cache(word_file(length), length) if length <= MAX_CACHED_LENGTH else None
+        self._solved_code = 3 ** length - 1
     
-    attempts = 6
-    guesses = []
+    @property
+    def solved_count(self):
+        """Number of boards solved so far."""
+        return sum(attempt is not None for attempt in self.solved_at)
     
-    for attempt in range(1, attempts + 1):
-        print_colored(f"\nAttempt {attempt}/{attempts}", Colors.BRIGHT_BLUE)
-        
-        # Get valid guess
-        while True:
-            guess = get_input("Enter your 5-letter guess: ").upper()
-            
-            if len(guess) != 5:
-                print_error("Please enter exactly 5 letters!")
-                continue
-            
-            if not guess.isalpha():
-                print_error("Please use only letters!")
-                continue
-            
-            if guess not in words:
-                print_error("That's not in our word list! Try another word.")
-                continue
-            
-            break
+    @property
+    def won(self):
+        """Whether every board is solved."""
+        return self.solved_count == len(self.targets)
+    
+    @property
+    def finished(self):
+        """Whether the game is over (won or out of attempts)."""
+        return self.won or len(self.guesses) >= self.attempts
+    
+    def check_guess(self, guess):
+        """Get an error message for an invalid guess, or None if it is valid."""
+        if len(guess) != self.length:
+            return f"Please enter exactly {self.length} letters!"
+        if not guess.isalpha():
+            return "Please use only letters!"
+        if guess.upper() not in self.words:
+            return "That's not in our word list! Try another word."
+        return None
+    
+    def guess(self, guess):
+        """Play a guess on every unsolved board and return its feedback codes."""
+        guess = guess.upper()
+        error = self.check_guess(guess)
+        if error:
+            raise ValueError(error)
         
-        # Check the guess
-        hints = get_word_hints(target_word, guess)
-        formatted_guess = format_guess_with_hints(guess, hints)
+        codes = self._cached_codes(guess) or self._engine.score(guess)
+        self.guesses.append(guess)
+        attempt = len(self.guesses)
+        for board, code in enumerate(codes):
+            if self.solved_at[board] is None:
+                self.codes[board].append(code)
+                if code == self._solved_code:
+                    self.solved_at[board] = attempt
+        return codes
+    
+    def _cached_codes(self, guess):
+        """Look up a guess's feedback codes in the cache, or None if any board is not cached."""
+        if self._cache is None:
+            return None
+        codes = [self._cache.code(guess, target) for target in self.targets]
+        return None if None in codes else codes
+    
+    def board_hints(self, board):
+        """Get (guess, hints) for each guess played on a board."""
+        return [
+            (guess, decode_feedback(code, self.length))
+            for guess, code in zip(self.guesses, self.codes[board])
+        ]
+    
+    def points(self):
+        """English grade points earned (the classic scale for a single board)."""
+        return puzzle_points(self.solved_count, len(self.targets), len(self.guesses))
+
+
+def render_puzzle(puzzle, frame, message='', message_color=Colors.WHITE):
+    """Compose every board into one frame and flush it."""
+    boards = len(puzzle.targets)
+    width = max(puzzle.length * 2 + 1, 9)
+    gap = ' ' * 3
+    
+    title = "📚 English Class: Word Puzzle Challenge"
+    frame.add_line("=" * 60)
+    frame.add_line(title.center(60), Colors.BRIGHT_CYAN, Colors.BOLD)
+    frame.add_line("=" * 60)
+    frame.add_line()
+    frame.add_line("Green = correct position, Yellow = wrong position, Gray = not in word", Colors.WHITE)
+    frame.add_line()
+    
+    for first in range(0, boards, BOARDS_PER_ROW):
+        group = range(first, min(first + BOARDS_PER_ROW, boards))
+        for board in group:
+            label = f"Board {board + 1}" if boards > 1 else "Your guesses"
+            solved = puzzle.solved_at[board] is not None
+            color = Colors.BRIGHT_GREEN if solved else Colors.BRIGHT_BLUE
+            frame.add(f"{label + (' ✓' if solved else ''):<{width}}{gap}", color)
+        frame.add_line()
         
-        guesses.append((guess, hints))
+        hints = [puzzle.board_hints(board) for board in group]
+        for row in range(puzzle.attempts):
+            for board_hints in hints:
+                if row < len(board_hints):
+                    guess, guess_hints = board_hints[row]
+                    for char, hint in zip(guess, guess_hints):
+                        frame.add(f"{char} ", HINT_COLORS[hint])
+                elif row == len(board_hints) and len(board_hints) == len(puzzle.guesses):
+                    frame.add("_ " * puzzle.length, Colors.DIM)
+                else:
+                    frame.add("  " * puzzle.length)
+                frame.add(' ' * (width - puzzle.length * 2) + gap)
+            frame.add_line()
+        frame.add_line()
+    
+    frame.add_line(f"Attempt {min(len(puzzle.guesses) + 1, puzzle.attempts)}/{puzzle.attempts}"
+                   f"   Boards solved: {puzzle.solved_count}/{boards}", Colors.BRIGHT_BLUE)
+    frame.add_line(message, message_color)
+    return frame.flush()
+
+
+@instrumented('word_puzzle')
+def play_word_puzzle(player, length=DEFAULT_LENGTH, boards=1, attempts=None):
+    """Play the Wordle-style word puzzle game."""
+    puzzle = WordPuzzle(length, boards, attempts)
+    frame = FrameBuffer()
+    
+    if boards > 1:
+        message = (f"Guess all {boards} {length}-letter words in {puzzle.attempts} tries. "
+                   "Each guess plays on every board!")
+    else:
+        message = f"Welcome to Word Master! Guess the {length}-letter word in {puzzle.attempts} tries."
+    message_color = Colors.CYAN
+    
+    while not puzzle.finished:
+        render_puzzle(puzzle, frame, message, message_color)
         
-        # Display all previous guesses
-        print("\nYour guesses:")
-        for g, h in guesses:
-            print("  " + format_guess_with_hints(g, h))
+        guess = timed_input(f"Enter your {length}-letter guess: ").upper()
+        error = puzzle.check_guess(guess)
+        if error:
+            message, message_color = f"✗ {error}", Colors.BRIGHT_RED
+            continue
         
-        # Check if won
-        if guess == target_word:
-            print_success(f"\n🎉 Congratulations! You guessed the word: {target_word}")
-            print_colored(f"You solved it in {attempt} attempt(s)!", Colors.BRIGHT_GREEN)
-            
-            # Award points based on attempts
-            points = max(10, 25 - (attempt * 3))
-            player.add_grade_points('english', points)
-            print_success(f"English grade +{points}!")
-            
-            player.complete_minigame('word_puzzle')
-            return True
+        puzzle.guess(guess)
+        message = ''
     
-    # Failed to guess
-    print_error(f"\n😞 Out of attempts! The word was: {target_word}")
-    print_colored("Better luck next time!", Colors.YELLOW)
+    render_puzzle(puzzle, frame)
+    points = puzzle.points()
+    player.add_grade_points('english', points)
+    player.complete_minigame('word_puzzle')
     
-    player.add_grade_points('english', 5)
-    print_info("English grade +5 for trying!")
+    if puzzle.won:
+        words = ', '.join(puzzle.targets)
+        print_success(f"🎉 Congratulations! You guessed {'every word' if boards > 1 else 'the word'}: {words}")
+        print_colored(f"You solved it in {len(puzzle.guesses)} attempt(s)!", Colors.BRIGHT_GREEN)
+        print_success(f"English grade +{points}!")
+        return True
     
-    player.complete_minigame('word_puzzle')
+    # Failed to guess
+    missed = [target for target, attempt in zip(puzzle.targets, puzzle.solved_at) if attempt is None]
+    print_error(f"😞 Out of attempts! The word{'s were' if len(missed) > 1 else ' was'}: {', '.join(missed)}")
+    print_colored("Better luck next time!", Colors.YELLOW)
+    print_info(f"English grade +{points} for trying!")
     return False
 
 
 if __name__ == "__main__":
-    # Test the game
+    # Test the game (optionally: word length and number of boards)
+    import sys
     from game.player import Player
     
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_LENGTH
+    boards = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    
     test_player = Player("Test Student")
-    result = play_word_puzzle(test_player)
+    result = play_word_puzzle(test_player, length, boards)
     print(f"\nGame result: {'Won' if result else 'Lost'}")
     print(f"Player stats: {test_player.get_stats_summary()}")
@@ -51,6 +51,40 @@ def test_player():
         player.add_item("Pencil")
         assert player.has_item("Pencil")
         
+        player.change_relationship("Alex", 10)
+        assert player.get_relationship("Alex") == 60
+        assert player.get_relationship("Nobody") == 50
+        
+        # Snapshots are cheap and restore the full state
+        snapshot = player.snapshot()
+        player.add_grade_points('math', 10)
+        player.complete_minigame('math_quiz')
+        player.remove_item("Pencil")
+        player.restore(snapshot)
+        assert player.grades['math'] == 85
+        assert not player.has_completed_minigame('math_quiz')
+        assert player.has_item("Pencil")
+        
+        # Choice history is bounded
+        from game.player import CHOICE_HISTORY_LIMIT
+        for i in range(CHOICE_HISTORY_LIMIT + 5):
+            player.add_choice(f"Choice {i}")
+        assert len(player.choices_made) == CHOICE_HISTORY_LIMIT
+        assert player.choice_count == CHOICE_HISTORY_LIMIT + 5
+        
+        # Collection views reject writes instead of silently dropping them
+        for view in (player.grades, player.relationships):
+            try:
+                view['math'] = 100
+                assert False, "Views should be read-only"
+            except TypeError:
+                pass
+        
+        # Non-string values are stored as given
+        player.add_item(42)
+        player.add_achievement(("Honor roll", 1))
+        assert player.has_item(42) and ("Honor roll", 1) in player.achievements
+        
         print("✓ Player tests passed")
         return True
     except Exception as e:
@@ -122,6 +156,53 @@ def test_story():
         assert "first_period" in story.story_nodes
         assert "end_of_day" in story.story_nodes
         
+        # The compiled graph is shared, and dynamic text is rendered lazily
+        other = Story(Player("Other"), TimeSystem())
+        assert other.story_nodes is story.story_nodes
+        player.add_grade_points('math', 10)
+        ending = story.story_nodes["end_of_day"].render(player, time_sys)
+        assert "Student Name: Test" in ending
+        assert "Math:     85%" in ending
+        
+        # A story built on its own graph plays that graph, in the terminal and the server
+        import asyncio
+        import game.story as story_module
+        from game.story import StoryNode
+        from game.server import SessionIO, play_session
+        custom = {
+            "start": StoryNode("start", "Custom start", [("Left", "left"), ("Right", "right")]),
+            "left": StoryNode("left", "Went left", end_game=True),
+            "right": StoryNode("right", "Went right", end_game=True),
+        }
+        custom_story = Story(Player("Custom"), TimeSystem())
+        custom_story.story_nodes = custom
+        saved = story_module.get_choice, story_module.clear_screen
+        story_module.get_choice = lambda prompt, count: 2
+        story_module.clear_screen = lambda: None
+        try:
+            assert custom_story.play_node("start") == "right", "Story plays its own graph"
+        finally:
+            story_module.get_choice, story_module.clear_screen = saved
+        
+        class ScriptedIO(SessionIO):
+            """Session IO that records text and always picks the first option."""
+            
+            def __init__(self):
+                self.text = []
+            
+            async def send_text(self, text):
+                self.text.append(text)
+            
+            async def choose(self, options):
+                return 0
+            
+            async def pause(self):
+                pass
+        
+        io = ScriptedIO()
+        asyncio.run(play_session(io, Player("Custom"), TimeSystem(), story_nodes=custom))
+        assert io.text == ["Custom start", "Went left"], "Server plays the given graph"
+        
         print(f"  Created {len(story.story_nodes)} story nodes")
         print("✓ Story system tests passed")
         return True
@@ -149,6 +230,1062 @@ def test_game_engine():
         return False
 
 
+def test_simulation():
+    """Test headless story simulation."""
+    print("\nTesting story simulation...")
+    
+    try:
+        from game.simulation import StorySimulator, ScriptedPolicy, summarize
+        
+        simulator = StorySimulator(minigame_scores=1.0)
+        
+        result = simulator.run(ScriptedPolicy([2, 2, 1, 1, 1, 1, 1]))
+        assert result['ending'] == "end_of_day"
+        assert result['path'][0] == "start"
+        assert result['stats']['gpa'] > 3.0
+        
+        results = simulator.run_batch(200, seed=42)
+        assert len(results) == 200
+        assert results == simulator.run_batch(200, seed=42)
+        assert summarize(results)['runs'] == 200
+        
+        exhaustive = simulator.run_exhaustive(seed=0)
+        assert len(exhaustive) == len(set(r['path'] for r in exhaustive))
+        
+        print(f"  Explored {len(exhaustive)} distinct choice paths")
+        print("✓ Simulation tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Simulation test failed: {e}")
+        return False
+
+
+def test_batch_runner():
+    """Test multiprocess batch simulation."""
+    print("\nTesting batch runner...")
+    
+    try:
+        from game.batch import run_random_sweep, merge_reports
+        
+        single = run_random_sweep(400, seed=7, workers=1, shard_size=100)
+        pooled = run_random_sweep(400, seed=7, workers=2, shard_size=100)
+        assert single == pooled
+        assert single['runs'] == 400
+        assert sum(single['histograms']['gpa'].values()) == 400
+        assert merge_reports([single, single])['runs'] == 800
+        
+        print("✓ Batch runner tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Batch runner test failed: {e}")
+        return False
+
+
+def test_story_analysis():
+    """Test static story graph analysis."""
+    print("\nTesting story analysis...")
+    
+    try:
+        from game.story import StoryNode, get_story_graph
+        from game.story_analysis import analyze_story, has_errors
+        
+        report = analyze_story(get_story_graph())
+        assert not has_errors(report)
+        assert report['unreachable'] == []
+        assert report['endings'] == ["end_of_day"]
+        assert report['shortest_path'][0] == "start"
+        assert len(report['longest_path']) >= len(report['shortest_path'])
+        
+        broken = {
+            "start": StoryNode("start", "", [("Loop", "a"), ("Oops", "missing")]),
+            "a": StoryNode("a", "", [("Back", "start"), ("Stuck", "b")]),
+            "b": StoryNode("b", ""),
+            "orphan": StoryNode("orphan", "", end_game=True),
+        }
+        report = analyze_story(broken)
+        assert report['dangling'] == [("start", "missing")]
+        assert report['unreachable'] == ["orphan"]
+        assert report['cycles'] == [["a", "start"]]
+        assert report['dead_ends'] == ["b"]
+        assert report['distinct_paths'] is None
+        assert has_errors(report)
+        
+        # Play stops at an ending, so its choices are never followed
+        epilogue = {
+            "start": StoryNode("start", "", [("Stop", "early"), ("Go on", "late")]),
+            "early": StoryNode("early", "", [("Continue", "late")], end_game=True),
+            "late": StoryNode("late", "", end_game=True),
+        }
+        report = analyze_story(epilogue)
+        assert report['distinct_paths'] == 2, "Endings are sinks for path counts"
+        assert len(report['longest_path']) == 2, "Endings are sinks for the longest path"
+        
+        print("✓ Story analysis tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Story analysis test failed: {e}")
+        return False
+
+
+def test_save_load():
+    """Test binary save and load of game sessions."""
+    print("\nTesting save/load...")
+    
+    try:
+        import tempfile
+        from game.player import Player
+        from game.save import (
+            dump_session, load_session, save_sessions, load_sessions,
+            SaveError
+        )
+        from utils.time_system import TimeSystem
+        
+        player = Player("Saved Student")
+        player.add_grade_points('science', 12)
+        player.set_relationship("Jordan", 60)
+        player.add_item("Calculator")
+        player.add_achievement("Made a new friend")
+        player.visit_location("Math Classroom")
+        player.complete_minigame('math_quiz')
+        player.set_flag('met_principal')
+        player.add_choice("Sit with your friends")
+        time_sys = TimeSystem()
+        time_sys.advance_period()
+        time_sys.add_minutes(20)
+        time_sys.mark_late()
+        
+        data = dump_session(player, time_sys, "lunch_time")
+        loaded, loaded_time, node_id = load_session(data)
+        assert node_id == "lunch_time"
+        assert loaded.get_stats_summary() == player.get_stats_summary()
+        assert loaded.grades == player.grades
+        assert loaded.relationships == player.relationships
+        assert loaded.has_visited("Math Classroom")
+        assert loaded.has_flag('met_principal')
+        assert loaded.choices_made == player.choices_made
+        assert (loaded_time.current_period, loaded_time.minutes_elapsed, loaded_time.is_late) == (2, 20, True)
+        
+        # Unknown fields from newer versions are skipped
+        newer = data + bytes((200, 3, 0, 0, 0)) + b"new"
+        assert load_session(newer)[2] == "lunch_time"
+        
+        # Saves from format version 1 (16-bit field lengths) still load
+        import struct
+        old_parts = [data[:4], bytes((1,))]
+        offset = 5
+        while offset < len(data):
+            tag, length = struct.unpack_from('<BI', data, offset)
+            offset += 5
+            old_parts.append(struct.pack('<BH', tag, length) + data[offset:offset + length])
+            offset += length
+        old_player, _, old_node = load_session(b''.join(old_parts))
+        assert old_player.grades == player.grades and old_node == "lunch_time", "Version 1 save"
+        
+        unknown_flag = struct.pack('<BI', 9, 6) + struct.pack('<HH', 1, 1) + b"x" + bytes((9,))
+        
+        bad_inputs = [
+            lambda: load_session(b"nope"),
+            lambda: load_session(data[:4] + bytes((99,)) + data[5:]),  # Unknown format version
+            lambda: load_session(data[:5] + unknown_flag),  # Unknown flag kind
+        ]
+        for value in ([1, 2], 1 << 70, "x" * 70000):
+            unsaveable = Player("Flagged")
+            unsaveable.set_flag('odd', value)
+            bad_inputs.append(lambda player=unsaveable: dump_session(player, time_sys))
+        for bad_input in bad_inputs:
+            try:
+                bad_input()
+                assert False, "Expected SaveError"
+            except SaveError:
+                pass
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sessions.sav")
+            assert save_sessions(path, [(player, time_sys, "start")] * 50) == 50
+            sessions = load_sessions(path)
+            assert len(sessions) == 50
+            assert sessions[-1][0].name == "Saved Student"
+        
+        print(f"  Session size: {len(data)} bytes")
+        print("✓ Save/load tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Save/load test failed: {e}")
+        return False
+
+
+def test_game_server():
+    """Test the asyncio session server with loopback clients."""
+    print("\nTesting game server...")
+    
+    try:
+        import asyncio
+        from game.server import run_load_test
+        from utils.metrics import LatencyHistogram
+        
+        histogram = LatencyHistogram()
+        for ms in (1, 2, 3, 50):
+            histogram.record(ms / 1000)
+        assert histogram.count == 4
+        assert histogram.percentile(50) <= 0.0025
+        assert histogram.percentile(100) == 0.05
+        
+        report = asyncio.run(run_load_test(sessions=20, concurrency=10, seed=1))
+        assert report['completed'] == 20
+        assert report['server']['completed_sessions'] == 20
+        assert report['server']['active_sessions'] == 0
+        assert report['server']['turn_latency']['count'] > 0
+        
+        async def misbehave():
+            """Send a superscript-digit answer, then a line over the stream limit."""
+            from game.server import GameServer
+            server = GameServer()
+            host, port = await server.start('127.0.0.1', 0)
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"Tester\n")
+            answered = []
+            while True:
+                line = (await reader.readline()).decode('utf-8')
+                if not line:
+                    break
+                if line.startswith('ERROR'):
+                    answered.append(line.strip())
+                if line.startswith('ASK') and not answered:
+                    writer.write("\u00b2\n".encode('utf-8'))
+                elif line.startswith('ASK') and len(answered) == 1:
+                    writer.write(b"1" * 100000 + b"\n")
+            writer.close()
+            await server.stop()
+            return answered, server
+        
+        answered, server = asyncio.run(misbehave())
+        assert answered[0].startswith("ERROR Please enter a number")
+        assert answered[1] == "ERROR Line too long, closing the connection."
+        assert server.disconnected == 1 and not server.sessions
+        
+        print(f"  Served {report['sessions']} sessions ({report['sessions_per_s']}/s)")
+        print("✓ Game server tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Game server test failed: {e}")
+        return False
+
+
+def test_output_backends():
+    """Test pluggable UI output backends."""
+    print("\nTesting output backends...")
+    
+    try:
+        from game.ui import (
+            clear_screen, print_colored, print_title, output_backend,
+            BufferBackend, TranscriptBackend, NullBackend, CLEAR_SCREEN
+        )
+        
+        with output_backend(BufferBackend()) as buffer:
+            clear_screen()
+            print_colored("Hello", end='')
+        assert buffer.getvalue().startswith(CLEAR_SCREEN)
+        assert "Hello" in buffer.getvalue()
+        
+        with output_backend(TranscriptBackend()) as transcript:
+            print_title("First")
+            clear_screen()
+            print_colored("Second")
+        screens = transcript.get_screens()
+        assert len(screens) == 2
+        assert "First" in screens[0] and "Second" in screens[1]
+        
+        with output_backend(NullBackend()):
+            print_title("Nothing to see")
+        
+        print("✓ Output backend tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Output backend test failed: {e}")
+        return False
+
+
+def test_frame_buffer():
+    """Test diff-based frame rendering."""
+    print("\nTesting frame buffer...")
+    
+    try:
+        from game.ui import FrameBuffer, BufferBackend, Colors
+        from utils.hallway import Hallway
+        
+        output = BufferBackend()
+        frame = FrameBuffer(output)
+        
+        # Same-colored text is coalesced into one color code and one reset
+        frame.add("ab", Colors.RED)
+        frame.add_line("cd", Colors.RED)
+        frame.flush()
+        assert output.getvalue().count(Colors.RED) == 1
+        assert output.getvalue().count(Colors.RESET) == 1
+        
+        # A hallway move only redraws the changed lines
+        hallway = Hallway()
+        frame.invalidate()
+        frame.add(hallway.render())
+        full_bytes = frame.flush()
+        hallway.move('d')
+        frame.add(hallway.render())
+        diff_bytes = frame.flush()
+        assert 0 < diff_bytes < full_bytes / 4
+        
+        print(f"  Hallway frame: {full_bytes} bytes full, {diff_bytes} bytes after a move")
+        print("✓ Frame buffer tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Frame buffer test failed: {e}")
+        return False
+
+
+def test_type_text():
+    """Test the batched typing effect."""
+    print("\nTesting typing effect...")
+    
+    try:
+        import io
+        from game.ui import type_text, output_backend, TerminalBackend, set_typing_delay
+        
+        text = "The quick brown fox jumps over the lazy dog."
+        stream = io.StringIO()
+        with output_backend(TerminalBackend(stream)):
+            stats = type_text(text, delay=0.0005)
+        assert stream.getvalue() == text + "\n"
+        assert 1 < stats.writes <= len(text.split()) + 1
+        assert not stats.skipped
+        
+        # Zero-delay mode writes everything at once
+        stream = io.StringIO()
+        set_typing_delay(0)
+        try:
+            with output_backend(TerminalBackend(stream)):
+                stats = type_text(text)
+        finally:
+            set_typing_delay(None)
+        assert stream.getvalue() == text + "\n"
+        assert stats.writes == 1 and stats.waits == 0
+        
+        print("✓ Typing effect tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Typing effect test failed: {e}")
+        return False
+
+
+def test_word_index():
+    """Test the shared word index."""
+    print("\nTesting word index...")
+    try:
+        import tempfile
+        from utils.wordlist import WordIndex, get_word_index, load_words
+        
+        index = get_word_index()
+        assert get_word_index() is index, "Index should be cached per process"
+        assert list(index.words) == list(dict.fromkeys(load_words())), "Index should match load_words"
+        assert "ABOUT" in index and "QQQQQ" not in index, "Membership should use the word set"
+        assert index.random_word() in index, "Random word should come from the list"
+        
+        small = WordIndex(["crane", "Crate", "crane", "toe"])
+        assert small.words == ("CRANE", "CRATE", "TOE"), "Words should be uppercased and deduplicated"
+        assert small.packed is None and small.random_word() in small, "Mixed lengths should still pick"
+        assert small.by_length(5) == ("CRANE", "CRATE"), "Per-length index should group words"
+        assert small.with_letter_at(3, 't') == {"CRATE"}, "Position index should find letters"
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "words.txt")
+            with open(path, "w") as f:
+                f.write("apple\nberry\n")
+            first = get_word_index(path)
+            assert first.words == ("APPLE", "BERRY"), "Custom file should load"
+            with open(path, "w") as f:
+                f.write("lemon\n")
+            os.utime(path, ns=(0, 1))
+            assert get_word_index(path).words == ("LEMON",), "Changed file should reload"
+        
+        print("✓ Word index tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Word index test failed: {e}")
+        return False
+
+
+def test_hint_engine():
+    """Test batched hint scoring against get_word_hints."""
+    print("\nTesting hint engine...")
+    try:
+        import tempfile
+        from utils.wordlist import get_word_hints, get_word_index
+        from utils.hint_engine import (
+            FeedbackMatrix, feedback_code, feedback_matrix, decode_feedback, encode_hints
+        )
+        
+        # Duplicate letters in guesses and answers
+        words = ["SPEED", "ERASE", "EERIE", "CREEP", "ABBEY", "BABES", "KEBAB", "ALLEE"]
+        words += list(get_word_index().by_length(5))[:40]
+        matrix = feedback_matrix(words)
+        for guess in words:
+            for answer in words:
+                expected = get_word_hints(answer, guess)
+                assert matrix.hints(guess, answer) == expected, f"Mismatch for {guess}/{answer}"
+                assert feedback_code(guess, answer) == encode_hints(expected), "Scalar code mismatch"
+        
+        assert decode_feedback(feedback_code("SPEED", "SPEED"), 5) == ['correct'] * 5, "Exact match"
+        assert matrix.codes.typecode == 'B', "5-letter codes should fit a byte"
+        
+        long_words = ["ABRACADABRA"[:10], "CABBAGEBAG", "BAGGAGEBAD"]
+        long_matrix = feedback_matrix(long_words)
+        assert long_matrix.codes.typecode == 'H', "10-letter codes need 16 bits"
+        for guess in long_words:
+            for answer in long_words:
+                assert long_matrix.hints(guess, answer) == get_word_hints(answer, guess), "Long mismatch"
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "matrix.bin")
+            matrix.save(path)
+            loaded = FeedbackMatrix.load(path)
+            assert loaded.codes == matrix.codes and loaded.guesses == matrix.guesses, "Matrix should round-trip"
+        
+        print("✓ Hint engine tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Hint engine test failed: {e}")
+        return False
+
+
+def test_feedback_cache():
+    """Test the memory-mapped feedback cache."""
+    print("\nTesting feedback cache...")
+    try:
+        import tempfile
+        from utils.wordlist import get_word_hints, lookup_hints
+        from utils.feedback_cache import get_feedback_cache, cache_path
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "words.txt")
+            with open(path, "w") as f:
+                f.write("speed\nerase\ncreep\nabbey\n")
+            
+            cache = get_feedback_cache(path)
+            assert os.path.exists(cache_path(path)), "Cache file should be written"
+            assert get_feedback_cache(path) is cache, "Cache should be shared per process"
+            for guess in cache.words:
+                for answer in cache.words:
+                    assert cache.hints(guess, answer) == get_word_hints(answer, guess), "Cached hints mismatch"
+                    assert lookup_hints(answer, guess, path) == get_word_hints(answer, guess), "Lookup mismatch"
+            assert cache.hints("SPEED", "QUILT") is None, "Unknown words are not cached"
+            assert lookup_hints("QUILT", "SPEED", path) == get_word_hints("QUILT", "SPEED"), "Lookup falls back"
+            
+            with open(path, "w") as f:
+                f.write("speed\nquilt\n")
+            os.utime(path, ns=(0, 1))
+            rebuilt = get_feedback_cache(path)
+            assert rebuilt is not cache and rebuilt.words == ("SPEED", "QUILT"), "Changed file should rebuild"
+            assert rebuilt.hints("SPEED", "QUILT") == get_word_hints("QUILT", "SPEED"), "Rebuilt hints mismatch"
+            assert cache._mapping is None, "Replaced cache should be unmapped"
+            assert not [name for name in os.listdir(os.path.dirname(cache_path(path)))
+                        if name.endswith(".tmp")], "No temporary files should be left"
+            rebuilt.close()
+            cache.close()
+            
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("caf\u00e9s\nspeed\nerase\n")
+            os.utime(path, ns=(0, 2))
+            ascii_only = get_feedback_cache(path)
+            assert ascii_only.words == ("SPEED", "ERASE"), "Non-ASCII words are left out of the cache"
+            assert lookup_hints("CAF\u00c9S", "SPEED", path) == get_word_hints("CAF\u00c9S", "SPEED"), \
+                "Non-ASCII lookups fall back"
+            ascii_only.close()
+        
+        print("✓ Feedback cache tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Feedback cache test failed: {e}")
+        return False
+
+
+def test_wordle_solver():
+    """Test the entropy solver and difficulty ratings."""
+    print("\nTesting Wordle solver...")
+    try:
+        from utils.wordlist import get_word_hints
+        from utils.hint_engine import feedback_matrix, encode_hints
+        from utils.wordle_solver import WordleSolver, MAX_GUESSES, difficulty
+        
+        words = ["SPEED", "ERASE", "CREEP", "ABBEY", "CRANE", "CRATE", "GRATE", "PLANT", "QUILT", "STORM"]
+        matrix = feedback_matrix(words)
+        solver = WordleSolver(matrix.answers, matrix.codes)
+        
+        ratings = solver.rate_words()
+        assert set(ratings) == set(words), "Every word should be rated"
+        for word in words:
+            guesses = solver.solve(word)
+            assert guesses[-1] == word and len(guesses) == ratings[word], "Solve should match the rating"
+            # Each guess must be consistent with the feedback seen so far
+            candidates = tuple(range(len(words)))
+            for guess in guesses[:-1]:
+                code = encode_hints(get_word_hints(word, guess))
+                candidates = solver.filter_candidates(candidates, guess, code)
+                assert solver.index[word] in candidates, "Target should stay a candidate"
+        
+        report = solver.evaluate()
+        assert report['worst'] == max(ratings.values()) and not report['failures'], "Report should summarize"
+        assert report['opening'] == solver.opening_guess(), "Opening guess should be memoized"
+        assert difficulty(2) == 'easy' and difficulty(MAX_GUESSES) == 'hard', "Bands should label counts"
+        
+        full = WordleSolver.for_word_file().evaluate()
+        assert full['words'] > 500 and full['worst'] <= MAX_GUESSES, "Full list should be solvable"
+        
+        print("✓ Wordle solver tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Wordle solver test failed: {e}")
+        return False
+
+
+def test_streaming_word_loader():
+    """Test the streaming loader for large and compressed word files."""
+    print("\nTesting streaming word loader...")
+    try:
+        import bz2
+        import gzip
+        import lzma
+        import tempfile
+        from utils.wordlist import load_packed_words, stream_words
+        
+        content = b"apple\nBerry\r\nAPPLE\nkiwi\nit's\nfig\nlemon\nmango\ngrape\nberry\n"
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name, opener in (("words.txt", open), ("words.gz", gzip.open),
+                                 ("words.bz2", bz2.open), ("words.xz", lzma.open)):
+                path = os.path.join(tmp, name)
+                with opener(path, "wb") as f:
+                    f.write(content)
+                paths.append(path)
+            
+            for path in paths:
+                index = load_packed_words(path, chunk_words=2)
+                assert index.lengths() == [3, 4, 5], f"Lengths should be indexed for {path}"
+                assert list(index.by_length(5)) == ["APPLE", "BERRY", "GRAPE", "LEMON", "MANGO"], \
+                    "Words should be uppercased, sorted and deduplicated"
+                assert "kiwi" in index and "IT'S" not in index and "PEAR" not in index, "Membership"
+                assert index.random_word(length=3) == "FIG", "Random pick by length"
+            
+            only_five = load_packed_words(paths[0], lengths=(5,))
+            assert only_five.lengths() == [5] and len(only_five) == 5, "Length filter"
+            assert list(stream_words(paths[1], lengths=(4,))) == [b"KIWI"], "Streaming filter"
+            
+            # Blocks end at any whitespace; runs longer than a block are skipped
+            import utils.wordlist as wordlist
+            path = os.path.join(tmp, "tabs.txt")
+            with open(path, "wb") as f:
+                f.write(b"pear\tplum\x0bfig\x0c" + b"x" * 20 + b"\rlime")
+            block_size = wordlist.STREAM_BLOCK_SIZE
+            wordlist.STREAM_BLOCK_SIZE = 6
+            try:
+                assert list(stream_words(path)) == [b"PEAR", b"PLUM", b"FIG", b"LIME"], "Block cuts"
+            finally:
+                wordlist.STREAM_BLOCK_SIZE = block_size
+        
+        print("✓ Streaming word loader tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Streaming word loader test failed: {e}")
+        return False
+
+
+def test_multi_board_word_puzzle():
+    """Test variable-length and multi-board word puzzles."""
+    print("\nTesting multi-board word puzzle...")
+    try:
+        import random
+        from game.ui import BufferBackend, FrameBuffer
+        from utils.wordlist import get_word_hints
+        from minigames.word_puzzle import WordPuzzle, render_puzzle, MIN_LENGTH, MAX_LENGTH
+        
+        for length in range(MIN_LENGTH, MAX_LENGTH + 1):
+            puzzle = WordPuzzle(length, boards=2, rng=random.Random(length))
+            assert all(len(target) == length for target in puzzle.targets), f"{length}-letter targets"
+            assert puzzle.attempts == 7, "One extra attempt per extra board"
+        
+        puzzle = WordPuzzle(5, targets=["SPEED", "GREEN", "ARENA", "ALARM"])
+        assert puzzle.attempts == 9, "Quordle gets 9 attempts"
+        assert puzzle.check_guess("SPE") and puzzle.check_guess("QQQQQ"), "Invalid guesses are rejected"
+        
+        assert puzzle._cached_codes("GREEN") == list(puzzle._engine.score("GREEN")), "Cached codes match the engine"
+        codes = puzzle.guess("green")
+        assert len(codes) == 4 and puzzle.solved_at == [None, 1, None, None], "One guess scores every board"
+        for board, target in enumerate(puzzle.targets):
+            assert puzzle.board_hints(board) == [("GREEN", get_word_hints(target, "GREEN"))], "Hints match"
+        
+        for guess in ("SPEED", "ARENA", "ALARM"):
+            puzzle.guess(guess)
+        assert puzzle.won and puzzle.finished and puzzle.points() == 22, "Solving every board wins"
+        assert len(puzzle.board_hints(1)) == 1, "Solved boards stop recording guesses"
+        
+        output = BufferBackend()
+        frame = FrameBuffer(output)
+        render_puzzle(WordPuzzle(6, boards=8, rng=random.Random(1)), frame)
+        assert frame.frames == 1 and output.getvalue().count("Board ") == 8, "All boards render in one frame"
+        
+        print("✓ Multi-board word puzzle tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Multi-board word puzzle test failed: {e}")
+        return False
+
+
+def test_minigame_instrumentation():
+    """Test mini-game timing instrumentation."""
+    print("\nTesting mini-game instrumentation...")
+    try:
+        import builtins
+        import contextlib
+        import io
+        import itertools
+        import time
+        from game.player import Player
+        from game.ui import output_backend, NullBackend
+        from minigames import math_quiz, science_quiz
+        from utils.instrumentation import (
+            enable_instrumentation, disable_instrumentation, get_instrumentation, instrumented, timed_wait
+        )
+        
+        answers = itertools.cycle(["x", "1"])  # Every other answer is invalid and retried
+        
+        def slow_answer(prompt=""):
+            time.sleep(0.002)
+            return next(answers)
+        
+        original_input = builtins.input
+        builtins.input = slow_answer
+        try:
+            stdout = io.StringIO()
+            with output_backend(NullBackend()), contextlib.redirect_stdout(stdout):
+                assert get_instrumentation() is None, "Instrumentation is off by default"
+                math_quiz.play_math_quiz(Player("Off"))
+                
+                recorder = enable_instrumentation()
+                math_quiz.play_math_quiz(Player("Timed"))
+                science_quiz.play_science_quiz(Player("Timed"))
+        finally:
+            builtins.input = original_input
+            disable_instrumentation()
+        
+        assert stdout.getvalue() == "", "Mini-games write only through the output backend"
+        report = recorder.export()
+        assert set(report) == {"math_quiz", "science_quiz"}, "Each game should be recorded"
+        math = recorder.games["math_quiz"]
+        assert math.plays == 1 and math.response.count == 5, "One response per question, retries included"
+        assert math.response.minimum >= 0.002, "Responses include the player's time"
+        assert math.engine.maximum < math.wall.maximum, "Engine time excludes waiting for the player"
+        assert report["science_quiz"]["response"]["summary"]["count"] == 5, "Export includes summaries"
+        
+        @instrumented("noop")
+        def noop():
+            return timed_wait(lambda: 7)
+        assert noop() == 7 and get_instrumentation() is None, "Disabled wrappers call straight through"
+        
+        print("✓ Mini-game instrumentation tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Mini-game instrumentation test failed: {e}")
+        return False
+
+
+def test_typing_engine():
+    """Test the keystroke-level typing engine."""
+    print("\nTesting typing engine...")
+    try:
+        from game.ui import BufferBackend
+        from minigames.typing_engine import (
+            TypingSession, TypingView, feed_keys, run_typing_session, CORRECT, WRONG, PENDING
+        )
+        
+        session = TypingSession("cat hat")
+        for i, key in enumerate("cax"):
+            session.press(key, i * 0.05)
+        assert session.states[2] == WRONG and session.errors == 1 and session.burst == 1, "Wrong key"
+        assert session.press("\x7f", 0.15) == 2 and session.states[2] == PENDING, "Backspace clears"
+        for i, key in enumerate("t hat"):
+            session.press(key, 0.2 + i * 0.05)
+        assert session.finished and session.typed_text == "cat hat", "Typing the last key finishes"
+        assert session.correct_chars == 7 and session.states[-1] == CORRECT, "Counters track state"
+        assert session.bursts == {1: 1} and session.longest_burst == 1, "Error bursts are recorded"
+        assert round(session.accuracy(), 1) == 87.5, "Keystroke accuracy"
+        assert session.intervals.count == 8, "Every key after the first records an interval"
+        
+        # Reaching the end with a mistake leaves the test open for a backspace
+        fix = TypingSession("ab")
+        fix.press("a", 0.0)
+        fix.press("x", 0.1)
+        assert not fix.finished and fix.press("c", 0.2) is None, "Wrong last key does not finish"
+        fix.press("\x7f", 0.3)
+        fix.press("b", 0.4)
+        assert fix.finished and fix.typed_text == "ab" and fix.end == 0.4, "Fixed text finishes"
+        
+        # 10 keys 60 ms apart = 200 WPM
+        fast = TypingSession("a" * 20)
+        for i in range(10):
+            fast.press("a", i * 0.06)
+        assert round(fast.rolling_wpm()) == 200, "Rolling WPM"
+        
+        # Each key only rewrites its own cell
+        output = BufferBackend()
+        view = TypingView("hello world", "Test", output)
+        live = TypingSession("hello world")
+        view.draw(live)
+        full = view.bytes_written
+        feed_keys(live, view, "h", 1.0)
+        feed_keys(live, view, "e", 1.01)
+        assert view.bytes_written - full < full / 2, "Redraws are incremental"
+        
+        class ScriptedKeyboard:
+            """Keyboard stand-in that returns fixed reads."""
+            
+            def __init__(self, reads):
+                self.reads = iter(reads)
+            
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *exc_info):
+                pass
+            
+            def read(self, timeout=None):
+                return next(self.reads, (9.0, ''))
+        
+        # Arrow keys, even split across reads, are not typed characters
+        keyboard = ScriptedKeyboard([(0.0, "c\x1b[A"), (0.1, "\x1b"), (0.2, "[Da"), (0.3, "\x1bOBt")])
+        arrows = run_typing_session("cat", keyboard=keyboard, backend=BufferBackend())
+        assert arrows.typed_text == "cat" and arrows.errors == 0, "Escape sequences are ignored"
+        
+        print("✓ Typing engine tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Typing engine test failed: {e}")
+        return False
+
+
+def test_alignment_accuracy():
+    """Test edit-distance alignment and typing accuracy."""
+    print("\nTesting alignment accuracy...")
+    try:
+        from utils.alignment import align, edit_distance
+        from minigames.typing_test import calculate_accuracy
+        
+        assert edit_distance("kitten", "sitting") == 3, "Classic distance"
+        assert edit_distance("", "abc") == 3 and edit_distance("same", "same") == 0, "Edge cases"
+        
+        result = align("The quick brown fox", "Te quick brwn foxx")
+        assert (result.substitutions, result.deletions, result.insertions) == (0, 2, 1), "Edit breakdown"
+        assert result.matches == 17, "Matches"
+        
+        # One skipped character no longer shifts the rest of the sentence
+        sentence = "The quick brown fox jumps over the lazy dog."
+        assert calculate_accuracy(sentence, sentence[1:]) > 95, "Skipped character"
+        assert calculate_accuracy(sentence, sentence) == 100.0, "Perfect typing"
+        assert calculate_accuracy(sentence, "") == 0.0, "Nothing typed"
+        
+        # Long passages take the same path whether the band or Myers is used
+        passage = sentence * 30
+        typed = passage[:100] + passage[101:600] + "x" + passage[600:]
+        assert edit_distance(passage, typed) == 2, "Long passage"
+        assert edit_distance(passage, passage[::-1]) == align(passage, passage[::-1]).distance, "Dense edits"
+        
+        print("✓ Alignment accuracy tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Alignment accuracy test failed: {e}")
+        return False
+
+
+def test_passage_corpus():
+    """Test the memory-mapped passage corpus and endurance paging."""
+    print("\nTesting passage corpus...")
+    try:
+        import os
+        import random
+        import tempfile
+        from utils.corpus import PassageCorpus, DEFAULT_CORPUS_FILE, get_passage_corpus
+        from minigames.typing_test import passage_pages
+        from minigames.typing_engine import SessionTotals, typed_session
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'corpus.txt')
+            index = os.path.join(tmp, '.cache', 'corpus.txt.index')
+            with open(path, 'wb') as f:
+                f.write(b"%\nFirst passage.\n\nSecond paragraph.\n%\n  \n%\r\n100% sure\r\n%")
+            
+            with PassageCorpus.open(path, index) as corpus:
+                assert len(corpus) == 2, "Blank passages are skipped"
+                assert corpus.passage(0) == "First passage.\n\nSecond paragraph.", "Passage text"
+                assert corpus.passage(1) == "100% sure", "Only whole '%' lines separate passages"
+                assert corpus.random_passage(random.Random(0)) in ("100% sure", corpus.passage(0))
+            assert os.path.exists(index), "Index is written"
+            
+            with PassageCorpus.open(path, index) as corpus:
+                assert list(corpus.spans) == [2, 33, 44, 9], "Index is reused"
+            with open(path, 'ab') as f:
+                f.write(b"\nThird\n")
+            with PassageCorpus.open(path, index) as corpus:
+                assert len(corpus) == 3, "Stale index is rebuilt"
+        
+        assert len(get_passage_corpus(DEFAULT_CORPUS_FILE)) >= 10, "Bundled corpus"
+        
+        passage = "word " * 100 + "\n\nShort paragraph."
+        pages = list(passage_pages(passage, width=40, lines=3))
+        assert pages[-1] == "Short paragraph.", "Pages never span paragraphs"
+        assert all(len(page) <= 3 * 40 for page in pages), "Pages fit on screen"
+        assert ' '.join(pages[:-1]).split() == ["word"] * 100, "Pages cover the passage"
+        
+        totals = SessionTotals()
+        totals.add(typed_session("hello world", "hello world", 0.0, 2.0))
+        totals.add(typed_session("second page", "secnd page", 2.0, 4.0))
+        assert totals.sessions == 2 and totals.elapsed == 4.0, "Totals span pages"
+        assert totals.matches == 21 and totals.columns == 22, "Aligned accuracy across pages"
+        assert round(totals.wpm()) == 63, "Net WPM across pages"
+        
+        # Line input keeps inserted and trailing characters for alignment
+        for typed, columns in (("helllo world", 12), ("hello world!!", 13)):
+            line = typed_session("hello world", typed, 0.0, 2.0)
+            assert line.typed_text == typed, "Whole line is kept"
+            totals = SessionTotals()
+            totals.add(line)
+            assert (totals.matches, totals.columns) == (11, columns), f"Alignment of {typed!r}"
+        
+        from game.player import Player
+        from minigames.typing_test import award_points
+        typist = Player("Typist")
+        assert award_points(typist, 50, 98, 'typing_endurance') == 20, "Endurance points"
+        assert typist.has_completed_minigame('typing_endurance'), "Endurance has its own completion"
+        assert not typist.has_completed_minigame('typing_test'), "The story's typing test is not marked"
+        
+        print("✓ Passage corpus tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Passage corpus test failed: {e}")
+        return False
+
+
+def test_pathfinding():
+    """Test BFS/A* pathfinding and hallway auto-navigation."""
+    print("\nTesting pathfinding...")
+    try:
+        from utils.pathfinding import Grid, bfs_path, astar_path, distance_field, path_from_field
+        from utils.hallway import Hallway
+        
+        grid = Grid.from_rows([
+            "#######",
+            "#  #  #",
+            "#  #  #",
+            "#     #",
+            "#######",
+        ])
+        path = bfs_path(grid, (1, 1), (5, 1))
+        assert len(path) == 8 and path[-1] == (5, 1), "BFS goes around the wall"
+        assert len(astar_path(grid, (1, 1), (5, 1))) == 8, "A* finds a shortest path"
+        assert bfs_path(grid, (1, 1), (3, 1)) is None, "Walls are not destinations"
+        field = distance_field(grid, [(5, 1)])
+        assert path_from_field(grid, field, (1, 1)) == path, "Field descent matches BFS"
+        assert path_from_field(grid, field, (5, 1)) == [], "Already there"
+        
+        hallway = Hallway()
+        table = hallway.room_distances()
+        assert table is hallway.room_distances(), "Room table is cached"
+        assert table.distance('A', 'L') == table.distance('L', 'A') == 18, "Room distances"
+        route = table.room_path('A', 'C')
+        assert all(hallway.map_data[y][x] == ' ' for x, y in route[1:-1]), "Paths avoid other rooms"
+        
+        assert hallway.go_to("science lab") == "Science Lab", "Auto-navigation by name"
+        assert (hallway.player_x, hallway.player_y) == (16, 1), "Player is moved"
+        steps = []
+        assert hallway.go_to('j', lambda: steps.append(1)) == "Library", "Auto-navigation by letter"
+        assert len(steps) == table.distance('C', 'J'), "One callback per step"
+        assert hallway.go_to("Swimming Pool") is None, "Unknown rooms"
+        
+        print("✓ Pathfinding tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Pathfinding test failed: {e}")
+        return False
+
+
+def test_map_generator():
+    """Test seeded multi-floor school map generation."""
+    print("\nTesting map generator...")
+    try:
+        from utils.mapgen import generate_school, WALL
+        from utils.hallway import Hallway
+        
+        school = generate_school(60, 30, floors=3, seed=7)
+        assert school.floors == generate_school(60, 30, floors=3, seed=7).floors, "Seeds are reproducible"
+        assert all(isinstance(floor, bytearray) and len(floor) == 60 * 30 for floor in school.floors)
+        assert sorted(school.rooms) == list("ABCDEFGHIJKL"), "Every label gets a room"
+        assert school.unreachable_rooms() == set(), "Every room is reachable"
+        small = generate_school(20, 20, floors=6, seed=1, labels='AB')
+        assert {floor for _, _, floor in small.stairs} == set(range(5)), "Small maps link every floor"
+        
+        # Walling a room's label in is caught
+        x, y, floor = school.rooms['A']
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            school.floors[floor][ny * school.width + nx] = WALL
+        assert school.unreachable_rooms() == {'A'}, "Blocked rooms are detected"
+        
+        hallway = Hallway.generate(seed=7, width=60, height=30, floors=3)
+        for letter, (x, y, floor) in hallway.map.rooms.items():
+            assert hallway.go_to(letter) == Hallway.ROOMS[letter], "Rooms on any floor can be reached"
+            assert (hallway.player_x, hallway.player_y, hallway.floor) == (x, y, floor)
+        
+        # Stepping onto a stairwell changes floor
+        x, y, lower = hallway.map.stairs[0]
+        hallway.player_x, hallway.player_y, hallway.floor = x - 1, y, lower
+        if not hallway.move('d'):
+            hallway.player_x, hallway.player_y = x + 1, y
+            assert hallway.move('a')
+        assert hallway.floor == lower + 1, "Stairs lead up"
+        
+        print("✓ Map generator tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Map generator test failed: {e}")
+        return False
+
+
+def test_viewport():
+    """Test the scrolling hallway viewport and cell patches."""
+    print("\nTesting viewport...")
+    try:
+        from game.ui import FrameBuffer, BufferBackend
+        from utils.viewport import Viewport
+        from utils.hallway import Hallway
+        
+        # Small maps fit in the window whole
+        hallway = Hallway()
+        view = hallway.view
+        assert view.lines(hallway.map_data, 9, 4)[4] == "#        *         #"
+        assert view.patch(hallway.map_data, 9, 4) == '', "Nothing to redraw"
+        hallway.render()
+        hallway.move('d')
+        patch = view.patch(hallway.map_data, hallway.player_x, hallway.player_y)
+        assert patch == "\0337\033[8;10H \033[8;11H*\0338", "Only two cells are rewritten"
+        view.invalidate()
+        assert view.patch(hallway.map_data, hallway.player_x, hallway.player_y) is None
+        
+        # Lines forgotten by the frame buffer are redrawn even if unchanged
+        frame = FrameBuffer(BufferBackend())
+        frame.add("a\nb\nc")
+        frame.flush()
+        frame.invalidate([1])
+        frame.add("a\nb\nc")
+        frame.flush()
+        assert frame.backend.getvalue().endswith("\033[2;1Hb\033[K\033[4;1H\033[J"), "Only line 2 is redrawn"
+        
+        # Big maps show a window that scrolls near its edges
+        rows = ["." * 100] * 50
+        view = Viewport(20, 10)
+        lines = view.lines(rows, 50, 25)
+        assert len(lines) == 10 and all(len(line) == 20 for line in lines)
+        assert view.origin == (40, 20) and lines[5][10] == '*', "Player starts centred"
+        assert view.patch(rows, 53, 25) is not None, "Moves inside the margin patch"
+        assert view.patch(rows, 56, 25) is None, "Moves near the edge scroll"
+        view.lines(rows, 99, 49)
+        assert view.origin == (80, 40), "Windows stop at the map edge"
+        
+        print("✓ Viewport tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Viewport test failed: {e}")
+        return False
+
+
+def test_key_reader():
+    """Test escape sequence decoding and key-repeat coalescing."""
+    print("\nTesting key reader...")
+    try:
+        import os
+        from utils.keyboard import KeyReader, decode_keys, coalesce, ESCAPE
+        
+        assert decode_keys("w\x1b[A\x1bOD\x1b[1;5C") == (['w', 'up', 'left', 'right'], ''), "Arrows are named"
+        assert decode_keys("q\x1b[") == (['q'], '\x1b['), "Unfinished sequences wait"
+        assert decode_keys("\x1bq") == ([ESCAPE, 'q'], ''), "A lone ESC is a key"
+        assert coalesce(['up', 'up', 'a', 'up']) == [('up', 2), ('a', 1), ('up', 1)]
+        
+        read_fd, write_fd = os.pipe()
+        try:
+            with KeyReader(read_fd) as keys:
+                assert keys.events(timeout=0) == [], "Reads don't block"
+                os.write(write_fd, b"\x1b[B" * 300 + b"g")
+                assert keys.events() == [('down', 300), ('g', 1)], "A held key is one event"
+                os.write(write_fd, b"\x1b[")
+                assert keys.events() == [(ESCAPE, 1), ('[', 1)], "Sequences that never finish are keys"
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+        
+        print("✓ Key reader tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Key reader test failed: {e}")
+        return False
+
+
+def test_crowd():
+    """Test the hallway crowd, its spatial hash and fixed-step ticks."""
+    print("\nTesting crowd...")
+    try:
+        from utils.crowd import SpatialHash, TICK, MAX_CATCH_UP
+        from utils.hallway import Hallway
+        from utils.time_system import TimeSystem
+        
+        spatial = SpatialHash(stride=100, size=8)
+        spatial.add('a', 101)
+        spatial.add('b', 305)
+        spatial.move(305, 310)
+        assert spatial.at(310) == 'b' and spatial.at(305) is None
+        assert spatial.near(101, 2) == [] and spatial.near(110, 2) == ['b'], "Proximity by bucket"
+        spatial.remove(101)
+        assert spatial.within(0, 0, 100, 100) == [310]
+        
+        time_system = TimeSystem()
+        hallway = Hallway.generate(seed=3, width=60, height=30, floors=2)
+        crowd = hallway.add_crowd(80, seed=3, time_system=time_system)
+        indexes = [student.index for student in crowd.students]
+        assert len(crowd.students) == 80 and len(set(indexes)) == 80, "One student per cell"
+        
+        # Students block the player
+        student = crowd.students[0]
+        x, y, floor = crowd.grid.position(student.index)
+        hallway.floor = floor
+        assert not hallway.can_move(x, y), "Students block the player"
+        hallway.floor = hallway.map.start[2]
+        
+        # Fixed timestep: partial ticks carry over, long stalls are capped
+        assert crowd.advance(TICK / 2) == 0 and crowd.advance(TICK / 2 + 1e-9) == 1
+        assert crowd.advance(60) == MAX_CATCH_UP
+        
+        for _ in range(60 * 60):
+            crowd.tick()
+        assert crowd.inside() == 80, "Everyone gets to class"
+        time_system.current_period = 5  # Lunch
+        for _ in range(60 * 60):
+            crowd.tick()
+        assert {student.room for student in crowd.students} == {'G'}, "Everyone goes to lunch"
+        
+        # Students in view are drawn on the map (a default crowd on the built-in map)
+        hallway = Hallway()
+        crowd = hallway.add_crowd(seed=1)
+        assert hallway.render().split("=" * 40)[1].count('o') == len(crowd.students) == 6
+        
+        print("✓ Crowd tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Crowd test failed: {e}")
+        return False
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -161,7 +1298,30 @@ def main():
         test_time_system,
         test_wordlist,
         test_story,
-        test_game_engine
+        test_game_engine,
+        test_simulation,
+        test_batch_runner,
+        test_story_analysis,
+        test_save_load,
+        test_game_server,
+        test_output_backends,
+        test_frame_buffer,
+        test_type_text,
+        test_word_index,
+        test_hint_engine,
+        test_feedback_cache,
+        test_wordle_solver,
+        test_streaming_word_loader,
+        test_multi_board_word_puzzle,
+        test_minigame_instrumentation,
+        test_typing_engine,
+        test_alignment_accuracy,
+        test_passage_corpus,
+        test_pathfinding,
+        test_map_generator,
+        test_viewport,
+        test_key_reader,
+        test_crowd
     ]
     
     passed = 0
@@ -0,0 +1,286 @@
+"""
+Edit-distance alignment of typed text against the text that was meant.
+Typed text is mostly right, so alignment first runs a diagonal band search
+(Ukkonen / Landau-Vishkin) whose cost grows with the square of the number
+of edits, not the length. Text with many edits falls back to Myers'
+bit-parallel algorithm, which updates a whole DP column per big-int step.
+"""
+
+
+class Alignment:
+    """Counts of matches and edits in an optimal alignment."""
+
+    __slots__ = ('matches', 'substitutions', 'insertions', 'deletions')
+
+    def __init__(self, matches=0, substitutions=0, insertions=0, deletions=0):
+        """Initialize the counts."""
+        self.matches = matches
+        self.substitutions = substitutions  # Wrong character typed
+        self.insertions = insertions  # Extra character typed
+        self.deletions = deletions  # Character of the original skipped
+
+    @property
+    def distance(self):
+        """Levenshtein distance."""
+        return self.substitutions + self.insertions + self.deletions
+
+    @property
+    def length(self):
+        """Number of columns in the alignment."""
+        return self.matches + self.distance
+
+    def accuracy(self):
+        """Percentage of alignment columns that match."""
+        return self.matches / self.length * 100 if self.length else 100.0
+
+    def __repr__(self):
+        """String representation of the alignment."""
+        return (f"Alignment(matches={self.matches}, substitutions={self.substitutions}, "
+                f"insertions={self.insertions}, deletions={self.deletions})")
+
+
+def _common_affixes(a, b):
+    """Get the lengths of the common prefix and (non-overlapping) suffix."""
+    limit = min(len(a), len(b))
+    prefix = 0
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+def _slide(a, b, i, j):
+    """Get the length of the common run of a[i:] and b[j:] (galloping over slices)."""
+    limit = min(len(a) - i, len(b) - j)
+    if limit <= 0 or a[i] != b[j]:
+        return 0
+    low, high = 1, 2
+    while high <= limit and a[i + low:i + high] == b[j + low:j + high]:
+        low, high = high, high * 2
+    high = min(high, limit + 1)
+    while high - low > 1:
+        middle = (low + high) // 2
+        if a[i + low:i + middle] == b[j + low:j + middle]:
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+def _furthest(previous, d, diagonal, m, n):
+    """Get the furthest row diagonal reaches with d edits before sliding, and the last edit.
+
+    previous holds the furthest rows of diagonals -(d - 1)..d - 1 (-1 if
+    unreachable). Diagonal k holds cells (i, i + k).
+    """
+    best, edit = -1, None
+    if -d < diagonal < d:
+        row = previous[diagonal + d - 1]
+        if 0 <= row < m and row + diagonal < n:
+            best, edit = row + 1, 's'
+    if diagonal < d - 1:
+        row = previous[diagonal + d]
+        if 0 <= row < m and row + 1 > best:
+            best, edit = row + 1, 'd'
+    if diagonal > 1 - d:
+        row = previous[diagonal + d - 2]
+        if row >= 0 and row + diagonal <= n and row > best:
+            best, edit = row, 'i'
+    return best, edit
+
+
+def _band_edits(a, b, limit):
+    """Count (substitutions, insertions, deletions) if there are at most limit edits, else None."""
+    m, n = len(a), len(b)
+    goal = n - m
+    rows = [[_slide(a, b, 0, 0)]]  # rows[d][k + d]: furthest row of diagonal k with d edits
+    d = 0
+    while not (-d <= goal <= d and rows[d][goal + d] == m):
+        d += 1
+        if d > limit:
+            return None
+        # Same recurrence as _furthest, inlined: this loop is the hot path.
+        # Pad previous with -1 so every diagonal has all three predecessors
+        previous = [-1, -1] + rows[-1] + [-1, -1]
+        current = []
+        for index, diagonal in enumerate(range(-d, d + 1), 1):
+            row = previous[index]  # Substitution
+            row = row + 1 if 0 <= row < m and row + diagonal < n else -1
+            above = previous[index + 1]  # Deletion
+            if 0 <= above < m and above >= row:
+                row = above + 1
+            left = previous[index - 1]  # Insertion
+            if left > row and left + diagonal <= n:
+                row = left
+            if 0 <= row < m and row + diagonal < n and a[row] == b[row + diagonal]:
+                row += _slide(a, b, row, row + diagonal)
+            current.append(row)
+        rows.append(current)
+
+    counts = {'s': 0, 'i': 0, 'd': 0}
+    diagonal = goal
+    while d:
+        _, edit = _furthest(rows[d - 1], d, diagonal, m, n)
+        counts[edit] += 1
+        diagonal += {'s': 0, 'd': 1, 'i': -1}[edit]
+        d -= 1
+    return counts['s'], counts['i'], counts['d']
+
+
+def _band_limit(a, b):
+    """Most edits worth a band search before Myers' algorithm is faster."""
+    return int((len(a) + len(b)) ** 0.5) + 4
+
+
+def _match_masks(pattern):
+    """Map each character to a bitmask of its positions in the pattern."""
+    masks = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _popcount(value):
+    """Count the set bits of a non-negative int (int.bit_count needs Python 3.10)."""
+    return bin(value).count('1')
+
+
+def _columns(pattern, text, keep):
+    """Run Myers' algorithm, returning the distance and (if keep) every column.
+
+    Bit i of a column's (vp, vn) says D[i + 1][j] - D[i][j] is +1 or -1.
+    """
+    m = len(pattern)
+    mask = (1 << m) - 1
+    top = 1 << (m - 1)
+    masks = _match_masks(pattern)
+    vp, vn, score = mask, 0, m
+    columns = [(vp, vn)] if keep else None
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | (~(xh | vp) & mask)
+        hn = vp & xh
+        if hp & top:
+            score += 1
+        elif hn & top:
+            score -= 1
+        hp = ((hp << 1) | 1) & mask  # Row 0 grows by one per column
+        hn = (hn << 1) & mask
+        vp = hn | (~(xv | hp) & mask)
+        vn = hp & xv
+        if keep:
+            columns.append((vp, vn))
+    return score, columns
+
+
+def edit_distance(a, b):
+    """Get the Levenshtein distance between two strings."""
+    prefix, suffix = _common_affixes(a, b)
+    a = a[prefix:len(a) - suffix]
+    b = b[prefix:len(b) - suffix]
+    if not a or not b:
+        return len(a) + len(b)
+    edits = _band_edits(a, b, _band_limit(a, b))
+    if edits is not None:
+        return sum(edits)
+    return _columns(a, b, False)[0]
+
+
+def align(original, typed):
+    """Align typed text with the original and count matches and edits."""
+    prefix, suffix = _common_affixes(original, typed)
+    result = Alignment(matches=prefix + suffix)
+    a = original[prefix:len(original) - suffix]
+    b = typed[prefix:len(typed) - suffix]
+    if not a or not b:
+        result.deletions = len(a)
+        result.insertions = len(b)
+        return result
+
+    edits = _band_edits(a, b, _band_limit(a, b))
+    if edits is not None:
+        result.substitutions, result.insertions, result.deletions = edits
+        result.matches += len(a) - result.substitutions - result.deletions
+        return result
+
+    # Too many edits for the band: recover the path from Myers' columns
+    _, columns = _columns(a, b, True)
+
+    def value(j, i):
+        """D[i][j] from the stored deltas of column j."""
+        vp, vn = columns[j]
+        low = (1 << i) - 1
+        return j + _popcount(vp & low) - _popcount(vn & low)
+
+    def delta(j, i):
+        """D[i][j] - D[i - 1][j]."""
+        vp, vn = columns[j]
+        return ((vp >> (i - 1)) & 1) - ((vn >> (i - 1)) & 1)
+
+    # Walk back from the bottom-right corner, tracking the current cell (d)
+    # and the cell to its left (left), preferring diagonal moves
+    i, j = len(a), len(b)
+    d = value(j, i)
+    left = value(j - 1, i)
+    while i and j:
+        diagonal = left - delta(j - 1, i)
+        if a[i - 1] == b[j - 1] and diagonal == d:
+            result.matches += 1
+        elif diagonal == d - 1:
+            result.substitutions += 1
+        elif delta(j, i) == 1:
+            result.deletions += 1
+            left -= delta(j - 1, i)
+            d -= 1
+            i -= 1
+            continue
+        else:
+            result.insertions += 1
+            j -= 1
+            d = left
+            left = value(j - 1, i) if j else 0
+            continue
+        i -= 1
+        j -= 1
+        d = diagonal
+        left = value(j - 1, i) if j else 0
+    result.deletions += i
+    result.insertions += j
+    return result
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    rng = random.Random(42)
+    letters = "abcdefghijklmnopqrstuvwxyz     "
+    for length in (50, 1000, 5000):
+        original = ''.join(rng.choice(letters) for _ in range(length))
+        typed = list(original)
+        for _ in range(length // 50):
+            position = rng.randrange(len(typed))
+            edit = rng.choice('sid')
+            if edit == 's':
+                typed[position] = rng.choice(letters)
+            elif edit == 'i':
+                typed.insert(position, rng.choice(letters))
+            else:
+                del typed[position]
+        typed = ''.join(typed)
+
+        runs = 20
+        start = time.perf_counter()
+        for _ in range(runs):
+            distance = edit_distance(original, typed)
+        distance_time = (time.perf_counter() - start) / runs
+        start = time.perf_counter()
+        for _ in range(runs):
+            result = align(original, typed)
+        align_time = (time.perf_counter() - start) / runs
+        print(f"{length:>5} chars: distance {distance:>3} in {distance_time * 1e3:.3f} ms, "
+              f"align in {align_time * 1e3:.3f} ms  {result}")
@@ -0,0 +1,178 @@
+"""
+Memory-mapped text corpus of typing passages.
+Passages are separated by lines holding a single '%' (the fortune file
+format). A sidecar index of (offset, length) pairs is built once, so picking
+a random passage is O(1) and only that passage is ever read into memory.
+
+The index lives next to the corpus (data/.cache/) and is keyed on the
+corpus size and modification time, so it is rebuilt when the corpus changes.
+"""
+
+import mmap
+import os
+import random
+import struct
+from array import array
+
+from utils.wordlist import _resolve_path
+
+
+DEFAULT_CORPUS_FILE = 'data/passages.txt'
+PASSAGE_SEPARATOR = b'%'
+
+INDEX_MAGIC = b'SDPI'
+INDEX_VERSION = 1
+CACHE_DIR = '.cache'
+_INDEX_HEADER = struct.Struct('<4sBQqI')  # magic, version, corpus size, mtime_ns, passages
+_WHITESPACE = b' \t\r\n'
+
+
+def index_path(filename=DEFAULT_CORPUS_FILE):
+    """Get the index file path for a corpus file."""
+    filepath = _resolve_path(filename)
+    directory, name = os.path.split(filepath)
+    return os.path.join(directory, CACHE_DIR, f"{name}.index")
+
+
+def _separator_lines(data):
+    """Yield the (start, end) of every separator line, end including its newline."""
+    size = len(data)
+    position = 0
+    while position < size:
+        if data[position:position + 1] == PASSAGE_SEPARATOR:
+            end = position + 1
+            if data[end:end + 1] == b'\r':
+                end += 1
+            if end == size or data[end:end + 1] == b'\n':
+                yield position, min(end + 1, size)
+        newline = data.find(b'\n', position)
+        if newline < 0:
+            return
+        # Jump straight to the next line that could be a separator
+        position = data.find(b'\n' + PASSAGE_SEPARATOR, newline)
+        if position < 0:
+            return
+        position += 1
+
+
+def scan_passages(data):
+    """Yield (offset, length) of every non-blank passage in a corpus buffer."""
+    start = 0
+    for separator, end in _separator_lines(data):
+        yield from _trimmed(data, start, separator)
+        start = end
+    yield from _trimmed(data, start, len(data))
+
+
+def _trimmed(data, start, end):
+    """Yield (offset, length) of data[start:end] without surrounding whitespace, if any is left."""
+    text = data[start:end]
+    stripped = text.lstrip(_WHITESPACE)
+    offset = start + len(text) - len(stripped)
+    stripped = stripped.rstrip(_WHITESPACE)
+    if stripped:
+        yield offset, len(stripped)
+
+
+class PassageCorpus:
+    """A memory-mapped corpus file and its passage index."""
+
+    def __init__(self, filepath, mapping, spans):
+        """Wrap a mapped corpus and a flat array of (offset, length) pairs."""
+        self.filepath = filepath
+        self._mapping = mapping
+        self.spans = spans
+
+    @classmethod
+    def open(cls, filename=DEFAULT_CORPUS_FILE, path=None):
+        """Map a corpus file, building or refreshing its index when needed."""
+        filepath = _resolve_path(filename)
+        path = path or index_path(filename)
+        stat = os.stat(filepath)
+        if stat.st_size == 0:
+            return cls(filepath, None, array('Q'))
+        with open(filepath, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        spans = cls._load_index(path, stat)
+        if spans is None:
+            spans = array('Q')
+            for offset, length in scan_passages(mapping):
+                spans.append(offset)
+                spans.append(length)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temp_path = f"{path}.{os.getpid()}.tmp"
+                with open(temp_path, 'wb') as f:
+                    f.write(_INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, stat.st_size,
+                                               stat.st_mtime_ns, len(spans) // 2))
+                    spans.tofile(f)
+                os.replace(temp_path, path)
+            except OSError:
+                pass  # Read-only data directory: keep the index in memory
+        return cls(filepath, mapping, spans)
+
+    @staticmethod
+    def _load_index(path, stat):
+        """Read an index file, or return None if it is missing or stale."""
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(_INDEX_HEADER.size)
+                magic, version, size, mtime_ns, count = _INDEX_HEADER.unpack(header)
+                if (magic != INDEX_MAGIC or version != INDEX_VERSION
+                        or size != stat.st_size or mtime_ns != stat.st_mtime_ns):
+                    return None
+                spans = array('Q')
+                spans.fromfile(f, count * 2)
+        except (OSError, EOFError, struct.error):
+            return None
+        return spans
+
+    def __len__(self):
+        """Number of passages."""
+        return len(self.spans) // 2
+
+    def passage(self, index):
+        """Read one passage."""
+        offset, length = self.spans[index * 2], self.spans[index * 2 + 1]
+        return self._mapping[offset:offset + length].decode('utf-8', 'replace')
+
+    def random_passage(self, rng=random):
+        """Read a random passage."""
+        if not len(self):
+            raise ValueError(f"No passages in {self.filepath}")
+        return self.passage(rng.randrange(len(self)))
+
+    def close(self):
+        """Unmap the corpus file."""
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+    def __enter__(self):
+        """Use the corpus as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the corpus."""
+        self.close()
+
+
+# Process-wide corpora: path -> ((size, mtime_ns), PassageCorpus)
+_open_corpora = {}
+
+
+def get_passage_corpus(filename=DEFAULT_CORPUS_FILE):
+    """Get the shared corpus for a file, reopening it if the file changed."""
+    filepath = _resolve_path(filename)
+    stat = os.stat(filepath)
+    key = (stat.st_size, stat.st_mtime_ns)
+    cached = _open_corpora.get(filepath)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    if cached is not None:
+        cached[1].close()
+
+    corpus = PassageCorpus.open(filename)
+    _open_corpora[filepath] = (key, corpus)
+    return corpus
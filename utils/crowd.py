@@ -0,0 +1,306 @@
+"""
+Student crowds for the hallway.
+Hundreds of students walk between rooms on their own timetables, moving
+when the TimeSystem period changes. Everyone heading to the same room
+follows that room's shared distance field downhill, a spatial hash keeps
+collision and proximity queries constant-time per student, and the
+simulation advances in fixed 60 Hz ticks.
+"""
+
+import random
+
+from utils.pathfinding import WALL
+from utils.time_system import TimeSystem
+
+
+TICK_RATE = 60  # Ticks per second
+TICK = 1 / TICK_RATE
+MAX_CATCH_UP = 10  # Ticks run by one advance() at most; older lag is dropped
+
+# Ticks a student takes per step (60 Hz: 4 to 7.5 cells per second)
+MIN_STEP_TICKS = 8
+MAX_STEP_TICKS = 15
+
+SIDESTEP_CHANCE = 0.25  # Chance a blocked student steps aside (one cell further away) instead of waiting
+BUCKET_SIZE = 8  # Spatial hash buckets are BUCKET_SIZE x BUCKET_SIZE cells
+
+PLAYER = 'player'  # Spatial hash entry for the player
+
+
+class SpatialHash:
+    """Who stands where, by padded grid index.
+
+    Exact cells answer collision checks; square buckets of cells answer
+    proximity queries without looking at anyone far away.
+    """
+
+    def __init__(self, stride, size=BUCKET_SIZE):
+        """Initialize an empty hash for a grid with the given row stride."""
+        self.stride = stride
+        self.size = size
+        self.cells = {}  # Index -> occupant
+        self.buckets = {}  # (bucket row, bucket column) -> set of indexes
+
+    def _key(self, index):
+        """Get the bucket of an index."""
+        row, column = divmod(index, self.stride)
+        return row // self.size, column // self.size
+
+    def add(self, item, index):
+        """Put an item on a free cell."""
+        self.cells[index] = item
+        self.buckets.setdefault(self._key(index), set()).add(index)
+
+    def remove(self, index):
+        """Take whatever stands on a cell off the hash."""
+        del self.cells[index]
+        key = self._key(index)
+        bucket = self.buckets[key]
+        bucket.discard(index)
+        if not bucket:
+            del self.buckets[key]
+
+    def move(self, old, new):
+        """Move an occupant to a free cell."""
+        self.cells[new] = self.cells.pop(old)
+        stride, size = self.stride, self.size
+        old_key = (old // stride // size, old % stride // size)
+        new_key = (new // stride // size, new % stride // size)
+        if old_key != new_key:
+            bucket = self.buckets[old_key]
+            bucket.discard(old)
+            if not bucket:
+                del self.buckets[old_key]
+            self.buckets.setdefault(new_key, set()).add(new)
+        else:
+            bucket = self.buckets[old_key]
+            bucket.discard(old)
+            bucket.add(new)
+
+    def at(self, index):
+        """Get the occupant of a cell, or None."""
+        return self.cells.get(index)
+
+    def within(self, row0, column0, row1, column1):
+        """Get the indexes occupied inside a rectangle of padded rows and columns (ends excluded)."""
+        found = []
+        size = self.size
+        for bucket_row in range(row0 // size, (row1 - 1) // size + 1):
+            for bucket_column in range(column0 // size, (column1 - 1) // size + 1):
+                for index in self.buckets.get((bucket_row, bucket_column), ()):
+                    row, column = divmod(index, self.stride)
+                    if row0 <= row < row1 and column0 <= column < column1:
+                        found.append(index)
+        return found
+
+    def near(self, index, radius):
+        """Get the occupants within radius steps across or down of a cell (itself excluded)."""
+        row, column = divmod(index, self.stride)
+        return [self.cells[other] for other in
+                self.within(row - radius, column - radius, row + radius + 1, column + radius + 1)
+                if other != index]
+
+
+class Student:
+    """One student in the crowd."""
+
+    __slots__ = ('number', 'index', 'room', 'target', 'step_ticks', 'wait', 'timetable')
+
+    def __init__(self, number, step_ticks, timetable):
+        """Initialize a student who is not on the map yet."""
+        self.number = number
+        self.index = None  # Padded grid index, or None while inside a room
+        self.room = None  # Room the student is in
+        self.target = None  # Room the student is heading to
+        self.step_ticks = step_ticks
+        self.wait = 0  # Ticks until the next step
+        self.timetable = timetable  # Period -> room
+
+    def __repr__(self):
+        """String representation of the student."""
+        return f"Student({self.number}, target={self.target})"
+
+
+class Crowd:
+    """Students walking between the rooms of a RoomDistances table.
+
+    Students in a room stay inside until their timetable sends them on;
+    they then leave through the room's cell one at a time. Paths never
+    pass through another room, as for the player.
+    """
+
+    def __init__(self, distances, count, seed=None, time_system=None, lunch_room=None, player=None):
+        """Place count students on free hallway cells (around the player) and send them to their first class."""
+        self.distances = distances
+        self.grid = distances.grid
+        self.rng = random.Random(seed)
+        self.hash = SpatialHash(self.grid.stride)
+        self.time_system = time_system or TimeSystem()
+        self.ticks = 0
+        self.period = None
+        self._lag = 0.0
+        self._player_index = None
+        self._fields = {}  # Room -> distance field, for the rooms in use
+        self._leaving = {}  # Room -> students waiting to come out
+        self._room_index = {room: self.grid.index(*cells[0]) for room, cells in distances.rooms.items() if cells}
+
+        if player is not None:
+            self.move_player(player)
+        rooms = sorted(self._room_index)
+        self.students = []
+        for number in range(count):
+            timetable = {period: lunch_room if info["name"] == "Lunch" and lunch_room else self.rng.choice(rooms)
+                         for period, info in TimeSystem.SCHEDULE.items()}
+            student = Student(number, self.rng.randint(MIN_STEP_TICKS, MAX_STEP_TICKS), timetable)
+            student.index = self._free_cell()
+            if student.index is None:
+                break  # The hallways are full
+            self.hash.add(student, student.index)
+            self.students.append(student)
+        self.set_period(self.time_system.current_period)
+
+    def _free_cell(self, attempts=10000):
+        """Pick a random free hallway cell, or None."""
+        cells, stops = self.grid.cells, self.distances.stops
+        for _ in range(attempts):
+            index = self.rng.randrange(len(cells))
+            if cells[index] and index not in stops and index not in self.hash.cells:
+                return index
+        return None
+
+    def set_period(self, period):
+        """Send every student to their room for a period."""
+        self.period = period
+        self._fields = {}
+        self._leaving = {}
+        for student in self.students:
+            student.target = student.timetable.get(period)
+            if student.target is not None and student.target not in self._fields:
+                self._fields[student.target] = self.distances.field(student.target)
+            if student.index is None and student.room != student.target:
+                self._leaving.setdefault(student.room, []).append(student)
+        for queue in self._leaving.values():
+            queue.reverse()  # Pop from the end in timetable order
+
+    def occupied(self, position):
+        """Check whether a student stands on a cell."""
+        occupant = self.hash.at(self.grid.index(*position))
+        return occupant is not None and occupant is not PLAYER
+
+    def move_player(self, position):
+        """Record where the player stands (None takes the player off the map)."""
+        old = self._player_index
+        new = None if position is None else self.grid.index(*position)
+        if old == new:
+            return
+        if old is not None:
+            self.hash.remove(old)
+        if new is not None:
+            self.hash.add(PLAYER, new)
+        self._player_index = new
+
+    def positions(self, x0, y0, x1, y1, floor=0):
+        """Get the cells of students inside a rectangle of one floor (ends excluded)."""
+        row0 = floor * self.grid.floor_rows + 1
+        position = self.grid.position
+        return [position(index) for index in self.hash.within(row0 + y0, x0 + 1, row0 + y1, x1 + 1)
+                if self.hash.cells[index] is not PLAYER]
+
+    def advance(self, elapsed):
+        """Run the fixed ticks that fit in elapsed seconds (plus leftover time); return how many ran."""
+        self._lag += elapsed
+        ticks = min(int(self._lag * TICK_RATE), MAX_CATCH_UP)
+        self._lag = 0.0 if ticks == MAX_CATCH_UP else self._lag - ticks * TICK
+        for _ in range(ticks):
+            self.tick()
+        return ticks
+
+    def tick(self):
+        """Advance the crowd by one fixed step; return the number of students who moved."""
+        self.ticks += 1
+        if self.time_system.current_period != self.period:
+            self.set_period(self.time_system.current_period)
+        moved = 0
+        cells = self.hash.cells
+
+        # One student comes out of each room per tick, when its cell is free
+        for room, queue in self._leaving.items():
+            index = self._room_index[room]
+            if queue and index not in cells:
+                student = queue.pop()
+                student.index, student.room = index, None
+                self.hash.add(student, index)
+                moved += 1
+
+        for student in self.students:
+            if student.index is None or student.target is None:
+                continue
+            if student.wait:
+                student.wait -= 1
+                continue
+            if self._step(student):
+                student.wait = student.step_ticks
+                moved += 1
+        return moved
+
+    def _step(self, student):
+        """Move a student one cell toward their room; return whether they moved."""
+        field = self._fields[student.target]
+        index = student.index
+        distance = field[index]
+        if distance >= WALL:
+            return False
+        if distance == 0:
+            self._enter(student)
+            return True
+        cells, stops, grid = self.hash.cells, self.distances.stops, self.grid
+        steps = grid.steps
+        neighbours = [index + step for step in steps]
+        if index in grid.links:
+            neighbours += grid.links[index]
+        # Start at a different side each time so students spread over the lanes
+        offset = self.ticks + student.number
+        count = len(neighbours)
+        sidestep = swap = None
+        for i in range(count):
+            neighbour = neighbours[(offset + i) % count]
+            value = field[neighbour]
+            if value == distance - 1:
+                if not value:
+                    student.index = neighbour
+                    self._enter(student, moving_from=index)
+                    return True
+                if neighbour in stops:
+                    continue
+                other = cells.get(neighbour)
+                if other is None:
+                    self.hash.move(index, neighbour)
+                    student.index = neighbour
+                    return True
+                if swap is None and other is not PLAYER and other.target is not None:
+                    # Two students meeting head-on (in a doorway) trade places
+                    other_field = self._fields[other.target]
+                    if other_field[index] == other_field[neighbour] - 1:
+                        swap = other
+            elif value == distance + 1 and sidestep is None and neighbour not in cells and neighbour not in stops:
+                sidestep = neighbour
+        if swap is not None:
+            cells[index], cells[swap.index] = swap, student
+            student.index, swap.index = swap.index, index
+            swap.wait = swap.step_ticks
+            return True
+        if sidestep is not None and self.rng.random() < SIDESTEP_CHANCE:
+            self.hash.move(index, sidestep)
+            student.index = sidestep
+            return True
+        return False
+
+    def _enter(self, student, moving_from=None):
+        """Take a student off the map into their target room."""
+        self.hash.remove(student.index if moving_from is None else moving_from)
+        student.index = None
+        student.room = student.target
+
+    def inside(self):
+        """Count the students inside rooms."""
+        return sum(1 for student in self.students if student.index is None)
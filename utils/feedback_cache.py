@@ -0,0 +1,188 @@
+"""
+On-disk cache of the Wordle feedback matrix for the word list.
+Stores one byte per guess/answer pair (a base-3 feedback code) and maps the
+file into memory, so hint lookups are O(1) with no per-process rebuild.
+
+The cache lives next to the word file (data/.cache/) and is keyed on a
+SHA-256 digest of the word list, so it is rebuilt automatically when the
+word file changes. If it cannot be written, the matrix is kept in memory.
+Words outside ASCII are left out; their hints come from get_word_hints.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+
+from utils.hint_engine import feedback_matrix, read_matrix_header, decode_feedback
+from utils.wordlist import DEFAULT_WORD_FILE, get_word_index, _resolve_path
+
+
+CACHE_MAGIC = b'SDFC'
+CACHE_VERSION = 1
+CACHE_DIR = '.cache'
+_CACHE_HEADER = struct.Struct('<4sB32s')  # magic, version, word list digest
+
+# Longest word whose feedback code fits in one byte (3 ** 5 = 243)
+MAX_CACHED_LENGTH = 5
+
+
+def word_list_digest(words):
+    """Get the digest that identifies a word list."""
+    return hashlib.sha256('\n'.join(words).encode('utf-8')).digest()
+
+
+def cache_path(filename=DEFAULT_WORD_FILE, length=5):
+    """Get the cache file path for a word file and word length."""
+    filepath = _resolve_path(filename)
+    directory, name = os.path.split(filepath)
+    return os.path.join(directory, CACHE_DIR, f"{name}.{length}.feedback")
+
+
+class FeedbackCache:
+    """Memory-mapped feedback matrix over one word list (guesses = answers)."""
+
+    def __init__(self, words, codes, mapping=None):
+        """Wrap the words and a buffer of one code byte per pair."""
+        self.words = tuple(words)
+        self.index = {word: i for i, word in enumerate(self.words)}
+        self.length = len(self.words[0]) if self.words else 0
+        self.codes = codes
+        self._mapping = mapping
+
+    @classmethod
+    def open(cls, words, path):
+        """Map the cache file for the ASCII words of a list, rebuilding it if it is stale."""
+        words = tuple(word for word in words if word.isascii())
+        if words and len(words[0]) > MAX_CACHED_LENGTH:
+            raise ValueError(f"Feedback codes for {len(words[0])}-letter words do not fit in a byte")
+        if not words:
+            return cls(words, memoryview(b''))
+        digest = word_list_digest(words)
+
+        cache = cls._map(path, words, digest)
+        if cache is not None:
+            return cache
+
+        matrix = feedback_matrix(words)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(_CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, digest))
+                f.write(matrix.to_bytes())
+            os.replace(temp_path, path)
+        except OSError:
+            # Read-only data directory: keep the freshly built matrix in memory
+            return cls(words, memoryview(matrix.codes))
+        finally:
+            # Never leave a partly written file behind
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+        return cls._map(path, words, digest) or cls(words, memoryview(matrix.codes))
+
+    @classmethod
+    def _map(cls, path, words, digest):
+        """Map an existing cache file, or return None if it is missing or stale."""
+        try:
+            with open(path, 'rb') as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            magic, version, stored_digest = _CACHE_HEADER.unpack_from(mapping, 0)
+            if magic != CACHE_MAGIC or version != CACHE_VERSION or stored_digest != digest:
+                raise ValueError("Stale feedback cache")
+            _, answers, offset, typecode = read_matrix_header(mapping, _CACHE_HEADER.size)
+            size = len(words) * len(words)
+            if typecode != 'B' or tuple(answers) != words or len(mapping) - offset != size:
+                raise ValueError("Stale feedback cache")
+        except (ValueError, struct.error):
+            mapping.close()
+            return None
+        return cls(words, memoryview(mapping)[offset:offset + size], mapping)
+
+    def code(self, guess, answer):
+        """Get the feedback code for a guess and answer (None if either is unknown)."""
+        guess_index = self.index.get(guess)
+        answer_index = self.index.get(answer)
+        if guess_index is None or answer_index is None:
+            return None
+        return self.codes[guess_index * len(self.words) + answer_index]
+
+    def hints(self, guess, answer):
+        """Get hints in get_word_hints form (None if either word is unknown)."""
+        code = self.code(guess, answer)
+        return None if code is None else decode_feedback(code, self.length)
+
+    def row(self, guess):
+        """Get the codes of one guess against every word (zero-copy)."""
+        start = self.index[guess] * len(self.words)
+        return self.codes[start:start + len(self.words)]
+
+    def close(self):
+        """Unmap the cache file (once any rows still in use are freed)."""
+        if self._mapping is not None:
+            self.codes.release()
+            try:
+                self._mapping.close()
+            except BufferError:
+                pass  # Rows handed out still use the mapping; it is unmapped when they go
+            self._mapping = None
+
+
+# Process-wide caches: (word file path, length) -> (WordIndex, FeedbackCache)
+_open_caches = {}
+
+
+def get_feedback_cache(filename=DEFAULT_WORD_FILE, length=5):
+    """Get the shared feedback cache for a word file, rebuilding it if the file changed."""
+    index = get_word_index(filename)
+    key = (_resolve_path(filename), length)
+    cached = _open_caches.get(key)
+    if cached is not None:
+        if cached[0] is index:
+            return cached[1]
+        # The word file changed: release the old mapping before replacing it
+        del _open_caches[key]
+        cached[1].close()
+
+    words = index.by_length(length)
+    cache = FeedbackCache.open(words, cache_path(filename, length))
+    _open_caches[key] = (index, cache)
+    return cache
+
+
+if __name__ == "__main__":
+    import time
+
+    path = cache_path()
+    if os.path.exists(path):
+        os.remove(path)
+
+    start = time.perf_counter()
+    cache = get_feedback_cache()
+    build_time = time.perf_counter() - start
+    _open_caches.clear()
+    cache.close()
+
+    start = time.perf_counter()
+    cache = get_feedback_cache()
+    open_time = time.perf_counter() - start
+
+    words = cache.words
+    start = time.perf_counter()
+    for guess in words[:100]:
+        for answer in words:
+            cache.hints(answer, guess)
+    lookup_time = (time.perf_counter() - start) / (100 * len(words))
+
+    print(f"Words: {len(words)}, cache file: {os.path.getsize(path):,} bytes")
+    print(f"Build and write: {build_time * 1000:.1f} ms")
+    print(f"Map existing:    {open_time * 1000:.2f} ms")
+    print(f"Hint lookup:     {lookup_time * 1e6:.2f} µs")
@@ -1,10 +1,33 @@
 """
 ASCII hallway navigation system for the School Days game.
-Allows player to move through the school in a 2D grid.
+Allows player to move through the school in a 2D grid, step by step or
+straight to a room along a shortest path. Schools are the built-in map or
+a generated multi-floor one; only a window around the player is drawn.
+A crowd of students can share the hallways with the player.
 """
 
-import sys
-import os
+import time
+from collections import deque
+
+from utils.crowd import Crowd, TICK
+from utils.mapgen import SchoolMap, STAIRS_UP, STAIRS_DOWN, generate_school
+from utils.pathfinding import get_room_distances
+from utils.viewport import Viewport
+
+
+# Seconds between steps when walking to a room automatically
+AUTO_STEP_DELAY = 0.03
+
+# Keys that move the player (arrow keys arrive by name)
+MOVE_KEYS = ('w', 'a', 's', 'd', 'up', 'down', 'left', 'right')
+
+# Steps an auto-walk waits for a student to get out of the way before giving up
+MAX_CROWD_WAIT = 100
+
+STUDENT_MARKER = 'o'
+
+# Walkable cells per student in a default-sized crowd
+CELLS_PER_STUDENT = 20
 
 
 class Hallway:
@@ -39,19 +62,51 @@ class Hallway:
         'L': "Nurse's Office"
     }
     
-    def __init__(self):
-        """Initialize the hallway system."""
+    def __init__(self, school_map=None):
+        """Initialize the hallway system (default: the built-in map)."""
+        self.map = school_map or SchoolMap.from_rows(self.SCHOOL_MAP, start=(9, 4))
         # Starting position (middle of hallway)
-        self.player_x = 9
-        self.player_y = 4
-        self.map_data = [list(row) for row in self.SCHOOL_MAP]
-        
+        self.player_x, self.player_y = self.map.start[:2]
+        self.floor = self.map.start[2] if len(self.map.start) == 3 else 0
+        self.view = Viewport()
+        self.crowd = None
+    
+    @classmethod
+    def generate(cls, seed=None, width=120, height=60, floors=1):
+        """Create a hallway on a generated school map."""
+        return cls(generate_school(width, height, floors, seed, labels=''.join(cls.ROOMS)))
+    
+    def add_crowd(self, count=None, seed=None, time_system=None):
+        """Fill the hallways with students following the school schedule (default: one per CELLS_PER_STUDENT cells)."""
+        if count is None:
+            count = max(1, sum(self.grid().cells) // CELLS_PER_STUDENT)
+        player = self.map.position(self.player_x, self.player_y, self.floor)
+        self.crowd = Crowd(self.room_distances(), count, seed, time_system,
+                           lunch_room=self.find_room("Cafeteria"), player=player)
+        return self.crowd
+    
+    def _sync_crowd(self):
+        """Tell the crowd where the player stands."""
+        if self.crowd is not None:
+            self.crowd.move_player(self.map.position(self.player_x, self.player_y, self.floor))
+    
+    def _crowd_marks(self):
+        """Get the students in view, as viewport markers (None without a crowd)."""
+        if self.crowd is None:
+            return None
+        x0, y0, x1, y1 = self.view.window(self.map_data, self.player_x, self.player_y)
+        return {cell[:2]: STUDENT_MARKER for cell in self.crowd.positions(x0, y0, x1, y1, self.floor)}
+    
+    @property
+    def map_data(self):
+        """Rows of the current floor as strings."""
+        return self.map.rows(self.floor)
+    
     def can_move(self, x, y):
         """Check if the player can move to the given position."""
-        if 0 <= y < len(self.map_data) and 0 <= x < len(self.map_data[0]):
-            cell = self.map_data[y][x]
-            return cell != '#'
-        return False
+        if not self.map.is_walkable(x, y, self.floor):
+            return False
+        return self.crowd is None or not self.crowd.occupied(self.map.position(x, y, self.floor))
     
     def move(self, direction):
         """Move the player in the given direction."""
@@ -69,14 +124,26 @@ class Hallway:
             return False
         
         if self.can_move(new_x, new_y):
+            # Stairwells lead straight to the next floor
+            new_floor = self.floor
+            cell = self.map.cell(new_x, new_y, self.floor)
+            if cell == STAIRS_UP:
+                new_floor += 1
+            elif cell == STAIRS_DOWN:
+                new_floor -= 1
+            if new_floor != self.floor and self.crowd is not None and \
+                    self.crowd.occupied(self.map.position(new_x, new_y, new_floor)):
+                return False
             self.player_x = new_x
             self.player_y = new_y
+            self.floor = new_floor
+            self._sync_crowd()
             return True
         return False
     
     def get_current_room(self):
         """Get the current room name if player is standing on a room location."""
-        cell = self.map_data[self.player_y][self.player_x]
+        cell = chr(self.map.cell(self.player_x, self.player_y, self.floor))
         if cell in self.ROOMS:
             return self.ROOMS[cell]
         return None
@@ -84,22 +151,20 @@ class Hallway:
     def render(self):
         """Render the hallway with the player position."""
         lines = []
-        lines.append("\n🏫 School Hallway")
+        if len(self.map.floors) > 1:
+            lines.append(f"\n🏫 School Hallway - Floor {self.floor + 1}")
+        else:
+            lines.append("\n🏫 School Hallway")
         lines.append("=" * 40)
         
-        for y, row in enumerate(self.map_data):
-            line = ""
-            for x, cell in enumerate(row):
-                if x == self.player_x and y == self.player_y:
-                    line += "*"  # Player marker
-                else:
-                    line += cell
-            lines.append(line)
+        # The map window starts on the screen row after the lines so far
+        self.view.top = "\n".join(lines).count("\n") + 2
+        lines.extend(self.view.lines(self.map_data, self.player_x, self.player_y, self._crowd_marks()))
         
         lines.append("=" * 40)
         
         # Show controls
-        lines.append("Controls: W/↑=Up, S/↓=Down, A/←=Left, D/→=Right, Q=Quit")
+        lines.append("Controls: W/↑=Up, S/↓=Down, A/←=Left, D/→=Right, G=Go to room, Q=Quit")
         
         # Show current location
         current_room = self.get_current_room()
@@ -109,10 +174,72 @@ class Hallway:
             lines.append("\n📍 You are in the hallway")
         
         # Show legend
-        lines.append("\nLegend: * = You, # = Wall, Letters = Rooms")
+        legend = "\nLegend: * = You, # = Wall, Letters = Rooms"
+        if len(self.map.floors) > 1:
+            legend += ", < = Stairs up, > = Stairs down"
+        if self.crowd is not None:
+            legend += f", {STUDENT_MARKER} = Student"
+        lines.append(legend)
         
         return "\n".join(lines)
     
+    def grid(self):
+        """Get the pathfinding grid of the map."""
+        return self.map.grid()
+    
+    def room_cells(self):
+        """Get the cells of every room on the map."""
+        return {letter: cells for letter, cells in self.map.room_cells().items() if letter in self.ROOMS}
+    
+    def room_distances(self):
+        """Get the room-to-room distance table of the map (built once and cached)."""
+        return get_room_distances(self.grid(), self.room_cells())
+    
+    def find_room(self, room):
+        """Get the map letter of a room from its letter or name, or None if unknown."""
+        for letter, room_name in self.ROOMS.items():
+            if room.upper() == letter or room.lower() == room_name.lower():
+                return letter
+        return None
+    
+    def path_to(self, room):
+        """Get the cells of a shortest path from the player to a room, or None."""
+        letter = self.find_room(room)
+        if letter is None or letter not in self.room_cells():
+            return None
+        start = self.map.position(self.player_x, self.player_y, self.floor)
+        return self.room_distances().path(start, letter)
+    
+    def go_to(self, room, on_step=None):
+        """Walk the player to a room along a shortest path, calling on_step after each move.
+        
+        With a crowd, the students move on every step and the player waits
+        for any in the way. Returns the name of the room reached, or None if
+        it cannot be reached.
+        """
+        path = self.path_to(room)
+        if path is None:
+            return None
+        for cell in path:
+            if self.crowd is not None:
+                for _ in range(MAX_CROWD_WAIT):
+                    if not self.crowd.occupied(cell):
+                        break
+                    self.crowd.advance(AUTO_STEP_DELAY)
+                    if on_step:
+                        on_step()
+                else:
+                    return None
+            self.player_x, self.player_y = cell[:2]
+            if len(cell) == 3:
+                self.floor = cell[2]
+            self._sync_crowd()
+            if self.crowd is not None:
+                self.crowd.advance(AUTO_STEP_DELAY)
+            if on_step:
+                on_step()
+        return self.get_current_room()
+    
     def get_room_list(self):
         """Get a formatted list of all rooms."""
         lines = ["\n🗺️  School Map:"]
@@ -124,44 +251,99 @@ class Hallway:
     
     def navigate(self):
         """Run the navigation mini-game."""
-        from game.ui import clear_screen, print_colored, Colors
-        
-        print(self.get_room_list())
-        print("\nNavigate to your destination using WASD or arrow keys.")
-        print("Press Q to exit navigation mode.\n")
-        input("Press Enter to start...")
-        
-        while True:
-            clear_screen()
-            print(self.render())
-            
-            # Get input
-            if os.name == 'nt':  # Windows
-                import msvcrt
-                key = msvcrt.getch().decode('utf-8').lower()
-            else:  # Unix/Linux/Mac
-                import tty
-                import termios
-                fd = sys.stdin.fileno()
-                old_settings = termios.tcgetattr(fd)
-                try:
-                    tty.setraw(fd)
-                    key = sys.stdin.read(1).lower()
-                finally:
-                    termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-            
-            if key == 'q':
-                break
-            elif key in ['w', 's', 'a', 'd']:
-                moved = self.move(key)
-                if not moved:
-                    print_colored("\n⚠ Can't move there!", Colors.RED)
-                else:
-                    current_room = self.get_current_room()
-                    if current_room:
-                        print_colored(f"\n✓ Arrived at {current_room}!", Colors.GREEN)
-                        input("\nPress Enter to continue...")
-                        break
+        from game.ui import print_colored, Colors, FrameBuffer, get_output_backend, pause, write_line
+        from utils.keyboard import KeyReader
+        
+        write_line(self.get_room_list())
+        write_line("\nNavigate to your destination using WASD or arrow keys.")
+        write_line("Press Q to exit navigation mode.\n")
+        pause("Press Enter to start...")
+        
+        # Plain moves only rewrite the two map cells that changed; anything
+        # else redraws the lines that changed
+        frame = FrameBuffer()
+        output = get_output_backend()
+        self.view.invalidate()
+        message = None
+        
+        def draw():
+            if not message and self.get_current_room() is None:
+                patch = self.view.patch(self.map_data, self.player_x, self.player_y, self._crowd_marks())
+                if patch is not None:
+                    if patch:
+                        output.write(patch)
+                        output.flush()
+                        # The screen no longer matches the frame's map lines
+                        top = self.view.top - 1
+                        frame.invalidate(range(top, top + min(self.view.height, len(self.map_data))))
+                    return
+            frame.add(self.render())
+            if message:
+                frame.add(*message)
+                self.view.invalidate()  # So the next frame clears the message
+            frame.flush()
+        
+        def step():
+            draw()
+            time.sleep(AUTO_STEP_DELAY)
+        
+        # The terminal stays in cbreak mode for the whole session; keys that
+        # arrive together are handled before the next redraw. With a crowd,
+        # waiting for keys also runs the students' ticks
+        pending = deque()
+        last_tick = time.perf_counter()
+        
+        def next_event():
+            nonlocal last_tick
+            while not pending:
+                if self.crowd is None:
+                    pending.extend(keys.events())
+                    continue
+                pending.extend(keys.events(timeout=TICK))
+                now = time.perf_counter()
+                ticks = self.crowd.advance(now - last_tick)
+                last_tick = now
+                if ticks and not pending:
+                    draw()
+            return pending.popleft()
+        
+        arrived = None
+        with KeyReader() as keys:
+            while arrived is None:
+                if not pending:
+                    draw()
+                
+                key, count = next_event()
+                key = key.lower()
+                message = None
+                
+                if key == 'q':
+                    break
+                elif key == 'g':
+                    message = ("\nGo to which room? Press its letter.", Colors.CYAN)
+                    draw()
+                    room, _ = next_event()
+                    message = None
+                    arrived = self.go_to(room, step)
+                    last_tick = time.perf_counter()
+                    if arrived is None and self.path_to(room) is not None:
+                        message = ("\n⚠ The way is blocked!", Colors.RED)
+                    elif arrived is None:
+                        message = ("\n⚠ There's no such room!", Colors.RED)
+                elif key in MOVE_KEYS:
+                    # A held key moves once per repeat but redraws once
+                    for _ in range(count):
+                        if not self.move(key):
+                            message = ("\n⚠ Can't move there!", Colors.RED)
+                            break
+                        arrived = self.get_current_room()
+                        if arrived:
+                            break
+        
+        if arrived:
+            draw()
+            print_colored(f"\n✓ Arrived at {arrived}!", Colors.GREEN)
+            pause()
         
         return self.get_current_room()
 
@@ -181,11 +363,13 @@ class SimpleHallway:
             "Gymnasium"
         ]
         self.current_index = 0
-        
+    
     def show_options(self):
         """Show available movement options."""
-        print("\n🏫 Current Location:", self.locations[self.current_index])
-        print("\nWhere would you like to go?")
+        from game.ui import write_line
+        
+        write_line(f"\n🏫 Current Location: {self.locations[self.current_index]}")
+        write_line("\nWhere would you like to go?")
         
         options = []
         if self.current_index > 0:
@@ -195,7 +379,7 @@ class SimpleHallway:
         options.append(f"{len(options) + 1}. Stay here")
         
         for opt in options:
-            print(opt)
+            write_line(opt)
         
         return len(options)
     
@@ -0,0 +1,275 @@
+"""
+Batched Wordle hint scoring for solvers and analytics.
+Scores one guess against a whole answer list at once and builds the full
+guess-by-answer feedback matrix, with results identical to get_word_hints.
+
+Feedback is a base-3 code with one digit per letter (position 0 is the
+least significant): 0 = absent, 1 = present, 2 = correct.
+
+Scoring is vectorized without NumPy: each answer gets one byte lane in a
+big integer, letter comparisons are done with bytes.translate over columns
+of the encoded answers, and lanes are combined with plain integer
+arithmetic, so a whole row costs a few dozen C-level operations.
+"""
+
+import struct
+import sys
+from array import array
+
+
+HINT_NAMES = ('absent', 'present', 'correct')
+HINT_DIGITS = {name: digit for digit, name in enumerate(HINT_NAMES)}
+
+# Longest word whose feedback code fits a 16-bit cell (3 ** 10 < 65536)
+MAX_WORD_LENGTH = 10
+
+MATRIX_MAGIC = b'SDFM'
+MATRIX_VERSION = 1
+_MATRIX_HEADER = struct.Struct('<4sBBBII')  # magic, version, length, itemsize, guesses, answers
+
+# Translate tables over byte lanes
+_EQUAL = [bytes(int(value == letter) for value in range(256)) for letter in range(256)]
+_NONZERO = bytes(int(value != 0) for value in range(256))
+# Lanes holding "letters left" are offset by _BIAS so they never go negative
+_BIAS = 32
+_ABOVE_BIAS = bytes(int(value > _BIAS) for value in range(256))
+
+
+def encode_word(word, length=None):
+    """Encode a word as a fixed-width integer array (one byte per letter)."""
+    encoded = word.upper().encode('ascii')
+    if length is not None and len(encoded) != length:
+        raise ValueError(f"Expected a {length}-letter word, got {word!r}")
+    return encoded
+
+
+def encode_words(words):
+    """Encode a list of words that must all have the same length."""
+    encoded = [encode_word(word) for word in words]
+    if encoded:
+        length = len(encoded[0])
+        for word, data in zip(words, encoded):
+            if len(data) != length:
+                raise ValueError(f"Expected a {length}-letter word, got {word!r}")
+    return encoded
+
+
+def feedback_code(guess, answer):
+    """Score one guess against one answer as a base-3 feedback code."""
+    if len(guess) != len(answer):
+        raise ValueError("Guess and answer must have the same length")
+    code = 0
+    power = 1
+    remaining = {}
+    missed = []
+    for g, a in zip(guess, answer):
+        if g == a:
+            code += 2 * power
+        else:
+            remaining[a] = remaining.get(a, 0) + 1
+            missed.append((g, power))
+        power *= 3
+    for g, power in missed:
+        count = remaining.get(g)
+        if count:
+            code += power
+            remaining[g] = count - 1
+    return code
+
+
+def decode_feedback(code, length):
+    """Convert a feedback code into a list of 'correct'/'present'/'absent'."""
+    hints = []
+    for _ in range(length):
+        code, digit = divmod(code, 3)
+        hints.append(HINT_NAMES[digit])
+    return hints
+
+
+def encode_hints(hints):
+    """Convert a list of hint names (as from get_word_hints) into a feedback code."""
+    code = 0
+    for hint in reversed(hints):
+        code = code * 3 + HINT_DIGITS[hint]
+    return code
+
+
+def _code_typecode(length):
+    """Get the array typecode that holds feedback codes for a word length."""
+    if length > MAX_WORD_LENGTH:
+        raise ValueError(f"Words longer than {MAX_WORD_LENGTH} letters are not supported")
+    return 'B' if 3 ** length <= 256 else 'H'
+
+
+def _lanes(data):
+    """Load bytes into a big integer with one byte lane per answer."""
+    return int.from_bytes(data, 'big')
+
+
+class HintEngine:
+    """Scores guesses against a fixed answer list, one full row at a time."""
+
+    def __init__(self, answers):
+        """Encode the answers into per-position columns."""
+        self.answers = tuple(word.upper() for word in answers)
+        if not self.answers:
+            raise ValueError("HintEngine needs at least one answer")
+        encoded = encode_words(self.answers)
+        self.length = len(encoded[0])
+        self.typecode = _code_typecode(self.length)
+
+        joined = b''.join(encoded)
+        self._size = len(self.answers)
+        self._columns = [joined[i::self.length] for i in range(self.length)]
+        self._ones = _lanes(b'\x01' * self._size)
+        self._letters = {}  # letter -> (count lanes, contains lanes)
+
+    def _letter_lanes(self, letter):
+        """Get per-answer counts of a letter and whether it appears at all."""
+        lanes = self._letters.get(letter)
+        if lanes is None:
+            table = _EQUAL[letter]
+            counts = sum(_lanes(column.translate(table)) for column in self._columns)
+            contains = _lanes(counts.to_bytes(self._size, 'big').translate(_NONZERO))
+            lanes = self._letters[letter] = (counts, contains)
+        return lanes
+
+    def _digit_lanes(self, guess):
+        """Score a guess and return the raw per-position digit lanes."""
+        encoded = encode_word(guess, self.length)
+        size = self._size
+        ones = self._ones
+        green = [_lanes(column.translate(_EQUAL[letter])) for column, letter in zip(self._columns, encoded)]
+
+        positions = {}
+        for i, letter in enumerate(encoded):
+            positions.setdefault(letter, []).append(i)
+
+        digits = [0] * self.length
+        for letter, where in positions.items():
+            counts, contains = self._letter_lanes(letter)
+            if len(where) == 1:
+                # A single copy is correct (2), present (1) or absent (0)
+                i = where[0]
+                digits[i] = green[i] + contains
+                continue
+
+            # Repeated letters: copies that are not correct are marked present,
+            # left to right, while the answer still has unmatched copies
+            available = counts + _BIAS * ones - sum(green[i] for i in where)
+            earlier = 0
+            for i in where:
+                missed = ones - green[i]
+                above = _lanes((available - earlier).to_bytes(size, 'big').translate(_ABOVE_BIAS))
+                digits[i] = 2 * green[i] + (missed & above)
+                earlier += missed
+        return digits
+
+    def score(self, guess):
+        """Score a guess against every answer, returning an array of feedback codes."""
+        digits = self._digit_lanes(guess)
+        size = self._size
+        if self.typecode == 'B':
+            code = sum(lane * 3 ** i for i, lane in enumerate(digits))
+            return array('B', code.to_bytes(size, 'big'))
+
+        # Widen each byte lane to two bytes before combining the digits
+        code = 0
+        for i, lane in enumerate(digits):
+            wide = bytearray(2 * size)
+            wide[1::2] = lane.to_bytes(size, 'big')
+            code += _lanes(wide) * 3 ** i
+        row = array('H', code.to_bytes(2 * size, 'big'))
+        if sys.byteorder == 'little':
+            row.byteswap()
+        return row
+
+
+class FeedbackMatrix:
+    """Guess-by-answer feedback codes stored row-major in a flat array."""
+
+    def __init__(self, guesses, answers, codes):
+        """Wrap a flat array of codes (len(guesses) rows of len(answers))."""
+        self.guesses = tuple(guesses)
+        self.answers = tuple(answers)
+        self.codes = codes
+        self.length = len(self.answers[0]) if self.answers else 0
+        self.guess_index = {word: i for i, word in enumerate(self.guesses)}
+        self.answer_index = {word: i for i, word in enumerate(self.answers)}
+
+    def code(self, guess, answer):
+        """Get the feedback code for a guess and answer."""
+        return self.codes[self.guess_index[guess] * len(self.answers) + self.answer_index[answer]]
+
+    def hints(self, guess, answer):
+        """Get hints for a guess and answer in get_word_hints form."""
+        return decode_feedback(self.code(guess, answer), self.length)
+
+    def row(self, guess):
+        """Get the codes of one guess against every answer."""
+        start = self.guess_index[guess] * len(self.answers)
+        return self.codes[start:start + len(self.answers)]
+
+    def to_bytes(self):
+        """Serialize the matrix (little-endian codes)."""
+        codes = self.codes
+        if sys.byteorder == 'big' and codes.itemsize > 1:
+            codes = array(codes.typecode, codes)
+            codes.byteswap()
+        header = _MATRIX_HEADER.pack(
+            MATRIX_MAGIC, MATRIX_VERSION, self.length, codes.itemsize,
+            len(self.guesses), len(self.answers),
+        )
+        words = ''.join(self.guesses + self.answers).encode('ascii')
+        return header + words + codes.tobytes()
+
+    def save(self, path):
+        """Write the matrix to disk."""
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read a matrix written by save()."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        guesses, answers, offset, typecode = read_matrix_header(data)
+        codes = array(typecode)
+        codes.frombytes(data[offset:])
+        if sys.byteorder == 'big' and codes.itemsize > 1:
+            codes.byteswap()
+        if len(codes) != len(guesses) * len(answers):
+            raise ValueError("Feedback matrix file is truncated")
+        return cls(guesses, answers, codes)
+
+
+def read_matrix_header(data, start=0):
+    """Parse a saved matrix header at start, returning (guesses, answers, codes offset, typecode)."""
+    try:
+        magic, version, length, itemsize, guess_count, answer_count = _MATRIX_HEADER.unpack_from(data, start)
+    except struct.error:
+        raise ValueError("Feedback matrix file is truncated") from None
+    if magic != MATRIX_MAGIC or version != MATRIX_VERSION:
+        raise ValueError("Not a feedback matrix file")
+    typecode = _code_typecode(length)
+    if array(typecode).itemsize != itemsize:
+        raise ValueError("Feedback matrix cell size does not match")
+
+    offset = start + _MATRIX_HEADER.size
+    end = offset + (guess_count + answer_count) * length
+    if end > len(data):
+        raise ValueError("Feedback matrix file is truncated")
+    words = bytes(data[offset:end]).decode('ascii')
+    words = [words[i:i + length] for i in range(0, len(words), length)] if length else []
+    return words[:guess_count], words[guess_count:], end, typecode
+
+
+def feedback_matrix(guesses, answers=None):
+    """Build the full feedback matrix of guesses against answers (default: the guesses)."""
+    guesses = [word.upper() for word in guesses]
+    answers = guesses if answers is None else [word.upper() for word in answers]
+    engine = HintEngine(answers)
+    codes = array(engine.typecode)
+    for guess in guesses:
+        codes.extend(engine.score(guess))
+    return FeedbackMatrix(guesses, engine.answers, codes)
@@ -0,0 +1,209 @@
+"""
+Timing instrumentation for the School Days mini-games.
+Records per-question response latency, per-game wall time and the engine
+overhead (wall time minus time spent waiting for the player) into
+LatencyHistograms, using the monotonic high-resolution perf_counter clock.
+
+Instrumentation is off by default. While it is off, the wrappers below
+are a single global check before calling straight through.
+
+Enable it for a play session with:
+    SCHOOL_DAYS_METRICS=metrics.json python main.py
+"""
+
+import functools
+import json
+import time
+
+from game.ui import get_input, get_choice
+from utils.metrics import LatencyHistogram
+
+
+class GameMetrics:
+    """Latency histograms for one mini-game."""
+
+    __slots__ = ('plays', 'response', 'wall', 'engine')
+
+    def __init__(self):
+        """Initialize empty histograms."""
+        self.plays = 0
+        self.response = LatencyHistogram()  # Prompt shown -> answer entered
+        self.wall = LatencyHistogram()  # Whole game
+        self.engine = LatencyHistogram()  # Whole game minus player time
+
+    def to_dict(self):
+        """Export summaries and raw buckets."""
+        return {
+            'plays': self.plays,
+            **{
+                name: {'summary': histogram.summary(), 'buckets': histogram.to_dict()}
+                for name, histogram in (('response', self.response), ('wall', self.wall),
+                                        ('engine', self.engine))
+            },
+        }
+
+
+class _GameTimer:
+    """Timing state of the game being played."""
+
+    __slots__ = ('metrics', 'start', 'player_time')
+
+    def __init__(self, metrics):
+        """Start timing a game."""
+        self.metrics = metrics
+        self.start = time.perf_counter()
+        self.player_time = 0.0
+
+
+class Instrumentation:
+    """Collects GameMetrics for every mini-game played."""
+
+    def __init__(self):
+        """Initialize with no recorded games."""
+        self.games = {}
+        self._current = None
+
+    def start_game(self, name):
+        """Start timing a game, returning the timer of any game it interrupts."""
+        metrics = self.games.get(name)
+        if metrics is None:
+            metrics = self.games[name] = GameMetrics()
+        previous = self._current
+        self._current = _GameTimer(metrics)
+        return previous
+
+    def end_game(self, previous=None):
+        """Stop timing the current game and record its wall and engine time."""
+        timer = self._current
+        wall = time.perf_counter() - timer.start
+        metrics = timer.metrics
+        metrics.plays += 1
+        metrics.wall.record(wall)
+        metrics.engine.record(max(0.0, wall - timer.player_time))
+        self._current = previous
+        if previous is not None:
+            # The nested game counts as player time for the outer one
+            previous.player_time += wall
+
+    def wait(self, func, args, kwargs, question):
+        """Call a function that waits for the player, timing it."""
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            timer = self._current
+            if timer is not None:
+                timer.player_time += elapsed
+                if question:
+                    timer.metrics.response.record(elapsed)
+
+    def export(self):
+        """Export every game's metrics as a dict."""
+        return {name: metrics.to_dict() for name, metrics in sorted(self.games.items())}
+
+    def save(self, path):
+        """Write the exported metrics as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.export(), f, indent=2)
+
+    def reset(self):
+        """Forget all recorded games."""
+        self.games = {}
+
+
+_instrumentation = None  # The active Instrumentation, or None when disabled
+
+
+def enable_instrumentation():
+    """Turn instrumentation on and return the active recorder."""
+    global _instrumentation
+    if _instrumentation is None:
+        _instrumentation = Instrumentation()
+    return _instrumentation
+
+
+def disable_instrumentation():
+    """Turn instrumentation off and return the recorder that was active."""
+    global _instrumentation
+    recorder, _instrumentation = _instrumentation, None
+    return recorder
+
+
+def get_instrumentation():
+    """Get the active recorder, or None when instrumentation is off."""
+    return _instrumentation
+
+
+def instrumented(name):
+    """Decorator that times a mini-game's play function under a game name."""
+    def decorate(play):
+        @functools.wraps(play)
+        def wrapper(*args, **kwargs):
+            recorder = _instrumentation
+            if recorder is None:
+                return play(*args, **kwargs)
+            previous = recorder.start_game(name)
+            try:
+                return play(*args, **kwargs)
+            finally:
+                recorder.end_game(previous)
+        return wrapper
+    return decorate
+
+
+def timed_input(prompt, *args, **kwargs):
+    """get_input for a question: records the response latency."""
+    recorder = _instrumentation
+    if recorder is None:
+        return get_input(prompt, *args, **kwargs)
+    return recorder.wait(get_input, (prompt,) + args, kwargs, True)
+
+
+def timed_choice(prompt, num_choices):
+    """get_choice for a question: records the response latency."""
+    recorder = _instrumentation
+    if recorder is None:
+        return get_choice(prompt, num_choices)
+    return recorder.wait(get_choice, (prompt, num_choices), {}, True)
+
+
+def timed_question(func, *args, **kwargs):
+    """Call any function that asks the player a question, recording its latency."""
+    recorder = _instrumentation
+    if recorder is None:
+        return func(*args, **kwargs)
+    return recorder.wait(func, args, kwargs, True)
+
+
+def timed_wait(func, *args, **kwargs):
+    """Call a function that waits for the player (like a pause) as player time."""
+    recorder = _instrumentation
+    if recorder is None:
+        return func(*args, **kwargs)
+    return recorder.wait(func, args, kwargs, False)
+
+
+if __name__ == "__main__":
+    # Overhead of the wrappers with instrumentation off and on
+    runs = 200000
+
+    def answer(prompt):
+        return prompt
+
+    @instrumented('benchmark')
+    def play():
+        return timed_wait(answer, "42")
+
+    def plain():
+        return answer("42")
+
+    for label in ("plain call", "disabled", "enabled"):
+        if label == "enabled":
+            enable_instrumentation()
+        func = plain if label == "plain call" else play
+        start = time.perf_counter()
+        for _ in range(runs):
+            func()
+        elapsed = (time.perf_counter() - start) / runs
+        print(f"{label:<12}{elapsed * 1e9:>8.0f} ns per game")
@@ -0,0 +1,237 @@
+"""
+Raw keyboard input for the School Days game.
+Reads keypresses without waiting for Enter, using termios on Unix and
+msvcrt on Windows, either one key at a time, as a timestamped stream, or
+as decoded keys (arrows included) with held-key repeats coalesced.
+"""
+
+import codecs
+import os
+import re
+import sys
+import time
+
+
+ENTER_KEYS = ('\r', '\n')
+BACKSPACE_KEYS = ('\x7f', '\b')
+ESCAPE = '\x1b'
+CTRL_C = '\x03'
+
+# Final character of an arrow escape sequence (ESC [ A, ESC O A, ESC [ 1 ; 5 A) -> key name
+ARROW_KEYS = {'A': 'up', 'B': 'down', 'C': 'right', 'D': 'left'}
+
+# Second character of a Windows arrow key (after '\x00' or '\xe0') -> key name
+WINDOWS_ARROW_KEYS = {'H': 'up', 'P': 'down', 'M': 'right', 'K': 'left'}
+
+# Seconds to wait for the rest of an escape sequence before taking ESC alone
+ESCAPE_TIMEOUT = 0.05
+
+_ESCAPE_SEQUENCE = re.compile(r'\x1b(?:\[[0-9;]*[A-Za-z~]|O[A-Za-z])')
+_ESCAPE_PREFIX = re.compile(r'\x1b(?:\[[0-9;]*|O)?')
+
+
+def is_interactive():
+    """Check whether stdin is a terminal that can deliver single keypresses."""
+    try:
+        return sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def read_key():
+    """Read a single keypress (the terminal is restored afterwards)."""
+    if os.name == 'nt':  # Windows
+        import msvcrt
+        return msvcrt.getwch()
+
+    # Unix/Linux/Mac
+    import tty
+    import termios
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        return sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+class RawKeyboard:
+    """Keeps the terminal in cbreak mode and reads keys as they arrive.
+
+    Keys are not echoed and arrive without Enter, but Ctrl+C still raises
+    KeyboardInterrupt and output newlines still work. Every key already
+    buffered is returned by one read(), with the time it was read.
+    """
+
+    def __init__(self):
+        """Initialize the keyboard (the terminal is switched on enter)."""
+        self.fd = None
+        self.old_settings = None
+        self._decoder = codecs.getincrementaldecoder('utf-8')('replace')
+
+    def __enter__(self):
+        """Switch the terminal to cbreak mode."""
+        if os.name != 'nt':
+            import termios
+            import tty
+            self.fd = sys.stdin.fileno()
+            self.old_settings = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)
+        return self
+
+    def __exit__(self, *exc_info):
+        """Restore the terminal."""
+        if self.old_settings is not None:
+            import termios
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
+            self.old_settings = None
+
+    def read(self, timeout=None):
+        """Wait up to timeout seconds (None = forever) for keys.
+
+        Returns (timestamp, text) with every buffered key, or (timestamp, '')
+        if the timeout expired. The timestamp is when the read returned, so
+        all keys in one text share it. Escape sequences (arrows, function
+        keys) are passed through raw; decode_keys() splits them out.
+        """
+        if self.fd is not None:
+            import select
+            ready, _, _ = select.select([self.fd], [], [], timeout)
+            now = time.perf_counter()
+            if not ready:
+                return now, ''
+            return now, self._decoder.decode(os.read(self.fd, 1024))
+
+        import msvcrt
+        end = None if timeout is None else time.perf_counter() + timeout
+        while not msvcrt.kbhit():
+            if end is not None and time.perf_counter() >= end:
+                return time.perf_counter(), ''
+            time.sleep(0.001)
+        now = time.perf_counter()
+        keys = []
+        while msvcrt.kbhit():
+            keys.append(msvcrt.getwch())
+        return now, ''.join(keys)
+
+
+def decode_keys(text):
+    """Split raw input into keys, naming arrows; return (keys, unfinished escape sequence)."""
+    keys = []
+    i = 0
+    while i < len(text):
+        if text[i] != ESCAPE:
+            keys.append(text[i])
+            i += 1
+            continue
+        match = _ESCAPE_SEQUENCE.match(text, i)
+        if match:
+            sequence = match.group()
+            keys.append(ARROW_KEYS.get(sequence[-1], sequence))
+            i = match.end()
+        elif _ESCAPE_PREFIX.fullmatch(text, i):
+            return keys, text[i:]  # The rest may still be on its way
+        else:
+            keys.append(ESCAPE)
+            i += 1
+    return keys, ''
+
+
+def coalesce(keys):
+    """Collapse runs of the same key into (key, count) pairs."""
+    events = []
+    for key in keys:
+        if events and events[-1][0] == key:
+            events[-1][1] += 1
+        else:
+            events.append([key, 1])
+    return [(key, count) for key, count in events]
+
+
+class KeyReader(RawKeyboard):
+    """Keeps the terminal in cbreak mode for a whole session and reads decoded keys.
+
+    Waits on a selector, then takes everything already buffered, so a
+    held key arrives as one (key, count) event instead of one redraw per
+    repeat. Arrow keys are returned as 'up', 'down', 'left' and 'right'.
+    """
+
+    def __init__(self, fd=None):
+        """Initialize the reader for fd (default: stdin)."""
+        super().__init__()
+        self.input_fd = fd
+        self.selector = None
+        self._pending = ''  # Start of an escape sequence still being read
+
+    def __enter__(self):
+        """Switch the terminal to cbreak mode and start watching it."""
+        if os.name == 'nt' and self.input_fd is None:
+            return self
+        import selectors
+        self.fd = sys.stdin.fileno() if self.input_fd is None else self.input_fd
+        if os.isatty(self.fd):
+            import termios
+            import tty
+            self.old_settings = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.fd, selectors.EVENT_READ)
+        return self
+
+    def __exit__(self, *exc_info):
+        """Restore the terminal."""
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
+        super().__exit__(*exc_info)
+
+    def _read_ready(self, timeout):
+        """Read everything buffered once input is ready, or '' after timeout seconds."""
+        if not self.selector.select(timeout):
+            return ''
+        chunks = []
+        while True:
+            chunk = os.read(self.fd, 4096)
+            if not chunk:
+                if not chunks:
+                    raise EOFError("Input closed")
+                break
+            chunks.append(self._decoder.decode(chunk))
+            if not self.selector.select(0):
+                break
+        return ''.join(chunks)
+
+    def events(self, timeout=None):
+        """Wait up to timeout seconds (None = forever) for keys; return them as (key, count) pairs."""
+        if self.selector is None:
+            return coalesce(self._windows_keys(timeout))
+        text = self._pending + self._read_ready(timeout)
+        keys, self._pending = decode_keys(text)
+        while self._pending:
+            more = self._read_ready(ESCAPE_TIMEOUT)
+            if not more:
+                # Nothing followed: the characters were typed on their own
+                keys.extend(self._pending)
+                self._pending = ''
+                break
+            tail, self._pending = decode_keys(self._pending + more)
+            keys.extend(tail)
+        return coalesce(keys)
+
+    def _windows_keys(self, timeout):
+        """Read every buffered key with msvcrt, naming arrows."""
+        import msvcrt
+        end = None if timeout is None else time.perf_counter() + timeout
+        while not msvcrt.kbhit():
+            if end is not None and time.perf_counter() >= end:
+                return []
+            time.sleep(0.001)
+        keys = []
+        while msvcrt.kbhit():
+            key = msvcrt.getwch()
+            if key in ('\x00', '\xe0'):
+                key = msvcrt.getwch()
+                key = WINDOWS_ARROW_KEYS.get(key, key)
+            keys.append(key)
+        return keys
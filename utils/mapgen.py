@@ -0,0 +1,371 @@
+"""
+Procedural multi-floor school maps for the hallway.
+A seeded generator lays corridors on a lattice shared by every floor,
+keeps a random connected subset of corridor segments per floor, fills the
+blocks between them with rooms and joins floors with stairwells. Each floor
+is one bytearray of map characters; a flood fill over horizontal runs of
+walkable cells checks that every labelled room can be reached.
+"""
+
+import random
+import re
+from bisect import bisect_right
+
+from utils.pathfinding import Grid
+
+
+WALL = ord('#')
+FLOOR = ord(' ')
+STAIRS_UP = ord('<')
+STAIRS_DOWN = ord('>')
+
+CORRIDOR_WIDTH = 2
+MIN_BLOCK = 6  # Block between corridors, room walls included
+MAX_BLOCK = 14
+MIN_ROOM = 3  # Room interior
+SPLIT_CHANCE = 0.6  # Chance a block big enough for two rooms is split
+EXTRA_SEGMENT_CHANCE = 0.5  # Chance a corridor segment not needed for connectivity is kept
+STAIRWELLS = 4  # Per pair of adjacent floors
+
+DEFAULT_LABELS = 'ABCDEFGHIJKL'
+
+_RUN = re.compile(rb'[^#]+')
+
+
+class SchoolMap:
+    """A school map: one bytearray of map characters per floor.
+
+    Positions are (x, y) on single-floor maps and (x, y, floor) otherwise,
+    matching the pathfinding Grid built from the map.
+    """
+
+    def __init__(self, width, height, floors, rooms=None, stairs=(), start=None):
+        """Wrap floors of width * height map characters."""
+        self.width = width
+        self.height = height
+        self.floors = floors
+        self.rooms = dict(rooms) if rooms is not None else self._find_rooms()
+        self.stairs = tuple(stairs)  # (x, y, lower floor) of each stairwell
+        self.start = start
+        self._rows = {}
+        self._grid = None
+
+    @classmethod
+    def from_rows(cls, rows, start=None):
+        """Build a single-floor map from rows of map characters."""
+        width = max(len(row) for row in rows)
+        floor = bytearray(b''.join(row.ljust(width, '#').encode('ascii') for row in rows))
+        return cls(width, len(rows), [floor], start=start)
+
+    def _find_rooms(self):
+        """Find the labelled rooms (letter cells) of every floor."""
+        rooms = {}
+        for level, floor in enumerate(self.floors):
+            for match in re.finditer(rb'[A-Z]', floor):
+                y, x = divmod(match.start(), self.width)
+                rooms.setdefault(match.group().decode('ascii'), self.position(x, y, level))
+        return rooms
+
+    def position(self, x, y, floor=0):
+        """Get a position in this map's form."""
+        return (x, y) if len(self.floors) == 1 else (x, y, floor)
+
+    def cell(self, x, y, floor=0):
+        """Get the map character code at a cell."""
+        return self.floors[floor][y * self.width + x]
+
+    def is_walkable(self, x, y, floor=0):
+        """Check whether a cell is inside the map and not a wall."""
+        return (0 <= x < self.width and 0 <= y < self.height and 0 <= floor < len(self.floors)
+                and self.floors[floor][y * self.width + x] != WALL)
+
+    def rows(self, floor=0):
+        """Get the rows of a floor as strings."""
+        rows = self._rows.get(floor)
+        if rows is None:
+            text = self.floors[floor].decode('ascii')
+            rows = self._rows[floor] = [text[y * self.width:(y + 1) * self.width]
+                                        for y in range(self.height)]
+        return rows
+
+    def room_cells(self):
+        """Get the cells of every labelled room, as pathfinding destinations."""
+        return {label: [position] for label, position in self.rooms.items()}
+
+    def grid(self):
+        """Get the pathfinding grid of the map, with stairwells linking floors."""
+        if self._grid is None:
+            walkable = b''.join(bytes(floor) for floor in self.floors)
+            links = [((x, y, floor), (x, y, floor + 1)) for x, y, floor in self.stairs]
+            self._grid = Grid(self.width, self.height, walkable.translate(_WALKABLE),
+                              floors=len(self.floors), links=links)
+        return self._grid
+
+    def unreachable_rooms(self, start=None):
+        """Get the labels of rooms that cannot be reached from start (default: the map start)."""
+        start = start or self.start or next(iter(self.rooms.values()), None)
+        if start is None:
+            return set()
+        components = _RunComponents(self)
+        home = components.find(*self._cell(start))
+        return {label for label, position in self.rooms.items()
+                if components.find(*self._cell(position)) != home}
+
+    def _cell(self, position):
+        """Get (x, y, floor) of a position."""
+        return position if len(position) == 3 else (*position, 0)
+
+
+# Map characters -> non-zero if walkable
+_WALKABLE = bytes(0 if code == WALL else 1 for code in range(256))
+
+
+class _RunComponents:
+    """Connected components of a map's walkable cells, as horizontal runs.
+
+    Runs of consecutive rows are joined where they overlap, and rows that
+    repeat the row above reuse its runs outright (their runs only join
+    their own copies), so corridors and room interiors cost one row each.
+    """
+
+    def __init__(self, school_map):
+        """Find every run and join the overlapping ones."""
+        self.width = school_map.width
+        self.parent = []
+        self.rows = []  # Per floor, per row: (starts, ends, first run id)
+        for floor in school_map.floors:
+            floor_rows = []
+            previous = None
+            previous_bytes = None
+            for y in range(school_map.height):
+                offset = y * self.width
+                row_bytes = floor[offset:offset + self.width]
+                if row_bytes == previous_bytes:
+                    floor_rows.append(previous)
+                    continue
+                spans = [match.span() for match in _RUN.finditer(row_bytes)]
+                first = len(self.parent)
+                self.parent.extend(range(first, first + len(spans)))
+                row = ([start for start, _ in spans], [end for _, end in spans], first)
+                if previous is not None:
+                    self._join_rows(previous, row)
+                floor_rows.append(row)
+                previous, previous_bytes = row, row_bytes
+            self.rows.append(floor_rows)
+        for x, y, floor in school_map.stairs:
+            self._union(self._run(x, y, floor), self._run(x, y, floor + 1))
+
+    def _root(self, run):
+        """Find a run's component (with path halving)."""
+        parent = self.parent
+        while parent[run] != run:
+            parent[run] = parent[parent[run]]
+            run = parent[run]
+        return run
+
+    def _union(self, a, b):
+        """Join two runs' components."""
+        if a is not None and b is not None:
+            self.parent[self._root(a)] = self._root(b)
+
+    def _join_rows(self, upper, lower):
+        """Join the runs of two neighbouring rows where they overlap."""
+        upper_starts, upper_ends, upper_first = upper
+        lower_starts, lower_ends, lower_first = lower
+        parent = self.parent
+        upper_count, lower_count = len(upper_starts), len(lower_starts)
+        i = j = 0
+        while i < upper_count and j < lower_count:
+            upper_end, lower_end = upper_ends[i], lower_ends[j]
+            if upper_starts[i] < lower_end and lower_starts[j] < upper_end:
+                # Union, finding both roots inline: this is the hot loop
+                a = upper_first + i
+                while parent[a] != a:
+                    parent[a] = a = parent[parent[a]]
+                b = lower_first + j
+                while parent[b] != b:
+                    parent[b] = b = parent[parent[b]]
+                parent[a] = b
+            if upper_end < lower_end:
+                i += 1
+            else:
+                j += 1
+
+    def _run(self, x, y, floor):
+        """Get the run holding a cell, or None if it is a wall."""
+        starts, ends, first = self.rows[floor][y]
+        index = bisect_right(starts, x) - 1
+        return first + index if index >= 0 and x < ends[index] else None
+
+    def find(self, x, y, floor=0):
+        """Get the component of a cell, or None if it is a wall."""
+        run = self._run(x, y, floor)
+        return None if run is None else self._root(run)
+
+
+def _cuts(size, rng):
+    """Get the corridor offsets along one axis (the first and last touch the outer wall)."""
+    last = size - 1 - CORRIDOR_WIDTH
+    if last - CORRIDOR_WIDTH - MIN_BLOCK < 1:
+        raise ValueError(f"Maps must be at least {2 * CORRIDOR_WIDTH + MIN_BLOCK + 2} cells across")
+    cuts = [1]
+    while True:
+        cut = cuts[-1] + CORRIDOR_WIDTH + rng.randint(MIN_BLOCK, MAX_BLOCK)
+        if cut > last - CORRIDOR_WIDTH - MIN_BLOCK:
+            break
+        cuts.append(cut)
+    cuts.append(last)
+    return cuts
+
+
+def _corridor_segments(columns, rows, rng):
+    """Pick corridor segments between lattice nodes: the outer ring, a random spanning tree and extras.
+
+    Segments are ('h', i, j) from node (i, j) to (i + 1, j) and ('v', i, j)
+    from node (i, j) to (i, j + 1).
+    """
+    segments = [('h', i, j) for j in range(rows) for i in range(columns - 1)]
+    segments += [('v', i, j) for i in range(columns) for j in range(rows - 1)]
+    rng.shuffle(segments)
+    parent = list(range(columns * rows))
+
+    def root(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    kept = set()
+    for segment in segments:
+        kind, i, j = segment
+        a = j * columns + i
+        b = a + 1 if kind == 'h' else a + columns
+        outer = (j in (0, rows - 1)) if kind == 'h' else (i in (0, columns - 1))
+        root_a, root_b = root(a), root(b)
+        if root_a != root_b:
+            parent[root_a] = root_b
+            kept.add(segment)
+        elif outer or rng.random() < EXTRA_SEGMENT_CHANCE:
+            kept.add(segment)
+    return kept
+
+
+def _carve(floor, width, x0, y0, x1, y1, code=FLOOR):
+    """Set every cell of a rectangle."""
+    fill = bytes([code]) * (x1 - x0)
+    for y in range(y0, y1):
+        floor[y * width + x0:y * width + x1] = fill
+
+
+def _generate_floor(width, height, xcuts, ycuts, rng):
+    """Build one floor; return it and its rooms' interiors as (x0, y0, x1, y1)."""
+    floor = bytearray([WALL]) * (width * height)
+    kept = _corridor_segments(len(xcuts), len(ycuts), rng)
+    for kind, i, j in kept:
+        if kind == 'h':
+            _carve(floor, width, xcuts[i], ycuts[j], xcuts[i + 1] + CORRIDOR_WIDTH, ycuts[j] + CORRIDOR_WIDTH)
+        else:
+            _carve(floor, width, xcuts[i], ycuts[j], xcuts[i] + CORRIDOR_WIDTH, ycuts[j + 1] + CORRIDOR_WIDTH)
+
+    rooms = []
+    for j in range(len(ycuts) - 1):
+        for i in range(len(xcuts) - 1):
+            sides = {
+                'top': ('h', i, j) in kept, 'bottom': ('h', i, j + 1) in kept,
+                'left': ('v', i, j) in kept, 'right': ('v', i + 1, j) in kept,
+            }
+            if not any(sides.values()):
+                # Reopen a corridor so the block can have a door
+                side = rng.choice(sorted(sides))
+                segment = {'top': ('h', i, j), 'bottom': ('h', i, j + 1),
+                           'left': ('v', i, j), 'right': ('v', i + 1, j)}[side]
+                kept.add(segment)
+                kind, si, sj = segment
+                if kind == 'h':
+                    _carve(floor, width, xcuts[si], ycuts[sj], xcuts[si + 1] + CORRIDOR_WIDTH,
+                           ycuts[sj] + CORRIDOR_WIDTH)
+                else:
+                    _carve(floor, width, xcuts[si], ycuts[sj], xcuts[si] + CORRIDOR_WIDTH,
+                           ycuts[sj + 1] + CORRIDOR_WIDTH)
+                sides[side] = True
+            block = (xcuts[i] + CORRIDOR_WIDTH, ycuts[j] + CORRIDOR_WIDTH, xcuts[i + 1], ycuts[j + 1])
+            for room, room_sides in _split_block(block, sides, rng):
+                rooms.append(_build_room(floor, width, room, room_sides, rng))
+    return floor, rooms
+
+
+def _split_block(block, sides, rng):
+    """Yield the rooms of a block (walls included) with the corridor sides each touches."""
+    x0, y0, x1, y1 = block
+    horizontal = x1 - x0 >= y1 - y0
+    low, high = (x0, x1) if horizontal else (y0, y1)
+    first_side, second_side = ('left', 'right') if horizontal else ('top', 'bottom')
+    if high - low - 3 >= 2 * MIN_ROOM and rng.random() < SPLIT_CHANCE:
+        split = rng.randint(low + 1 + MIN_ROOM, high - 2 - MIN_ROOM)  # Shared wall
+        first = {side: open_ for side, open_ in sides.items() if side != second_side}
+        second = {side: open_ for side, open_ in sides.items() if side != first_side}
+        if any(first.values()) and any(second.values()):
+            if horizontal:
+                yield (x0, y0, split + 1, y1), first
+                yield (split, y0, x1, y1), second
+            else:
+                yield (x0, y0, x1, split + 1), first
+                yield (x0, split, x1, y1), second
+            return
+    yield block, sides
+
+
+def _build_room(floor, width, room, sides, rng):
+    """Carve a room's interior and a door on one of its open sides; return the interior."""
+    x0, y0, x1, y1 = room
+    _carve(floor, width, x0 + 1, y0 + 1, x1 - 1, y1 - 1)
+    side = rng.choice(sorted(side for side, open_ in sides.items() if open_))
+    if side in ('top', 'bottom'):
+        door = (rng.randrange(x0 + 1, x1 - 1), y0 if side == 'top' else y1 - 1)
+    else:
+        door = (x0 if side == 'left' else x1 - 1, rng.randrange(y0 + 1, y1 - 1))
+    floor[door[1] * width + door[0]] = FLOOR
+    return x0 + 1, y0 + 1, x1 - 1, y1 - 1
+
+
+def generate_school(width=120, height=60, floors=1, seed=None, labels=DEFAULT_LABELS):
+    """Generate a connected school map; the same seed always gives the same map."""
+    rng = random.Random(seed)
+    xcuts, ycuts = _cuts(width, rng), _cuts(height, rng)
+
+    built = [_generate_floor(width, height, xcuts, ycuts, rng) for _ in range(floors)]
+    levels = [floor for floor, _ in built]
+    interiors = [(level, room) for level, (_, rooms) in enumerate(built) for room in rooms]
+    if len(labels) > len(interiors):
+        raise ValueError(f"Only {len(interiors)} rooms for {len(labels)} labels; use a bigger map")
+
+    school = SchoolMap(width, height, levels, rooms={})
+    for label, (level, (x0, y0, x1, y1)) in zip(labels, rng.sample(interiors, len(labels))):
+        x, y = (x0 + x1) // 2, (y0 + y1) // 2
+        levels[level][y * width + x] = ord(label)
+        school.rooms[label] = school.position(x, y, level)
+
+    # Stairwells sit on corridor crossings, which every floor keeps
+    # (there are at least four); a floor's up stairs avoid the cells its down
+    # stairs take, so small maps with many floors still link every floor
+    nodes = [(x, y) for y in ycuts for x in xcuts]
+    per_floor = min(STAIRWELLS, len(nodes) // 2)
+    stairs = []
+    below = set()
+    for level in range(floors - 1):
+        chosen = rng.sample([node for node in nodes if node not in below], per_floor)
+        for x, y in chosen:
+            levels[level][y * width + x] = STAIRS_UP
+            levels[level + 1][y * width + x] = STAIRS_DOWN
+            stairs.append((x, y, level))
+        below = set(chosen)
+    school.stairs = tuple(stairs)
+
+    # Start next to the middle crossing on the ground floor (never a stairwell cell)
+    start_x, start_y = xcuts[len(xcuts) // 2] + 1, ycuts[len(ycuts) // 2] + 1
+    school.start = school.position(start_x, start_y, 0)
+
+    unreachable = school.unreachable_rooms()
+    if unreachable:
+        raise ValueError(f"Generated map leaves rooms unreachable: {', '.join(sorted(unreachable))}")
+    return school
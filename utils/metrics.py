@@ -0,0 +1,93 @@
+"""
+Lightweight latency metrics for the School Days game.
+Provides a fixed-size log-scale histogram that is cheap to record into,
+merge and export.
+"""
+
+# Each power of two (in microseconds) is split into 4 buckets, so bucket
+# bounds are within 25% of any recorded value; the last bucket holds 470 s+
+NUM_BUCKETS = 112
+
+
+def _bucket_index(microseconds):
+    """Get the bucket for a whole number of microseconds."""
+    if microseconds < 4:
+        return microseconds
+    bits = microseconds.bit_length()
+    index = (bits - 2) * 4 + (microseconds >> (bits - 3)) - 4
+    return index if index < NUM_BUCKETS else NUM_BUCKETS - 1
+
+
+def bucket_upper_bound(index):
+    """Get the exclusive upper bound of a bucket in microseconds."""
+    if index < 4:
+        return index + 1
+    bits = index // 4 + 2
+    return (index % 4 + 5) << (bits - 3)
+
+
+class LatencyHistogram:
+    """Log-scale histogram of durations in seconds."""
+
+    __slots__ = ('buckets', 'count', 'total', 'minimum', 'maximum')
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.buckets = [0] * NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def record(self, seconds):
+        """Record one duration."""
+        self.buckets[_bucket_index(int(seconds * 1e6))] += 1
+        self.count += 1
+        self.total += seconds
+        if self.minimum is None or seconds < self.minimum:
+            self.minimum = seconds
+        if self.maximum is None or seconds > self.maximum:
+            self.maximum = seconds
+
+    def merge(self, other):
+        """Add another histogram's samples into this one."""
+        for i, count in enumerate(other.buckets):
+            self.buckets[i] += count
+        self.count += other.count
+        self.total += other.total
+        if other.minimum is not None and (self.minimum is None or other.minimum < self.minimum):
+            self.minimum = other.minimum
+        if other.maximum is not None and (self.maximum is None or other.maximum > self.maximum):
+            self.maximum = other.maximum
+
+    def mean(self):
+        """Get the mean duration in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent):
+        """Get an upper bound (in seconds) for the given percentile."""
+        if not self.count:
+            return 0.0
+        threshold = self.count * percent / 100
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= threshold and count:
+                return min(bucket_upper_bound(i) / 1e6, self.maximum)
+        return self.maximum
+
+    def summary(self):
+        """Get count, mean and percentiles in milliseconds."""
+        return {
+            'count': self.count,
+            'mean_ms': round(self.mean() * 1000, 3),
+            'min_ms': round((self.minimum or 0.0) * 1000, 3),
+            'p50_ms': round(self.percentile(50) * 1000, 3),
+            'p95_ms': round(self.percentile(95) * 1000, 3),
+            'p99_ms': round(self.percentile(99) * 1000, 3),
+            'max_ms': round((self.maximum or 0.0) * 1000, 3),
+        }
+
+    def to_dict(self):
+        """Export the raw buckets keyed by their upper bound in microseconds."""
+        return {bucket_upper_bound(i): count for i, count in enumerate(self.buckets) if count}
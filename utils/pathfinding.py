@@ -0,0 +1,304 @@
+"""
+Pathfinding over School Days maps.
+Maps are flattened into a byte grid padded with a wall border, so a
+neighbour is one index step away; floors are stacked and joined by links
+(stairwells). Provides BFS and A* paths, BFS distance fields, and all-pairs
+room distance tables that are built once per map and cached.
+"""
+
+import hashlib
+import heapq
+import sys
+from array import array
+from collections import OrderedDict
+
+
+# Distance field values that are not distances
+UNREACHABLE = 0xFFFFFFFF
+WALL = 0xFFFFFFFE
+
+# Room distance tables kept per process, and distance fields kept per table
+MAX_TABLES = 8
+MAX_FIELDS = 16
+
+
+class Grid:
+    """Walkable cells of a map, each floor padded with a one-cell wall border.
+
+    Cells are (x, y) on single-floor grids and (x, y, floor) otherwise.
+    links joins pairs of cells that are one step apart (stairwells).
+    """
+
+    def __init__(self, width, height, walkable, floors=1, links=()):
+        """Wrap row-major walkability bytes, floor after floor (non-zero = walkable)."""
+        if len(walkable) != width * height * floors:
+            raise ValueError(f"Expected {width * height * floors} cells, got {len(walkable)}")
+        self.width = width
+        self.height = height
+        self.floors = floors
+        self.stride = width + 2
+        self.floor_rows = height + 2
+        cells = bytearray(self.stride * self.floor_rows * floors)
+        row_mask = bytes(walkable).translate(bytes([0]) + bytes([1]) * 255)
+        for row in range(height * floors):
+            floor, y = divmod(row, height)
+            start = self.index(0, y, floor)
+            cells[start:start + width] = row_mask[row * width:(row + 1) * width]
+        self.cells = bytes(cells)
+        self.steps = (1, -1, self.stride, -self.stride)
+        self.links = {}  # Index -> indexes linked to it
+        for a, b in links:
+            a, b = self.index(*a), self.index(*b)
+            self.links.setdefault(a, []).append(b)
+            self.links.setdefault(b, []).append(a)
+        self._blank_field = None
+        self._digest = None
+
+    @classmethod
+    def from_rows(cls, rows, walls='#'):
+        """Build a grid from map rows (strings or lists of characters)."""
+        width = max((len(row) for row in rows), default=0)
+        walkable = bytearray(width * len(rows))
+        for y, row in enumerate(rows):
+            for x, cell in enumerate(row):
+                if cell not in walls:
+                    walkable[y * width + x] = 1
+        return cls(width, len(rows), walkable)
+
+    def index(self, x, y, floor=0):
+        """Get the padded flat index of a cell."""
+        return (floor * self.floor_rows + y + 1) * self.stride + x + 1
+
+    def position(self, index):
+        """Get the cell at a padded flat index."""
+        row, x = divmod(index, self.stride)
+        floor, y = divmod(row, self.floor_rows)
+        return (x - 1, y - 1) if self.floors == 1 else (x - 1, y - 1, floor)
+
+    def is_walkable(self, x, y, floor=0):
+        """Check whether a cell is inside the map and walkable."""
+        return (0 <= x < self.width and 0 <= y < self.height and 0 <= floor < self.floors
+                and self.cells[self.index(x, y, floor)] == 1)
+
+    def digest(self):
+        """Get a digest identifying the map layout."""
+        if self._digest is None:
+            header = f"{self.width}x{self.height}x{self.floors}:{sorted(self.links.items())}:"
+            self._digest = hashlib.sha256(header.encode('ascii') + self.cells).digest()
+        return self._digest
+
+    def blank_field(self):
+        """Get a distance field with every walkable cell UNREACHABLE (a fresh copy)."""
+        if self._blank_field is None:
+            # Expand each cell byte to a 4-byte value without a Python-level loop
+            values = self.cells.translate(bytes([ord('W'), ord('U')]) + bytes(254))
+            values = values.replace(b'U', UNREACHABLE.to_bytes(4, sys.byteorder))
+            values = values.replace(b'W', WALL.to_bytes(4, sys.byteorder))
+            self._blank_field = array('I')
+            self._blank_field.frombytes(values)
+        return array('I', self._blank_field)
+
+
+def distance_field(grid, sources, stops=frozenset()):
+    """BFS from every source cell at once, returning steps to the nearest source per cell.
+
+    Cells whose padded index is in stops get a distance but are not walked
+    through (rooms are destinations, not corridors).
+    """
+    field = grid.blank_field()
+    frontier = []
+    for source in sources:
+        index = grid.index(*source)
+        if field[index] == UNREACHABLE:
+            field[index] = 0
+            frontier.append(index)
+    steps = grid.steps
+    links = grid.links
+    distance = 0
+    while frontier:
+        distance += 1
+        next_frontier = []
+        for index in frontier:
+            for step in steps:
+                neighbour = index + step
+                if field[neighbour] == UNREACHABLE:  # Walls hold WALL, so this skips them
+                    field[neighbour] = distance
+                    if neighbour not in stops:
+                        next_frontier.append(neighbour)
+            if links and index in links:
+                for neighbour in links[index]:
+                    if field[neighbour] == UNREACHABLE:
+                        field[neighbour] = distance
+                        if neighbour not in stops:
+                            next_frontier.append(neighbour)
+        frontier = next_frontier
+    return field
+
+
+def path_from_field(grid, field, start, stops=frozenset()):
+    """Follow a distance field downhill from start; return the cells stepped on, or None.
+
+    Only the final step may land on a cell in stops.
+    """
+    index = grid.index(*start)
+    distance = field[index]
+    if distance >= WALL:
+        return None
+    steps = grid.steps
+    links = grid.links
+    path = []
+    while distance:
+        distance -= 1
+        for step in steps:
+            if field[index + step] == distance and (not distance or index + step not in stops):
+                index += step
+                break
+        else:
+            # Only a stairwell leads downhill
+            index = next(neighbour for neighbour in links[index]
+                         if field[neighbour] == distance and (not distance or neighbour not in stops))
+        path.append(grid.position(index))
+    return path
+
+
+def _walk_back(grid, parents, index):
+    """Rebuild a path from a parent map, ending at index."""
+    path = []
+    while parents[index] is not None:
+        path.append(grid.position(index))
+        index = parents[index]
+    path.reverse()
+    return path
+
+
+def bfs_path(grid, start, goal):
+    """Get the cells of a shortest path from start to goal (BFS), or None."""
+    if not (grid.is_walkable(*start) and grid.is_walkable(*goal)):
+        return None
+    start_index, goal_index = grid.index(*start), grid.index(*goal)
+    cells = grid.cells
+    steps, links = grid.steps, grid.links
+    parents = {start_index: None}
+    frontier = [start_index]
+    while frontier and goal_index not in parents:
+        next_frontier = []
+        for index in frontier:
+            for step in steps:
+                neighbour = index + step
+                if cells[neighbour] and neighbour not in parents:
+                    parents[neighbour] = index
+                    next_frontier.append(neighbour)
+            if links and index in links:
+                for neighbour in links[index]:
+                    if cells[neighbour] and neighbour not in parents:
+                        parents[neighbour] = index
+                        next_frontier.append(neighbour)
+        frontier = next_frontier
+    return _walk_back(grid, parents, goal_index) if goal_index in parents else None
+
+
+def astar_path(grid, start, goal):
+    """Get the cells of a shortest path from start to goal (A*, Manhattan heuristic), or None."""
+    if not (grid.is_walkable(*start) and grid.is_walkable(*goal)):
+        return None
+    start_index, goal_index = grid.index(*start), grid.index(*goal)
+    # Manhattan distance on the floor plan stays a lower bound across floors,
+    # because stairwells keep x and y
+    goal_x, goal_y = goal[:2]
+    stride, floor_rows = grid.stride, grid.floor_rows
+    cells = grid.cells
+    steps, links = grid.steps, grid.links
+    parents = {start_index: None}
+    costs = {start_index: 0}
+    heap = [(abs(start[0] - goal_x) + abs(start[1] - goal_y), 0, start_index)]
+    while heap:
+        _, cost, index = heapq.heappop(heap)
+        if index == goal_index:
+            return _walk_back(grid, parents, index)
+        if cost > costs[index]:
+            continue  # Stale heap entry
+        cost += 1
+        neighbours = [index + step for step in steps]
+        if links and index in links:
+            neighbours += links[index]
+        for neighbour in neighbours:
+            if cells[neighbour] and cost < costs.get(neighbour, UNREACHABLE):
+                costs[neighbour] = cost
+                parents[neighbour] = index
+                row, x = divmod(neighbour, stride)
+                estimate = cost + abs(x - 1 - goal_x) + abs(row % floor_rows - 1 - goal_y)
+                heapq.heappush(heap, (estimate, cost, neighbour))
+    return None
+
+
+class RoomDistances:
+    """All-pairs room-to-room distances for one map, with per-room distance fields.
+
+    The table is filled by one BFS per room. Paths never pass through
+    another room. Fields are rebuilt on demand when they have dropped out
+    of the MAX_FIELDS most recently used.
+    """
+
+    def __init__(self, grid, rooms, max_fields=MAX_FIELDS):
+        """Precompute the table for rooms (name -> list of (x, y) cells)."""
+        self.grid = grid
+        self.rooms = {name: tuple(cells) for name, cells in rooms.items()}
+        self.stops = frozenset(grid.index(*cell) for cells in self.rooms.values() for cell in cells)
+        self.max_fields = max_fields
+        self._fields = OrderedDict()
+        self._paths = {}
+        self.table = {}
+        for name in self.rooms:
+            field = self.field(name)
+            self.table[name] = {
+                other: min((field[grid.index(*cell)] for cell in cells), default=UNREACHABLE)
+                for other, cells in self.rooms.items()
+            }
+
+    def field(self, room):
+        """Get the distance field of a room."""
+        field = self._fields.get(room)
+        if field is None:
+            field = self._fields[room] = distance_field(self.grid, self.rooms[room], self.stops)
+            if len(self._fields) > self.max_fields:
+                self._fields.popitem(last=False)
+        else:
+            self._fields.move_to_end(room)
+        return field
+
+    def distance(self, room, other):
+        """Get the steps between two rooms, or None if there is no way through."""
+        distance = self.table[room][other]
+        return None if distance >= WALL else distance
+
+    def path(self, start, room):
+        """Get the cells of a shortest path from a cell to a room, or None."""
+        return path_from_field(self.grid, self.field(room), start, self.stops)
+
+    def room_path(self, room, other):
+        """Get a shortest path between two rooms (cached), or None."""
+        key = (room, other)
+        if key not in self._paths:
+            field = self.field(other)
+            # Leave from the room cell closest to the destination
+            start = min(self.rooms[room], key=lambda cell: field[self.grid.index(*cell)], default=None)
+            path = None if start is None else path_from_field(self.grid, field, start, self.stops)
+            self._paths[key] = None if path is None else (start,) + tuple(path)
+        return self._paths[key]
+
+
+# Process-wide tables: (map digest, rooms) -> RoomDistances
+_tables = OrderedDict()
+
+
+def get_room_distances(grid, rooms):
+    """Get the shared room distance table for a map, building it the first time."""
+    key = (grid.digest(), tuple(sorted((name, tuple(cells)) for name, cells in rooms.items())))
+    table = _tables.get(key)
+    if table is None:
+        table = _tables[key] = RoomDistances(grid, rooms)
+        if len(_tables) > MAX_TABLES:
+            _tables.popitem(last=False)
+    else:
+        _tables.move_to_end(key)
+    return table
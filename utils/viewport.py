@@ -0,0 +1,111 @@
+"""
+Scrolling map viewport for the hallway.
+Shows the window of a map around the player, cut from cached row strings,
+with other markers (students) on top. While the window stays put, a move
+is drawn by rewriting just the changed cells with cursor-addressing
+escape codes.
+"""
+
+
+# Visible window, in cells
+VIEW_WIDTH = 60
+VIEW_HEIGHT = 20
+
+# The window scrolls when the player comes this close to its edge
+SCROLL_MARGIN = 4
+
+# Save and restore the terminal cursor around cell updates
+SAVE_CURSOR = '\0337'
+RESTORE_CURSOR = '\0338'
+
+
+def _scroll(origin, position, size, map_size):
+    """Get the window start along one axis, recentring when position nears an edge."""
+    size = min(size, map_size)
+    margin = min(SCROLL_MARGIN, (size - 1) // 2)
+    if origin is None or not origin + margin <= position <= origin + size - 1 - margin:
+        origin = position - size // 2
+    return max(0, min(origin, map_size - size))
+
+
+class Viewport:
+    """The visible window of a map, with the player marker drawn in it.
+
+    top and left are the 1-based screen row and column of the window's
+    first cell; lines() records what is on screen so patch() can update it.
+    """
+
+    def __init__(self, width=VIEW_WIDTH, height=VIEW_HEIGHT, marker='*'):
+        """Initialize an empty viewport."""
+        self.width = width
+        self.height = height
+        self.marker = marker
+        self.top = 1
+        self.left = 1
+        self.origin = None
+        self._rows = None  # Rows on screen (a floor's cached row strings)
+        self._player = None
+        self._others = {}
+
+    def window(self, rows, x, y):
+        """Get the (x0, y0, x1, y1) cells of the window around the player."""
+        x0, y0 = self.origin or (None, None)
+        map_width = len(rows[0]) if rows else 0
+        x0 = _scroll(x0, x, self.width, map_width)
+        y0 = _scroll(y0, y, self.height, len(rows))
+        return x0, y0, x0 + min(self.width, map_width), y0 + min(self.height, len(rows))
+
+    def lines(self, rows, x, y, others=None):
+        """Get the visible lines with the player marker, and remember them as on screen.
+
+        others maps more (x, y) cells to the marker drawn on them.
+        """
+        x0, y0, x1, y1 = self.window(rows, x, y)
+        lines = [row[x0:x1] for row in rows[y0:y1]]
+        others = {cell: mark for cell, mark in (others or {}).items()
+                  if x0 <= cell[0] < x1 and y0 <= cell[1] < y1}
+        for (other_x, other_y), mark in others.items():
+            line = lines[other_y - y0]
+            lines[other_y - y0] = line[:other_x - x0] + mark + line[other_x - x0 + 1:]
+        line = lines[y - y0]
+        lines[y - y0] = line[:x - x0] + self.marker + line[x - x0 + 1:]
+        self.origin = (x0, y0)
+        self._rows = rows
+        self._player = (x, y)
+        self._others = others
+        return lines
+
+    def patch(self, rows, x, y, others=None):
+        """Get the escape codes that update the markers on screen, or None if a full redraw is needed."""
+        if rows is not self._rows or self.window(rows, x, y)[:2] != self.origin:
+            return None
+        others = others or {}
+        updates = {}
+        for cell, mark in self._others.items():
+            if others.get(cell) != mark:
+                updates[cell] = rows[cell[1]][cell[0]]
+        for cell, mark in others.items():
+            if self._others.get(cell) != mark:
+                updates[cell] = mark
+        if (x, y) != self._player:
+            old_x, old_y = self._player
+            updates[self._player] = others.get(self._player, rows[old_y][old_x])
+            updates[(x, y)] = self.marker
+        if not updates:
+            return ''
+        self._player = (x, y)
+        self._others = others
+        parts = [SAVE_CURSOR]
+        for (cell_x, cell_y), mark in updates.items():
+            parts.append(f"{self._cursor(cell_x, cell_y)}{mark}")
+        parts.append(RESTORE_CURSOR)
+        return ''.join(parts)
+
+    def invalidate(self):
+        """Forget what is on screen, so the next patch() asks for a full redraw."""
+        self._rows = None
+
+    def _cursor(self, x, y):
+        """Get the escape code that moves the cursor to a map cell."""
+        x0, y0 = self.origin
+        return f"\033[{self.top + y - y0};{self.left + x - x0}H"
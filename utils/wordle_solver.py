@@ -0,0 +1,186 @@
+"""
+Optimal-play Wordle solver and difficulty rater for the word puzzle.
+Picks the guess that maximizes the information (entropy) of the feedback
+at each step and rates every word by how many guesses the solver needs.
+
+Feedback comes from the precomputed matrix (utils.feedback_cache), so it
+matches get_word_hints exactly. Candidate sets are narrowed incrementally
+by splitting the current set on one matrix row, and the best guess for
+each candidate set is memoized, so the opening move and the whole
+decision tree under it are computed once per process.
+
+Usage:
+    python -m utils.wordle_solver            rate the whole word list
+    python -m utils.wordle_solver CRANE      show how the solver finds a word
+"""
+
+import math
+from collections import Counter
+from operator import itemgetter
+
+from utils.feedback_cache import get_feedback_cache, MAX_CACHED_LENGTH
+from utils.hint_engine import feedback_matrix
+from utils.wordlist import DEFAULT_WORD_FILE, get_word_index
+
+
+# Guesses allowed by the word puzzle
+MAX_GUESSES = 6
+
+# Difficulty by number of solver guesses (anything above is 'hard')
+DIFFICULTY_BANDS = ((2, 'easy'), (3, 'medium'))
+
+
+def difficulty(guesses):
+    """Get the difficulty label for a solver guess count."""
+    for limit, label in DIFFICULTY_BANDS:
+        if guesses <= limit:
+            return label
+    return 'hard'
+
+
+class WordleSolver:
+    """Entropy-maximizing solver over one word list (guesses = answers)."""
+
+    def __init__(self, words, codes):
+        """Initialize from the words and a flat row-major feedback matrix."""
+        self.words = tuple(words)
+        self.index = {word: i for i, word in enumerate(self.words)}
+        size = len(self.words)
+        self._rows = [codes[i * size:(i + 1) * size] for i in range(size)]
+        self.solved_code = 3 ** len(self.words[0]) - 1 if self.words else 0
+        self._all = tuple(range(size))
+        # sum(c * log2(c)) over bucket sizes ranks guesses like entropy does
+        self._weight = [0.0] + [count * math.log2(count) for count in range(1, size + 1)]
+        self._best = {}  # candidate tuple -> guess index
+
+    @classmethod
+    def for_word_file(cls, filename=DEFAULT_WORD_FILE, length=5):
+        """Build a solver for the words of one length in a word file."""
+        if length <= MAX_CACHED_LENGTH:
+            cache = get_feedback_cache(filename, length)
+            return cls(cache.words, cache.codes)
+        matrix = feedback_matrix(get_word_index(filename).by_length(length))
+        return cls(matrix.answers, matrix.codes)
+
+    def partition(self, guess, candidates):
+        """Split candidate indexes by the feedback code a guess would get."""
+        row = self._rows[guess]
+        buckets = {}
+        for candidate in candidates:
+            buckets.setdefault(row[candidate], []).append(candidate)
+        return {code: tuple(bucket) for code, bucket in buckets.items()}
+
+    def best_guess(self, candidates):
+        """Get the index of the guess with the most informative feedback."""
+        best = self._best.get(candidates)
+        if best is not None:
+            return best
+        if len(candidates) <= 2:
+            best = candidates[0]
+        else:
+            getter = itemgetter(*candidates)
+            weight = self._weight
+            in_play = set(candidates)
+            best_score = None
+            for guess, row in enumerate(self._rows):
+                counts = Counter(getter(row)).values()
+                if len(counts) == 1:
+                    continue  # Learns nothing
+                # Lower is better; ties go to guesses that could be the answer
+                score = (sum(weight[count] for count in counts), guess not in in_play)
+                if best_score is None or score < best_score:
+                    best_score = score
+                    best = guess
+            if best is None:
+                best = candidates[0]
+        self._best[candidates] = best
+        return best
+
+    def opening_guess(self):
+        """Get the best first guess for the whole list."""
+        return self.words[self.best_guess(self._all)]
+
+    def filter_candidates(self, candidates, guess, code):
+        """Keep the candidate indexes consistent with one guess and its feedback."""
+        row = self._rows[self.index[guess]]
+        return tuple(candidate for candidate in candidates if row[candidate] == code)
+
+    def solve(self, target):
+        """Get the guesses the solver makes to find a target word."""
+        target_index = self.index[target.upper()]
+        candidates = self._all
+        guesses = []
+        while True:
+            guess = self.best_guess(candidates)
+            guesses.append(self.words[guess])
+            code = self._rows[guess][target_index]
+            if code == self.solved_code:
+                return guesses
+            candidates = self.partition(guess, candidates)[code]
+
+    def rate_words(self):
+        """Get the number of guesses the solver needs for every word."""
+        ratings = {}
+        stack = [(self._all, 1)]
+        while stack:
+            candidates, depth = stack.pop()
+            guess = self.best_guess(candidates)
+            for code, bucket in self.partition(guess, candidates).items():
+                if code == self.solved_code:
+                    ratings[self.words[guess]] = depth
+                else:
+                    stack.append((bucket, depth + 1))
+        return {word: ratings[word] for word in self.words}
+
+    def evaluate(self):
+        """Rate the whole list and summarize average and worst-case guess counts."""
+        ratings = self.rate_words()
+        counts = list(ratings.values())
+        worst = max(counts) if counts else 0
+        return {
+            'words': len(counts),
+            'opening': self.opening_guess() if counts else None,
+            'average': round(sum(counts) / len(counts), 3) if counts else 0.0,
+            'worst': worst,
+            'distribution': dict(sorted(Counter(counts).items())),
+            'failures': sorted(word for word, guesses in ratings.items() if guesses > MAX_GUESSES),
+            'hardest': sorted(word for word, guesses in ratings.items() if guesses == worst),
+            'ratings': ratings,
+        }
+
+
+def format_evaluation(report):
+    """Format a solver evaluation for display."""
+    lines = [
+        f"Words: {report['words']}",
+        f"Opening guess: {report['opening']}",
+        f"Average guesses: {report['average']}",
+        f"Worst case: {report['worst']} ({', '.join(report['hardest'])})",
+        f"Unsolved within {MAX_GUESSES}: {len(report['failures'])}",
+        "Distribution:",
+    ]
+    total = report['words'] or 1
+    for guesses, count in report['distribution'].items():
+        lines.append(f"  {guesses}: {count:>5}  {'#' * round(count / total * 50)}  ({difficulty(guesses)})")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    solver = WordleSolver.for_word_file()
+    if len(sys.argv) > 1:
+        word = sys.argv[1].upper()
+        if word not in solver.index:
+            print(f"{word} is not in the word list")
+            sys.exit(1)
+        guesses = solver.solve(word)
+        print(" -> ".join(guesses))
+        print(f"Solved in {len(guesses)} ({difficulty(len(guesses))})")
+    else:
+        start = time.perf_counter()
+        report = solver.evaluate()
+        elapsed = time.perf_counter() - start
+        print(format_evaluation(report))
+        print(f"\nEvaluated in {elapsed:.2f} s")
@@ -3,74 +3,385 @@ Word list utilities for word-based mini-games.
 Loads and manages the word list for the Wordle-style game.
 """
 
+import bz2
+import gzip
+import heapq
+import lzma
 import os
 import random
+import string
 
 
-def load_words(filename='data/words.txt'):
-    """Load words from the word list file."""
-    try:
-        # Get the path relative to the project root
-        current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        filepath = os.path.join(current_dir, filename)
+DEFAULT_WORD_FILE = 'data/words.txt'
+
+# Letters accepted by the streaming loader
+DEFAULT_ALPHABET = string.ascii_uppercase
+
+# The streaming loader reads this many bytes at a time and sorts and
+# deduplicates this many words at a time
+STREAM_BLOCK_SIZE = 1 << 20
+STREAM_CHUNK_WORDS = 65536
+
+# Bytes that separate words (what bytes.split() splits on)
+_WHITESPACE = b' \t\n\r\x0b\x0c'
+
+# Compressed word files are recognized by their leading bytes
+_COMPRESSED_OPENERS = (
+    (b'\x1f\x8b', gzip.open),
+    (b'BZh', bz2.open),
+    (b'\xfd7zXZ\x00', lzma.open),
+)
+
+# Fallback word list if the word file is not found
+FALLBACK_WORDS = (
+    "ABOUT", "ABOVE", "ABUSE", "ACTOR", "ACUTE", "ADMIT", "ADOPT", "ADULT",
+    "AFTER", "AGAIN", "AGENT", "AGREE", "AHEAD", "ALARM", "ALBUM", "ALERT",
+    "ALIKE", "ALIVE", "ALLOW", "ALONE", "ALONG", "ALTER", "ANGER", "APPLE",
+    "APPLY", "ARENA", "AVOID", "BASIC", "BEACH", "BEGAN", "BEING", "BLACK",
+    "BLANK", "BRAIN", "BRAVE", "BREAD", "BREAK", "BRING", "BUILD", "CHAIR",
+    "CHARM", "CHASE", "CHEAP", "CHECK", "CHEST", "CHIEF", "CHILD", "CLAIM",
+    "CLASS", "CLEAN", "CLEAR", "CLIMB", "CLOCK", "CLOSE", "COACH", "COULD",
+    "COUNT", "COVER", "CREAM", "CRIME", "DANCE", "DEATH", "DELAY", "DREAM",
+    "DRESS", "DRINK", "DRIVE", "EARTH", "EIGHT", "EMPTY", "ENJOY", "ENTER",
+    "EQUAL", "ERROR", "EVENT", "EXACT", "FAITH", "FALSE", "FIELD", "FIGHT",
+    "FINAL", "FIRST", "FLASH", "FOCUS", "FORCE", "FOUND", "FRAME", "FRESH",
+    "FRUIT", "GIVEN", "GLASS", "GOING", "GRACE", "GRADE", "GRAND", "GRANT",
+    "GRASS", "GREAT", "GREEN", "GROUP", "GUARD", "GUESS", "GUEST", "GUIDE",
+    "HAPPY", "HEART", "HEAVY", "HORSE", "HOTEL", "HOUSE", "HUMAN", "IMAGE",
+    "JAPAN", "JUDGE", "KNOWN", "LARGE", "LASER", "LATER", "LAUGH", "LEARN",
+    "LEAST", "LEAVE", "LEGAL", "LEVEL", "LIGHT", "LIMIT", "LINKS", "LIVED",
+    "LOCAL", "LOGIC", "LOWER", "LUCKY", "MAGIC", "MAJOR", "MARCH", "MATCH",
+    "MAYBE", "MAYOR", "MEANT", "MEDIA", "METAL", "MIGHT", "MINOR", "MIXED",
+    "MODEL", "MONEY", "MONTH", "MORAL", "MOTOR", "MOUNT", "MOVED", "MOVIE",
+    "MUSIC", "NEVER", "NEWLY", "NIGHT", "NOISE", "NORTH", "NOTED", "NOVEL",
+    "NURSE", "OCCUR", "OCEAN", "OFFER", "OFTEN", "ORDER", "OTHER", "OUGHT",
+    "OWNED", "OWNER", "PAINT", "PANEL", "PAPER", "PARTY", "PEACE", "PHASE",
+    "PHONE", "PHOTO", "PIECE", "PILOT", "PLACE", "PLAIN", "PLANE", "PLANT",
+    "PLATE", "POINT", "POUND", "POWER", "PRESS", "PRICE", "PRIDE", "PRIME",
+    "PRINT", "PRIOR", "PROOF", "PROUD", "PROVE", "QUEEN", "QUICK", "QUIET",
+    "QUITE", "RADIO", "RAISE", "RANGE", "RAPID", "REACH", "READY", "RIGHT",
+    "RIVER", "ROUGH", "ROUND", "ROUTE", "ROYAL", "RURAL", "SCALE", "SCENE",
+    "SCOPE", "SCORE", "SENSE", "SERVE", "SEVEN", "SHALL", "SHAPE", "SHARE",
+    "SHARP", "SHEET", "SHIFT", "SHINE", "SHIRT", "SHOOT", "SHORT", "SHOWN",
+    "SIGHT", "SINCE", "SIXTH", "SIZED", "SKILL", "SLEEP", "SLIDE", "SMALL",
+    "SMART", "SMILE", "SMOKE", "SOLID", "SOLVE", "SORRY", "SOUND", "SOUTH",
+    "SPACE", "SPARE", "SPEAK", "SPEED", "SPEND", "SPENT", "SPLIT", "SPORT",
+    "STAFF", "STAGE", "STAND", "START", "STATE", "STEAM", "STEEL", "STILL",
+    "STOCK", "STONE", "STORE", "STORM", "STORY", "STUCK", "STUDY", "STUFF",
+    "STYLE", "SUGAR", "SWEET", "TABLE", "TAKEN", "TEACH", "TERMS", "TEXAS",
+    "THANK", "THEIR", "THEME", "THERE", "THESE", "THICK", "THING", "THINK",
+    "THIRD", "THOSE", "THREE", "THROW", "TIGHT", "TIMES", "TIRED", "TITLE",
+    "TODAY", "TOPIC", "TOTAL", "TOUCH", "TOUGH", "TOWER", "TRACK", "TRADE",
+    "TRAIN", "TREAT", "TRIAL", "TRIED", "TRUCK", "TRULY", "TRUST", "TRUTH",
+    "TWICE", "UNCLE", "UNDER", "UNION", "UNITY", "UNTIL", "UPPER", "URBAN",
+    "USUAL", "VALID", "VALUE", "VIDEO", "VISIT", "VITAL", "VOICE", "WASTE",
+    "WATCH", "WATER", "WHEEL", "WHERE", "WHICH", "WHILE", "WHITE", "WHOLE",
+    "WOMAN", "WORLD", "WORRY", "WORSE", "WORST", "WORTH", "WOULD", "WRITE",
+    "WRONG", "YIELD", "YOUNG", "YOUTH"
+)
+
+
+class WordIndex:
+    """Read-only index over a word list.
+    
+    Membership checks use a frozenset, random picks slice a packed byte
+    string of same-length words, and per-length and per-letter-position
+    indexes are built on first use.
+    """
+    
+    def __init__(self, words):
+        """Build the index from an iterable of words (deduplicated, uppercased)."""
+        self.words = tuple(dict.fromkeys(word.upper() for word in words))
+        self.word_set = frozenset(self.words)
+        self._by_length = None
+        self._by_position = None
         
-        with open(filepath, 'r') as f:
-            words = [line.strip().upper() for line in f if line.strip()]
-        return words
+        # Words of one length are packed back to back for random selection
+        lengths = {len(word) for word in self.words}
+        if len(lengths) == 1 and all(word.isascii() for word in self.words):
+            self.width = lengths.pop()
+            self.packed = ''.join(self.words).encode('ascii')
+        else:
+            self.width = None
+            self.packed = None
+    
+    def __contains__(self, word):
+        """Check whether a word is in the list."""
+        return word in self.word_set
+    
+    def __len__(self):
+        """Get the number of words."""
+        return len(self.words)
+    
+    def __iter__(self):
+        """Iterate over the words in file order."""
+        return iter(self.words)
+    
+    def random_word(self, rng=random):
+        """Pick a random word."""
+        if self.packed is None:
+            return rng.choice(self.words)
+        start = rng.randrange(len(self.words)) * self.width
+        return self.packed[start:start + self.width].decode('ascii')
+    
+    def by_length(self, length):
+        """Get all words of the given length."""
+        if self._by_length is None:
+            groups = {}
+            for word in self.words:
+                groups.setdefault(len(word), []).append(word)
+            self._by_length = {size: tuple(group) for size, group in groups.items()}
+        return self._by_length.get(length, ())
+    
+    def with_letter_at(self, position, letter):
+        """Get the words that have the given letter at the given position."""
+        if self._by_position is None:
+            groups = {}
+            for word in self.words:
+                for i, char in enumerate(word):
+                    groups.setdefault((i, char), []).append(word)
+            self._by_position = {key: frozenset(group) for key, group in groups.items()}
+        return self._by_position.get((position, letter.upper()), frozenset())
+
+
+# Process-wide cache: absolute path -> (mtime_ns, WordIndex)
+_index_cache = {}
+
+
+def _resolve_path(filename):
+    """Get the path of a word file relative to the project root."""
+    current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(current_dir, filename)
+
+
+def get_word_index(filename=DEFAULT_WORD_FILE):
+    """Get the shared WordIndex for a word file, reloading it if the file changed."""
+    filepath = _resolve_path(filename)
+    try:
+        mtime = os.stat(filepath).st_mtime_ns
     except FileNotFoundError:
-        # Fallback word list if file not found
-        return [
-            "ABOUT", "ABOVE", "ABUSE", "ACTOR", "ACUTE", "ADMIT", "ADOPT", "ADULT",
-            "AFTER", "AGAIN", "AGENT", "AGREE", "AHEAD", "ALARM", "ALBUM", "ALERT",
-            "ALIKE", "ALIVE", "ALLOW", "ALONE", "ALONG", "ALTER", "ANGER", "APPLE",
-            "APPLY", "ARENA", "AVOID", "BASIC", "BEACH", "BEGAN", "BEING", "BLACK",
-            "BLANK", "BRAIN", "BRAVE", "BREAD", "BREAK", "BRING", "BUILD", "CHAIR",
-            "CHARM", "CHASE", "CHEAP", "CHECK", "CHEST", "CHIEF", "CHILD", "CLAIM",
-            "CLASS", "CLEAN", "CLEAR", "CLIMB", "CLOCK", "CLOSE", "COACH", "COULD",
-            "COUNT", "COVER", "CREAM", "CRIME", "DANCE", "DEATH", "DELAY", "DREAM",
-            "DRESS", "DRINK", "DRIVE", "EARTH", "EIGHT", "EMPTY", "ENJOY", "ENTER",
-            "EQUAL", "ERROR", "EVENT", "EXACT", "FAITH", "FALSE", "FIELD", "FIGHT",
-            "FINAL", "FIRST", "FLASH", "FOCUS", "FORCE", "FOUND", "FRAME", "FRESH",
-            "FRUIT", "GIVEN", "GLASS", "GOING", "GRACE", "GRADE", "GRAND", "GRANT",
-            "GRASS", "GREAT", "GREEN", "GROUP", "GUARD", "GUESS", "GUEST", "GUIDE",
-            "HAPPY", "HEART", "HEAVY", "HORSE", "HOTEL", "HOUSE", "HUMAN", "IMAGE",
-            "JAPAN", "JUDGE", "KNOWN", "LARGE", "LASER", "LATER", "LAUGH", "LEARN",
-            "LEAST", "LEAVE", "LEGAL", "LEVEL", "LIGHT", "LIMIT", "LINKS", "LIVED",
-            "LOCAL", "LOGIC", "LOWER", "LUCKY", "MAGIC", "MAJOR", "MARCH", "MATCH",
-            "MAYBE", "MAYOR", "MEANT", "MEDIA", "METAL", "MIGHT", "MINOR", "MIXED",
-            "MODEL", "MONEY", "MONTH", "MORAL", "MOTOR", "MOUNT", "MOVED", "MOVIE",
-            "MUSIC", "NEVER", "NEWLY", "NIGHT", "NOISE", "NORTH", "NOTED", "NOVEL",
-            "NURSE", "OCCUR", "OCEAN", "OFFER", "OFTEN", "ORDER", "OTHER", "OUGHT",
-            "OWNED", "OWNER", "PAINT", "PANEL", "PAPER", "PARTY", "PEACE", "PHASE",
-            "PHONE", "PHOTO", "PIECE", "PILOT", "PLACE", "PLAIN", "PLANE", "PLANT",
-            "PLATE", "POINT", "POUND", "POWER", "PRESS", "PRICE", "PRIDE", "PRIME",
-            "PRINT", "PRIOR", "PROOF", "PROUD", "PROVE", "QUEEN", "QUICK", "QUIET",
-            "QUITE", "RADIO", "RAISE", "RANGE", "RAPID", "REACH", "READY", "RIGHT",
-            "RIVER", "ROUGH", "ROUND", "ROUTE", "ROYAL", "RURAL", "SCALE", "SCENE",
-            "SCOPE", "SCORE", "SENSE", "SERVE", "SEVEN", "SHALL", "SHAPE", "SHARE",
-            "SHARP", "SHEET", "SHIFT", "SHINE", "SHIRT", "SHOOT", "SHORT", "SHOWN",
-            "SIGHT", "SINCE", "SIXTH", "SIZED", "SKILL", "SLEEP", "SLIDE", "SMALL",
-            "SMART", "SMILE", "SMOKE", "SOLID", "SOLVE", "SORRY", "SOUND", "SOUTH",
-            "SPACE", "SPARE", "SPEAK", "SPEED", "SPEND", "SPENT", "SPLIT", "SPORT",
-            "STAFF", "STAGE", "STAND", "START", "STATE", "STEAM", "STEEL", "STILL",
-            "STOCK", "STONE", "STORE", "STORM", "STORY", "STUCK", "STUDY", "STUFF",
-            "STYLE", "SUGAR", "SWEET", "TABLE", "TAKEN", "TEACH", "TERMS", "TEXAS",
-            "THANK", "THEIR", "THEME", "THERE", "THESE", "THICK", "THING", "THINK",
-            "THIRD", "THOSE", "THREE", "THROW", "TIGHT", "TIMES", "TIRED", "TITLE",
-            "TODAY", "TOPIC", "TOTAL", "TOUCH", "TOUGH", "TOWER", "TRACK", "TRADE",
-            "TRAIN", "TREAT", "TRIAL", "TRIED", "TRUCK", "TRULY", "TRUST", "TRUTH",
-            "TWICE", "UNCLE", "UNDER", "UNION", "UNITY", "UNTIL", "UPPER", "URBAN",
-            "USUAL", "VALID", "VALUE", "VIDEO", "VISIT", "VITAL", "VOICE", "WASTE",
-            "WATCH", "WATER", "WHEEL", "WHERE", "WHICH", "WHILE", "WHITE", "WHOLE",
-            "WOMAN", "WORLD", "WORRY", "WORSE", "WORST", "WORTH", "WOULD", "WRITE",
-            "WRONG", "YIELD", "YOUNG", "YOUTH"
-        ]
+        mtime = None
+    
+    cached = _index_cache.get(filepath)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    if mtime is None:
+        index = WordIndex(FALLBACK_WORDS)
+    else:
+        with open(filepath, 'r') as f:
+            index = WordIndex(line.strip() for line in f if line.strip())
+    _index_cache[filepath] = (mtime, index)
+    return index
+
+
+def _open_word_file(filepath):
+    """Open a plain, gzip, bzip2 or xz word file for binary line reading."""
+    with open(filepath, 'rb') as f:
+        magic = f.read(6)
+    for prefix, opener in _COMPRESSED_OPENERS:
+        if magic.startswith(prefix):
+            return opener(filepath, 'rb')
+    return open(filepath, 'rb')
+
+
+def stream_words(filename, lengths=None, alphabet=DEFAULT_ALPHABET):
+    """
+    Yield uppercase words (as ASCII bytes) from a (possibly compressed) word
+    file, reading it in fixed-size blocks. Words are whitespace-separated;
+    those whose length is not in lengths or that use letters outside the
+    alphabet are skipped, as is any run of text longer than a block.
+    Duplicates are not removed here.
+    """
+    lengths = None if lengths is None else frozenset(lengths)
+    letters = alphabet.upper().encode('ascii')
+    tail = b''
+    skipping = False  # Inside a run too long to be a word
+    with _open_word_file(_resolve_path(filename)) as f:
+        while True:
+            block = f.read(STREAM_BLOCK_SIZE)
+            if not block:
+                break
+            if skipping:
+                start = min((i for i in map(block.find, _WHITESPACE) if i >= 0), default=-1)
+                if start < 0:
+                    continue
+                block, skipping = block[start + 1:], False
+            block = tail + block.upper()
+            # Keep a word cut at the block boundary for the next block
+            cut = max(map(block.rfind, _WHITESPACE))
+            tail = block[cut + 1:]
+            if len(tail) > STREAM_BLOCK_SIZE:
+                tail, skipping = b'', True
+            for word in block[:cut + 1].split():
+                if (lengths is None or len(word) in lengths) and not word.translate(None, letters):
+                    yield word
+        for word in tail.split():
+            if (lengths is None or len(word) in lengths) and not word.translate(None, letters):
+                yield word
+
+
+def _flush_chunks(pending, runs):
+    """Turn every pending chunk of words into a packed sorted run."""
+    for length, chunk in pending.items():
+        if chunk:
+            runs.setdefault(length, []).append(b''.join(sorted(set(chunk))))
+            chunk.clear()
+
+
+def _iter_packed(data, length):
+    """Iterate over the fixed-width words in a packed byte string."""
+    for start in range(0, len(data), length):
+        yield data[start:start + length]
+
+
+class PackedWordList:
+    """Sorted, unique words of one length packed back to back in bytes.
+    
+    Uses one byte per letter and no per-word objects; membership is a binary
+    search over the packed words.
+    """
+    
+    __slots__ = ('length', 'data')
+    
+    def __init__(self, length, data):
+        """Wrap packed, sorted, unique words."""
+        self.length = length
+        self.data = bytes(data)
+    
+    def __len__(self):
+        """Get the number of words."""
+        return len(self.data) // self.length
+    
+    def __getitem__(self, index):
+        """Get the word at an index (in sorted order)."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index out of range")
+        start = index * self.length
+        return self.data[start:start + self.length].decode('ascii')
+    
+    def __iter__(self):
+        """Iterate over the words in sorted order."""
+        for word in _iter_packed(self.data, self.length):
+            yield word.decode('ascii')
+    
+    def __contains__(self, word):
+        """Check whether a word is in the list."""
+        if len(word) != self.length:
+            return False
+        try:
+            key = word.upper().encode('ascii')
+        except UnicodeEncodeError:
+            return False
+        data = self.data
+        length = self.length
+        low, high = 0, len(data) // length
+        while low < high:
+            middle = (low + high) // 2
+            start = middle * length
+            candidate = data[start:start + length]
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return True
+        return False
+    
+    def random_word(self, rng=random):
+        """Pick a random word."""
+        return self[rng.randrange(len(self))]
+
+
+class PackedWordIndex:
+    """Per-length PackedWordLists built by load_packed_words."""
+    
+    def __init__(self, lists):
+        """Wrap a mapping of word length -> PackedWordList."""
+        self.lists = dict(sorted(lists.items()))
+    
+    def __contains__(self, word):
+        """Check whether a word is in any of the lists."""
+        words = self.lists.get(len(word))
+        return words is not None and word in words
+    
+    def __len__(self):
+        """Get the total number of words."""
+        return sum(len(words) for words in self.lists.values())
+    
+    def lengths(self):
+        """Get the word lengths that have at least one word."""
+        return [length for length, words in self.lists.items() if len(words)]
+    
+    def by_length(self, length):
+        """Get the words of the given length."""
+        return self.lists.get(length) or PackedWordList(length, b'')
+    
+    def random_word(self, rng=random, length=None):
+        """Pick a random word, optionally of a given length."""
+        if length is None:
+            # Weight each length by its number of words
+            index = rng.randrange(len(self))
+            for words in self.lists.values():
+                if index < len(words):
+                    return words[index]
+                index -= len(words)
+        return self.by_length(length).random_word(rng)
+
+
+def _merge_runs(runs, length):
+    """Merge packed sorted runs into one packed, deduplicated byte string."""
+    if len(runs) == 1:
+        return runs[0]
+    merged = bytearray()
+    previous = None
+    for word in heapq.merge(*(_iter_packed(run, length) for run in runs)):
+        if word != previous:
+            merged += word
+            previous = word
+    return merged
+
+
+def load_packed_words(filename, lengths=None, alphabet=DEFAULT_ALPHABET, chunk_words=STREAM_CHUNK_WORDS):
+    """
+    Stream a large (possibly compressed) word file into compact per-length indexes.
+    Words are read in fixed-size blocks and sorted and deduplicated in chunks of
+    chunk_words, so working memory is the packed result (one byte per letter)
+    plus one chunk, however large the file is.
+    """
+    pending = {}  # length -> encoded words not yet sorted
+    pending_count = 0
+    runs = {}  # length -> packed sorted runs
+    for word in stream_words(filename, lengths, alphabet):
+        chunk = pending.get(len(word))
+        if chunk is None:
+            chunk = pending[len(word)] = []
+        chunk.append(word)
+        pending_count += 1
+        if pending_count >= chunk_words:
+            _flush_chunks(pending, runs)
+            pending_count = 0
+    _flush_chunks(pending, runs)
+    
+    return PackedWordIndex({
+        length: PackedWordList(length, _merge_runs(length_runs, length))
+        for length, length_runs in runs.items()
+    })
+
+
+def load_words(filename=DEFAULT_WORD_FILE):
+    """Load words from the word list file."""
+    return list(get_word_index(filename).words)
 
 
 def get_random_word(words=None):
     """Get a random word from the word list."""
     if words is None:
-        words = load_words()
+        return get_word_index().random_word()
+    if isinstance(words, WordIndex):
+        return words.random_word()
     return random.choice(words)
 
 
@@ -105,6 +416,21 @@ def get_word_hints(target_word, guess):
     return hints
 
 
+def lookup_hints(target_word, guess, filename=DEFAULT_WORD_FILE):
+    """
+    Get hints for a guess from the precomputed feedback cache in O(1).
+    Falls back to get_word_hints for words that are not in the word list.
+    """
+    # Import moved here to avoid circular import issues
+    from utils.feedback_cache import get_feedback_cache, MAX_CACHED_LENGTH
+    
+    if len(guess) == len(target_word) <= MAX_CACHED_LENGTH:
+        hints = get_feedback_cache(filename, len(guess)).hints(guess, target_word)
+        if hints is not None:
+            return hints
+    return get_word_hints(target_word, guess)
+
+
 def format_guess_with_hints(guess, hints):
     """Format a guess with color hints for display."""
     # Import moved here to avoid circular import issues